@@ -0,0 +1,33 @@
+"""add movie_genres genre_id index
+
+Revision ID: 3f8a1c6b9d20
+Revises: d27a84c5f093
+Create Date: 2026-10-18 13:02:44.561027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f8a1c6b9d20'
+down_revision: Union[str, Sequence[str], None] = 'd27a84c5f093'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_movie_genres_genre_id_movie_id',
+        'movie_genres',
+        ['genre_id', 'movie_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movie_genres_genre_id_movie_id', table_name='movie_genres')
@@ -0,0 +1,47 @@
+"""add rating aggregates to movies
+
+Revision ID: 5c1f9a2d7e34
+Revises: 086a3e8677e0
+Create Date: 2026-10-18 09:12:31.402118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f9a2d7e34'
+down_revision: Union[str, Sequence[str], None] = '086a3e8677e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('movies', sa.Column('ratings_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('movies', sa.Column('ratings_sum', sa.BigInteger(), server_default='0', nullable=False))
+    op.create_index(op.f('ix_movie_ratings_movie_id'), 'movie_ratings', ['movie_id'], unique=False)
+
+    # Backfill aggregates from the existing ratings
+    op.execute(
+        """
+        UPDATE movies AS m
+        SET ratings_count = agg.ratings_count,
+            ratings_sum = agg.ratings_sum
+        FROM (
+            SELECT movie_id, COUNT(*) AS ratings_count, SUM(score) AS ratings_sum
+            FROM movie_ratings
+            GROUP BY movie_id
+        ) AS agg
+        WHERE agg.movie_id = m.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_movie_ratings_movie_id'), table_name='movie_ratings')
+    op.drop_column('movies', 'ratings_sum')
+    op.drop_column('movies', 'ratings_count')
@@ -0,0 +1,35 @@
+"""add keyset pagination indexes
+
+Revision ID: 9b3e6d0a41c8
+Revises: 5c1f9a2d7e34
+Create Date: 2026-10-18 10:03:47.118904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e6d0a41c8'
+down_revision: Union[str, Sequence[str], None] = '5c1f9a2d7e34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_movies_title_id', 'movies', ['title', 'id'], unique=False)
+    op.create_index(
+        'ix_movies_release_year_id',
+        'movies',
+        [sa.text('COALESCE(release_year, 0)'), 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movies_release_year_id', table_name='movies')
+    op.drop_index('ix_movies_title_id', table_name='movies')
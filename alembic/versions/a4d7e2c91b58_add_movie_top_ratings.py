@@ -0,0 +1,52 @@
+"""add movie_top_ratings
+
+Revision ID: a4d7e2c91b58
+Revises: 3f8a1c6b9d20
+Create Date: 2026-10-18 15:21:09.318442
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d7e2c91b58'
+down_revision: Union[str, Sequence[str], None] = '3f8a1c6b9d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'movie_top_ratings',
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('release_year', sa.Integer(), nullable=True),
+        sa.Column('ratings_count', sa.Integer(), nullable=False),
+        sa.Column('ratings_sum', sa.BigInteger(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('movie_id'),
+    )
+    op.create_index(
+        'ix_movie_top_ratings_score',
+        'movie_top_ratings',
+        [sa.text('score DESC'), 'movie_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_movie_top_ratings_release_year_score',
+        'movie_top_ratings',
+        ['release_year', sa.text('score DESC'), 'movie_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_movie_top_ratings_release_year_score', table_name='movie_top_ratings')
+    op.drop_index('ix_movie_top_ratings_score', table_name='movie_top_ratings')
+    op.drop_table('movie_top_ratings')
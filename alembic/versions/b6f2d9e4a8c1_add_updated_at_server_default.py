@@ -0,0 +1,33 @@
+"""add updated_at server default
+
+Revision ID: b6f2d9e4a8c1
+Revises: e5b8c3d1f607
+Create Date: 2026-10-18 11:02:47.218934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f2d9e4a8c1'
+down_revision: Union[str, Sequence[str], None] = 'e5b8c3d1f607'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('movies', 'directors', 'genres')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows keep their NULL updated_at; only new rows get the default
+    for table in TABLES:
+        op.alter_column(table, 'updated_at', server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'updated_at', server_default=None)
@@ -0,0 +1,45 @@
+"""add trigram search indexes
+
+Revision ID: d27a84c5f093
+Revises: 9b3e6d0a41c8
+Create Date: 2026-10-18 11:26:05.774310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd27a84c5f093'
+down_revision: Union[str, Sequence[str], None] = '9b3e6d0a41c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_movies_title_trgm',
+        'movies',
+        ['title'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_genres_name_trgm',
+        'genres',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_genres_name_trgm', table_name='genres')
+    op.drop_index('ix_movies_title_trgm', table_name='movies')
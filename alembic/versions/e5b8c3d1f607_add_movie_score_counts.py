@@ -0,0 +1,46 @@
+"""add movie_score_counts
+
+Revision ID: e5b8c3d1f607
+Revises: a4d7e2c91b58
+Create Date: 2026-10-18 16:05:47.902315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c3d1f607'
+down_revision: Union[str, Sequence[str], None] = 'a4d7e2c91b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'movie_score_counts',
+        sa.Column('movie_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.SmallInteger(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.CheckConstraint('score >= 1 AND score <= 10', name='check_score_count_range'),
+        sa.ForeignKeyConstraint(['movie_id'], ['movies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('movie_id', 'score'),
+    )
+
+    # Backfill the histograms from the existing ratings
+    op.execute(
+        """
+        INSERT INTO movie_score_counts (movie_id, score, count)
+        SELECT movie_id, score, COUNT(*)
+        FROM movie_ratings
+        GROUP BY movie_id, score
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('movie_score_counts')
@@ -0,0 +1,23 @@
+"""Caching utilities."""
+
+from app.cache.base import CacheBackend, CacheStats
+from app.cache.memory import MemoryCache
+from app.cache.movie_cache import MovieDetailCache, movie_detail_cache, configure_movie_cache
+from app.cache.list_cache import MovieListCache, movie_list_cache
+from app.cache.genre_cache import GenreDictionary, genre_dictionary
+from app.cache.director_cache import DirectorCache, director_cache
+
+__all__ = [
+    "CacheBackend",
+    "CacheStats",
+    "MemoryCache",
+    "MovieDetailCache",
+    "movie_detail_cache",
+    "configure_movie_cache",
+    "MovieListCache",
+    "movie_list_cache",
+    "GenreDictionary",
+    "genre_dictionary",
+    "DirectorCache",
+    "director_cache",
+]
@@ -0,0 +1,58 @@
+"""Cache backend interface."""
+
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Hashable, Optional
+
+
+class CacheStats:
+    """Hit, miss and eviction counters for a cache."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def incr(self, field: str, amount: int = 1) -> None:
+        """Increment one counter."""
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def as_dict(self) -> dict:
+        """Return a snapshot of the counters with the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Interface for cache storage. Values must be plain JSON-compatible data so a
+    shared backend (e.g. Redis or memcached) can store them.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, optionally overriding the backend's default TTL."""
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Remove a key if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
@@ -0,0 +1,64 @@
+"""Bounded cache of director records."""
+
+from typing import Dict, Iterable, Optional
+
+from app.cache.base import CacheBackend
+from app.cache.memory import MemoryCache
+from app.config import settings
+
+
+class DirectorCache:
+    """
+    Caches director records (id, name, birth_year, description) by director ID.
+    A few thousand prolific directors cover most movies, so a bounded LRU keeps
+    the hot set; writers to the directors table must call invalidate().
+    """
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+
+    def get(self, director_id: int) -> Optional[dict]:
+        """Return the cached record, or None on a miss."""
+        if not self.enabled:
+            return None
+        return self.backend.get(self._key(director_id))
+
+    def get_many(self, director_ids: Iterable[int]) -> Dict[int, dict]:
+        """Return the cached records among director_ids, keyed by ID; misses are left out."""
+        if not self.enabled:
+            return {}
+        records = {}
+        for director_id in director_ids:
+            record = self.backend.get(self._key(director_id))
+            if record is not None:
+                records[director_id] = record
+        return records
+
+    def set(self, record: dict) -> None:
+        """Store a director record."""
+        if self.enabled:
+            self.backend.set(self._key(record["id"]), record)
+
+    def invalidate(self, director_id: int) -> None:
+        """Drop the record of a director that was changed or deleted."""
+        if self.enabled:
+            self.backend.delete(self._key(director_id))
+
+    def clear(self) -> None:
+        """Drop all records, e.g. after a bulk load of directors."""
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters."""
+        return self.backend.stats.as_dict()
+
+    @staticmethod
+    def _key(director_id: int) -> str:
+        return f"director:{director_id}"
+
+
+director_cache = DirectorCache(
+    MemoryCache(max_size=settings.DIRECTOR_CACHE_SIZE, ttl=settings.DIRECTOR_CACHE_TTL),
+    enabled=settings.DIRECTOR_CACHE_ENABLED,
+)
@@ -0,0 +1,141 @@
+"""Process-wide dictionary of the genres table."""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.db.database import AsyncSessionLocal, SessionLocal
+from app.models import Genre
+
+
+def load_genres() -> List[Genre]:
+    """Load all genres in a short-lived session; the returned objects are detached."""
+    with SessionLocal() as db:
+        return db.query(Genre).order_by(Genre.id).all()
+
+
+async def load_genres_async() -> List[Genre]:
+    """Async counterpart of load_genres over the asyncpg engine."""
+    async with AsyncSessionLocal() as db:
+        return list((await db.scalars(select(Genre).order_by(Genre.id))).all())
+
+
+class GenreDictionary:
+    """
+    Snapshot of the genres table indexed by ID and by lowercase name.
+
+    The table is tiny and rarely changes, so it is loaded whole and reloaded
+    after ttl seconds or after invalidate(); every reload bumps version. Lookups
+    never touch the database in between. The cached Genre objects are detached
+    and shared: attach them to a session with merge(load=False), never modify them.
+
+    Lookups reload synchronously, which is fine in request threads but would block
+    the event loop. Async code awaits refresh_async() before its lookups instead;
+    on the loop a stale snapshot is served as is rather than reloaded.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], List[Genre]] = load_genres,
+        async_loader: Callable[[], Awaitable[List[Genre]]] = load_genres_async,
+        ttl: float = 300,
+    ):
+        self.loader = loader
+        self.async_loader = async_loader
+        self.ttl = ttl
+        self.version = 0
+        # (id -> genre, lowercase name -> id), replaced as a whole on reload
+        self._indexes: Tuple[Dict[int, Genre], Dict[str, int]] = ({}, {})
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self, genre_id: int) -> Optional[Genre]:
+        """Return the genre with this ID, or None."""
+        return self._snapshot()[0].get(genre_id)
+
+    def get_many(self, genre_ids: Iterable[int]) -> List[Genre]:
+        """Return the genres with these IDs in input order, skipping unknown and repeated IDs."""
+        by_id = self._snapshot()[0]
+        return [by_id[genre_id] for genre_id in dict.fromkeys(genre_ids) if genre_id in by_id]
+
+    def all_genres(self) -> List[Genre]:
+        """Return all genres ordered by ID."""
+        return list(self._snapshot()[0].values())
+
+    def id_for_name(self, name: str) -> Optional[int]:
+        """Return the ID of the genre with this name (case-insensitive), or None."""
+        return self._snapshot()[1].get(name.strip().lower())
+
+    def all_exist(self, genre_ids: Iterable[int]) -> bool:
+        """Check if all given genre IDs exist."""
+        by_id = self._snapshot()[0]
+        return all(genre_id in by_id for genre_id in genre_ids)
+
+    def ids_matching(self, fragment: str) -> List[int]:
+        """Return the IDs of genres whose name contains fragment (case-insensitive)."""
+        fragment = fragment.lower()
+        return [genre_id for name, genre_id in self._snapshot()[1].items() if fragment in name]
+
+    async def refresh_async(self) -> None:
+        """Reload through the async loader if stale; call before lookups made on the event loop."""
+        if self._is_stale():
+            self._install(await self.async_loader())
+
+    def invalidate(self) -> None:
+        """Force a reload on the next lookup, e.g. after genres were added or renamed."""
+        self._loaded_at = None
+
+    def stats(self) -> dict:
+        """Return the snapshot version, size and age."""
+        loaded_at = self._loaded_at
+        return {
+            "version": self.version,
+            "size": len(self._indexes[0]),
+            "age_seconds": round(time.monotonic() - loaded_at, 1) if loaded_at is not None else None,
+        }
+
+    # =========================================================================
+    # Helper methods
+    # =========================================================================
+
+    def _snapshot(self) -> Tuple[Dict[int, Genre], Dict[str, int]]:
+        """Return the current (by_id, id_by_name) pair, reloading it first if stale."""
+        if self._is_stale() and not (self._loaded_once() and _on_event_loop()):
+            with self._lock:
+                if self._is_stale():
+                    self._reload()
+        return self._indexes
+
+    def _is_stale(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at > self.ttl
+
+    def _loaded_once(self) -> bool:
+        return self.version > 0
+
+    def _reload(self) -> None:
+        self._install(self.loader())
+
+    def _install(self, genres: List[Genre]) -> None:
+        id_by_name = {}
+        for genre in genres:
+            id_by_name.setdefault(genre.name.lower(), genre.id)
+
+        self._indexes = {genre.id: genre for genre in genres}, id_by_name
+        self.version += 1
+        self._loaded_at = time.monotonic()
+
+
+def _on_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+genre_dictionary = GenreDictionary(ttl=settings.GENRE_CACHE_TTL)
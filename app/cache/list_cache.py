@@ -0,0 +1,145 @@
+"""Generation-versioned cache for movie list pages."""
+
+import hashlib
+import secrets
+import threading
+import time
+from typing import Any, Optional, Tuple
+
+from app.cache.base import CacheBackend
+from app.cache.memory import MemoryCache
+from app.config import settings
+
+
+# Distinguishes this process's generation counters from other workers' and earlier runs
+BOOT_ID = secrets.token_hex(4)
+
+# ETag rollover in seconds when no backend TTL bounds staleness across workers
+DEFAULT_ETAG_WINDOW = 60
+
+
+class MovieListCache:
+    """
+    Caches list results keyed by the normalized filter tuple.
+
+    Keys embed a catalog generation that every movie write bumps, so a write
+    orphans all older pages at once without enumerating keys; orphans age out
+    of the LRU. Rating writes bump a separate ratings generation: an entry filled
+    before the latest rating write is still served for up to rating_staleness
+    seconds after it was filled, so list averages lag ratings by at most that much.
+
+    Generations are per process; with several workers, entries written by a
+    worker that did not see a write expire through the backend TTL.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        rating_staleness: float = 0,
+        enabled: bool = True,
+        etag_ttl: float = 0,
+    ):
+        self.backend = backend
+        self.rating_staleness = rating_staleness
+        self.enabled = enabled
+        self.etag_ttl = etag_ttl
+        self.catalog_generation = 0
+        self.ratings_generation = 0
+        # Ratings generation as last shown in the ETags of listings not ordered by rating
+        self._tagged_ratings = (0, 0.0)
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> Tuple[int, int]:
+        """Return the current (catalog, ratings) generations; take it before reading the DB."""
+        return self.catalog_generation, self.ratings_generation
+
+    def get(self, key: tuple) -> Optional[Any]:
+        """Return the cached result for a filter key, or None on a miss or when too stale."""
+        if not self.enabled:
+            return None
+
+        entry = self.backend.get(self._backend_key(self.catalog_generation, key))
+        if entry is None:
+            return None
+
+        if (
+            entry["ratings_generation"] != self.ratings_generation
+            and time.time() - entry["cached_at"] > self.rating_staleness
+        ):
+            return None
+
+        return entry["value"]
+
+    def set(self, key: tuple, value: Any, snapshot: Tuple[int, int]) -> None:
+        """
+        Store a result under the generations it was read at. A write that landed
+        while the result was being built leaves it under an already-orphaned key.
+        """
+        if not self.enabled:
+            return
+
+        catalog_generation, ratings_generation = snapshot
+        self.backend.set(
+            self._backend_key(catalog_generation, key),
+            {
+                "ratings_generation": ratings_generation,
+                "cached_at": time.time(),
+                "value": value,
+            },
+        )
+
+    def etag(self, key: tuple, by_rating: bool = False) -> str:
+        """
+        Return a strong ETag for the list page under key, derived from the generations
+        alone so a revalidation can be answered before any query runs. Generations only
+        see this process's writes, so the tag also rolls over every etag_ttl seconds
+        (DEFAULT_ETAG_WINDOW when the TTL is 0), bounding staleness across workers like
+        the cached pages themselves.
+
+        Pages ranked by rating (by_rating) follow every rating write. Other pages only
+        show averages, which may lag like cached pages do: their tag picks up new
+        ratings at most once every rating_staleness seconds.
+        """
+        window = int(time.time() // (self.etag_ttl or DEFAULT_ETAG_WINDOW))
+        ratings = self.ratings_generation if by_rating else self._lagged_ratings_generation()
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=6).hexdigest()
+        return f'"l{BOOT_ID}-{self.catalog_generation}-{ratings}-{window}-{digest}"'
+
+    def bump_catalog(self) -> None:
+        """Invalidate every cached page after a movie is created, updated or deleted."""
+        with self._lock:
+            self.catalog_generation += 1
+
+    def bump_ratings(self) -> None:
+        """Mark cached pages as lagging after a rating write."""
+        with self._lock:
+            self.ratings_generation += 1
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters and the current generations."""
+        return {
+            **self.backend.stats.as_dict(),
+            "catalog_generation": self.catalog_generation,
+            "ratings_generation": self.ratings_generation,
+        }
+
+    def _lagged_ratings_generation(self) -> int:
+        """Return the ratings generation, moving it forward at most every rating_staleness seconds."""
+        generation, tagged_at = self._tagged_ratings
+        if generation != self.ratings_generation and time.time() - tagged_at >= self.rating_staleness:
+            with self._lock:
+                generation = self.ratings_generation
+                self._tagged_ratings = generation, time.time()
+        return generation
+
+    @staticmethod
+    def _backend_key(catalog_generation: int, key: tuple) -> str:
+        return f"movies:list:{catalog_generation}:{key!r}"
+
+
+movie_list_cache = MovieListCache(
+    MemoryCache(max_size=settings.LIST_CACHE_SIZE, ttl=settings.LIST_CACHE_TTL),
+    rating_staleness=settings.LIST_CACHE_RATING_STALENESS,
+    enabled=settings.LIST_CACHE_ENABLED,
+    etag_ttl=settings.LIST_CACHE_TTL,
+)
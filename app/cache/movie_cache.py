@@ -0,0 +1,106 @@
+"""Read-through cache for movie detail responses."""
+
+import threading
+from typing import Optional, Tuple
+
+from app.cache.base import CacheBackend
+from app.cache.memory import MemoryCache
+from app.config import settings
+
+# Write generation slots; movies sharing a slot only cost each other a skipped fill
+GENERATION_SLOTS = 4096
+
+
+class MovieDetailCache:
+    """
+    Caches movie detail payloads by movie ID, each with the movie's version stamp
+    (updated_at in epoch microseconds) that its ETag is built from. Writers keep it
+    precise: movie edits and deletes invalidate an entry, rating writes patch it in place.
+
+    Every write also bumps the movie's write generation, even with no entry to
+    change. A read-through fill takes a snapshot() before loading and is dropped
+    if a write landed in between, so it cannot store what the write missed.
+    Generations are per process, like the list cache's.
+    """
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+        self._generations = [0] * GENERATION_SLOTS
+        self._lock = threading.Lock()
+
+    def snapshot(self, movie_id: int) -> int:
+        """Return the movie's write generation; take it before loading the movie."""
+        return self._generations[movie_id % GENERATION_SLOTS]
+
+    def get(self, movie_id: int) -> Optional[Tuple[dict, int]]:
+        """Return the cached (detail payload, version stamp), or None on a miss."""
+        if not self.enabled:
+            return None
+        entry = self.backend.get(self._key(movie_id))
+        if entry is None:
+            return None
+        return entry["detail"], entry["version"]
+
+    def set(self, movie_id: int, detail: dict, version: int, snapshot: int) -> None:
+        """Store a detail payload with its version stamp, unless the movie was written since snapshot."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if self._generations[movie_id % GENERATION_SLOTS] != snapshot:
+                return
+            self.backend.set(self._key(movie_id), {"detail": detail, "version": version})
+
+    def invalidate(self, movie_id: int) -> None:
+        """Drop the entry for a movie that was changed or deleted."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._bump(movie_id)
+            self.backend.delete(self._key(movie_id))
+
+    def apply_rating_aggregates(self, movie_id: int, ratings_count: int, ratings_sum: int) -> None:
+        """
+        Patch a cached entry with the movie's new rating aggregates. Ratings are only
+        ever added, so an entry already holding as many ratings is left alone: a
+        writer that lost the race must not roll it back to older aggregates.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._bump(movie_id)
+            entry = self.backend.get(self._key(movie_id))
+            if entry is None or entry["detail"]["ratings_count"] >= ratings_count:
+                return
+
+            detail = dict(entry["detail"])
+            detail["ratings_count"] = ratings_count
+            detail["average_rating"] = round(ratings_sum / ratings_count, 1) if ratings_count else None
+            self.backend.set(self._key(movie_id), {"detail": detail, "version": entry["version"]})
+
+    def stats(self) -> dict:
+        """Return hit/miss/eviction counters."""
+        return self.backend.stats.as_dict()
+
+    def _bump(self, movie_id: int) -> None:
+        """Fail the fills of a movie that were loaded before this write (call with the lock held)."""
+        self._generations[movie_id % GENERATION_SLOTS] += 1
+
+    @staticmethod
+    def _key(movie_id: int) -> str:
+        return f"movie:{movie_id}"
+
+
+# Process-wide instance; call configure_movie_cache() at startup to plug in a shared backend
+movie_detail_cache = MovieDetailCache(
+    MemoryCache(max_size=settings.MOVIE_CACHE_SIZE, ttl=settings.MOVIE_CACHE_TTL),
+    enabled=settings.MOVIE_CACHE_ENABLED,
+)
+
+
+def configure_movie_cache(backend: CacheBackend) -> None:
+    """Replace the movie detail cache backend, e.g. with a shared one."""
+    movie_detail_cache.backend = backend
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -5,6 +7,100 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DEBUG: bool = False
 
+    # Database stack serving the core movie routes: sync (psycopg2) or async (asyncpg)
+    DB_STACK: str = "sync"
+    # Defaults to DATABASE_URL with the postgresql+asyncpg driver
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Connection pool, per worker process
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Total connections for the host; when > 0 it is split across WEB_CONCURRENCY workers
+    DB_CONNECTION_BUDGET: int = 0
+    WEB_CONCURRENCY: int = 1
+    # Server-side timeouts in milliseconds; 0 disables them
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = 0
+    # Pool checkouts waiting at least this long are logged
+    DB_POOL_SLOW_CHECKOUT_MS: int = 100
+
+    # Total-count strategy for movie listings: exact, cached, estimated or none
+    LIST_COUNT_MODE: str = "exact"
+    LIST_COUNT_CACHE_TTL: int = 60
+    LIST_COUNT_CACHE_SIZE: int = 1024
+
+    # Movie detail cache (in-process LRU + TTL unless another backend is configured)
+    MOVIE_CACHE_ENABLED: bool = True
+    MOVIE_CACHE_SIZE: int = 10000
+    MOVIE_CACHE_TTL: int = 300
+
+    # Director record cache (LRU)
+    DIRECTOR_CACHE_ENABLED: bool = True
+    DIRECTOR_CACHE_SIZE: int = 5000
+    DIRECTOR_CACHE_TTL: int = 3600
+
+    # Top-rated ranking: rebuilt every interval seconds by each worker's refresher
+    # (cluster-wide about once per interval); scores are pulled toward the catalog
+    # mean by TOP_RATED_PRIOR_WEIGHT phantom ratings. Responses lag rating writes by
+    # up to the interval plus one rebuild plus LIST_CACHE_TTL for cached pages
+    TOP_RATED_REFRESH_ENABLED: bool = True
+    TOP_RATED_REFRESH_INTERVAL: int = 60
+    TOP_RATED_PRIOR_WEIGHT: float = 10.0
+    TOP_RATED_MIN_RATINGS: int = 1
+
+    # Per-request timing: Server-Timing header, and one log line for a sampled
+    # fraction of requests plus every request slower than TIMING_SLOW_REQUEST_MS
+    TIMING_ENABLED: bool = True
+    TIMING_HEADER: bool = True
+    TIMING_LOG_SAMPLE_RATE: float = 0.01
+    TIMING_SLOW_REQUEST_MS: int = 500
+
+    # Prometheus metrics at /metrics (per worker process)
+    METRICS_ENABLED: bool = True
+
+    # Statement budgets declared on endpoints: checked when enabled (unset follows
+    # DEBUG); a block over budget, or running one statement shape more than
+    # QUERY_BUDGET_REPEAT_LIMIT times, logs a warning or raises when strict
+    QUERY_BUDGET_ENABLED: Optional[bool] = None
+    QUERY_BUDGET_STRICT: bool = False
+    QUERY_BUDGET_REPEAT_LIMIT: int = 3
+
+    # Cache-Control sent with movie responses (empty to omit); ETags are always sent
+    MOVIE_DETAIL_CACHE_CONTROL: str = "public, no-cache"
+    MOVIE_LIST_CACHE_CONTROL: str = "public, no-cache"
+    MOVIE_TOP_CACHE_CONTROL: str = "public, no-cache"
+
+    # Seconds before the in-memory genre dictionary is reloaded
+    GENRE_CACHE_TTL: int = 300
+
+    # Movie list page cache; rating-only changes may show up to LIST_CACHE_RATING_STALENESS seconds late
+    LIST_CACHE_ENABLED: bool = True
+    LIST_CACHE_SIZE: int = 2048
+    LIST_CACHE_TTL: int = 60
+    LIST_CACHE_RATING_STALENESS: float = 5.0
+
+    # Maximum number of ratings accepted by one POST /ratings:batch call
+    RATINGS_BATCH_MAX_SIZE: int = 5000
+
+    # Write-behind ratings: acknowledge with 202 and insert in periodic batches
+    RATINGS_WRITE_BEHIND: bool = False
+    RATINGS_FLUSH_INTERVAL_MS: int = 200
+    RATINGS_FLUSH_BATCH_SIZE: int = 500
+    RATINGS_BUFFER_MAX_SIZE: int = 10000
+    # Retries of a failed flush, waiting RATINGS_FLUSH_RETRY_BACKOFF_MS and doubling each time
+    RATINGS_FLUSH_RETRIES: int = 3
+    RATINGS_FLUSH_RETRY_BACKOFF_MS: int = 100
+
+    # Bulk movie import: lines per INSERT batch, and errors listed in the report
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_MAX_REPORTED_ERRORS: int = 1000
+
+    # Catalog export: rows fetched per server-side cursor batch and written per chunk
+    EXPORT_BATCH_SIZE: int = 1000
+
     class Config:
         env_file = ".env"
 
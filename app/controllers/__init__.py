@@ -1,7 +1,9 @@
 """Controller layer - API endpoints."""
 
 from app.controllers.movie_controller import router as movie_router
+from app.controllers.async_movie_controller import router as async_movie_router
 
 __all__ = [
     "movie_router",
+    "async_movie_router",
 ]
\ No newline at end of file
@@ -0,0 +1,330 @@
+"""Async movie controller - the movie and rating endpoints served by the async database stack."""
+
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, status
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.controllers.common import (
+    CREATE_MOVIE_BUDGET,
+    CREATE_RATING_BUDGET,
+    DELETE_MOVIE_BUDGET,
+    GET_MOVIE_BUDGET,
+    LIST_MOVIES_BUDGET,
+    RATING_STATS_BUDGET,
+    RATINGS_BATCH_BUDGET,
+    TOP_MOVIES_BUDGET,
+    UPDATE_MOVIE_BUDGET,
+    ExportParams,
+    MovieListParams,
+    TopMoviesParams,
+    cursor_page,
+    export_response,
+    numbered_page,
+    revalidate,
+    success,
+    top_page,
+    validated_response,
+)
+from app.instrumentation import query_budget
+from app.responses import FastJSONResponse
+from app.db.database import get_async_db
+from app.services import AsyncMovieService, AsyncRatingService, AsyncMovieExportService
+from app.schemas import RatingCreate, RatingBatchCreate, MovieCreate, MovieUpdate
+
+router = APIRouter()
+
+
+# =============================================================================
+# API 1 & 2: GET /movies - List movies with pagination and filtering
+# =============================================================================
+
+@router.get("/movies")
+@query_budget(LIST_MOVIES_BUDGET)
+async def get_movies(
+    params: MovieListParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get list of movies with pagination and optional filters.
+
+    - **page**: Page number (default: 1)
+    - **page_size**: Items per page (default: 10, max: 100)
+    - **title**: Filter by title (partial match, case-insensitive)
+    - **release_year**: Filter by exact release year
+    - **genre**: Filter by genre name (partial match, case-insensitive)
+    - **search**: Fuzzy title search; results are ranked by similarity and `sort` is ignored
+    - **sort**: Sort key, one of id, title, release_year (ties broken by id)
+    - **cursor**: Continue from a previous response's `next_cursor` instead of using `page`
+    - **count_mode**: exact, cached (TTL per filter set), estimated (planner statistics)
+      or none (total_items is null); defaults to the LIST_COUNT_MODE setting
+
+    Responses carry an ETag; a matching `If-None-Match` gets a 304 without running any query.
+    """
+    service = AsyncMovieService(db)
+    cache_control = settings.MOVIE_LIST_CACHE_CONTROL
+
+    if params.cursor is not None:
+        etag = service.get_movies_by_cursor_etag(**params.cursor_args())
+        not_modified = revalidate(if_none_match, etag, cache_control)
+        if not_modified is not None:
+            return not_modified
+
+        movies, next_cursor = await service.get_movies_by_cursor(**params.cursor_args())
+        return validated_response(cursor_page(params, movies, next_cursor), etag, cache_control)
+
+    etag = service.get_movies_etag(**params.page_args())
+    not_modified = revalidate(if_none_match, etag, cache_control)
+    if not_modified is not None:
+        return not_modified
+
+    movies, total_count, count_mode, next_cursor = await service.get_movies(**params.page_args())
+    return validated_response(
+        numbered_page(params, movies, total_count, count_mode, next_cursor), etag, cache_control
+    )
+
+
+# =============================================================================
+# GET /movies/export - Stream the catalog as NDJSON or CSV
+# =============================================================================
+
+# Budgeted by the export service on its own session, which streams rows after this returns
+@router.get("/movies/export")
+async def export_movies(params: ExportParams = Depends()):
+    """
+    Stream every movie matching the filters, ordered by ID.
+
+    - **format**: ndjson (one JSON object per line) or csv (genres joined by "|")
+    - **title**, **release_year**, **genre**, **search**: Same filters as `GET /movies`
+
+    Each row carries the director name, genre names, ratings_count and average_rating.
+    Rows are streamed from a server-side cursor, so the catalog is never held in memory.
+    """
+    service = AsyncMovieExportService(export_format=params.format)
+    return export_response(params, service.stream(**params.filters()))
+
+
+# =============================================================================
+# GET /movies/top - Top-rated movies by Bayesian average
+# =============================================================================
+
+@router.get("/movies/top")
+@query_budget(TOP_MOVIES_BUDGET)
+async def get_top_movies(
+    params: TopMoviesParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get the best-rated movies, ranked by Bayesian average.
+
+    - **limit**: Number of movies (default: 10, max: 100)
+    - **genre**: Filter by genre name (partial match, case-insensitive)
+    - **release_year**: Filter by exact release year
+
+    Each movie's mean is pulled toward the catalog mean by TOP_RATED_PRIOR_WEIGHT
+    phantom ratings, so a single high rating cannot top the chart. The ranking is
+    precomputed and rebuilt every TOP_RATED_REFRESH_INTERVAL seconds; `refreshed_at`
+    tells how current it is.
+    """
+    service = AsyncMovieService(db)
+    cache_control = settings.MOVIE_TOP_CACHE_CONTROL
+
+    etag = service.get_top_movies_etag(**params.args())
+    not_modified = revalidate(if_none_match, etag, cache_control)
+    if not_modified is not None:
+        return not_modified
+
+    movies, refreshed_at = await service.get_top_movies(**params.args())
+    return validated_response(top_page(movies, refreshed_at), etag, cache_control)
+
+
+# =============================================================================
+# API 3: GET /movies/{movie_id} - Get movie details
+# =============================================================================
+
+@router.get("/movies/{movie_id}")
+@query_budget(GET_MOVIE_BUDGET)
+async def get_movie(
+    movie_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get detailed information about a specific movie.
+
+    - **movie_id**: The ID of the movie to retrieve
+
+    Responses carry an ETag; a matching `If-None-Match` gets a 304 without loading the movie.
+    """
+    service = AsyncMovieService(db)
+    cache_control = settings.MOVIE_DETAIL_CACHE_CONTROL
+
+    # Without a validator to compare, skip the version lookup
+    if if_none_match:
+        not_modified = revalidate(if_none_match, await service.get_movie_etag(movie_id), cache_control)
+        if not_modified is not None:
+            return not_modified
+
+    movie, etag = await service.get_movie_by_id(movie_id)
+    return validated_response(movie, etag, cache_control)
+
+
+# =============================================================================
+# API 4: POST /movies - Create a new movie
+# =============================================================================
+
+@router.post("/movies", status_code=status.HTTP_201_CREATED)
+@query_budget(CREATE_MOVIE_BUDGET)
+async def create_movie(
+    movie_data: MovieCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Create a new movie.
+
+    - **title**: Movie title (required)
+    - **director_id**: ID of the director (required, must exist)
+    - **release_year**: Year of release (optional)
+    - **cast**: Cast members as string (optional)
+    - **genres**: List of genre IDs (optional, must exist)
+    """
+    service = AsyncMovieService(db)
+    movie = await service.create_movie(movie_data.model_dump())
+
+    return success(movie)
+
+
+# =============================================================================
+# API 5: PUT /movies/{movie_id} - Update a movie
+# =============================================================================
+
+@router.put("/movies/{movie_id}")
+@query_budget(UPDATE_MOVIE_BUDGET)
+async def update_movie(
+    movie_id: int,
+    movie_data: MovieUpdate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Update an existing movie.
+
+    - **movie_id**: The ID of the movie to update
+    - **title**: New title (optional)
+    - **director_id**: New director ID (optional, must exist)
+    - **release_year**: New release year (optional)
+    - **cast**: New cast members (optional)
+    - **genres**: New list of genre IDs (optional, must exist)
+    """
+    service = AsyncMovieService(db)
+    movie = await service.update_movie(movie_id, movie_data.model_dump(exclude_unset=True))
+
+    return success(movie)
+
+
+# =============================================================================
+# API 6: DELETE /movies/{movie_id} - Delete a movie
+# =============================================================================
+
+@router.delete("/movies/{movie_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(DELETE_MOVIE_BUDGET)
+async def delete_movie(
+    movie_id: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Delete a movie from the system.
+
+    - **movie_id**: The ID of the movie to delete
+
+    This will also delete associated ratings and genre associations.
+    """
+    service = AsyncMovieService(db)
+    await service.delete_movie(movie_id)
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# =============================================================================
+# API 7: POST /movies/{movie_id}/ratings - Create rating for a movie
+# =============================================================================
+
+@router.post("/movies/{movie_id}/ratings", status_code=status.HTTP_201_CREATED)
+@query_budget(CREATE_RATING_BUDGET)
+async def create_rating(
+    movie_id: int,
+    rating_data: RatingCreate,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Submit a rating for a movie.
+
+    - **movie_id**: The ID of the movie to rate
+    - **score**: Rating score between 1 and 10
+
+    With RATINGS_WRITE_BEHIND enabled the rating is queued and saved in the next
+    batched flush: the response is 202 without rating_id, and 503 when the buffer is full.
+    """
+    service = AsyncRatingService(db)
+
+    if settings.RATINGS_WRITE_BEHIND:
+        rating = await service.enqueue_rating(movie_id=movie_id, score=rating_data.score)
+        response.status_code = status.HTTP_202_ACCEPTED
+    else:
+        rating = await service.create_rating(movie_id=movie_id, score=rating_data.score)
+
+    return success(rating)
+
+
+# =============================================================================
+# GET /movies/{movie_id}/ratings/stats - Score distribution of a movie
+# =============================================================================
+
+@router.get("/movies/{movie_id}/ratings/stats")
+@query_budget(RATING_STATS_BUDGET)
+async def get_rating_stats(
+    movie_id: int,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Get the score distribution of a movie.
+
+    - **movie_id**: The ID of the movie
+
+    Returns the count of each score from 1 to 10, the average, median, percentiles
+    and standard deviation. They are computed from the movie's stored histogram,
+    which every rating write keeps current, so the cost does not grow with the
+    number of ratings.
+    """
+    service = AsyncRatingService(db)
+    stats = await service.get_rating_stats(movie_id)
+
+    return FastJSONResponse(success(stats))
+
+
+# =============================================================================
+# POST /ratings:batch - Create many ratings in one call
+# =============================================================================
+
+@router.post("/ratings:batch")
+@query_budget(RATINGS_BATCH_BUDGET)
+async def create_ratings_batch(
+    batch: RatingBatchCreate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    Submit many ratings at once, e.g. from a partner feed.
+
+    - **items**: List of {movie_id, score}; each score must be between 1 and 10
+
+    Items are validated one by one: valid ones are saved in a single transaction,
+    invalid ones are reported with their own error. The response lists one result
+    per item, in request order.
+    """
+    service = AsyncRatingService(db)
+    result = await service.create_ratings_batch([item.model_dump() for item in batch.items])
+
+    return success(result)
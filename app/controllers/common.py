@@ -0,0 +1,208 @@
+"""Query parameters, statement budgets and responses shared by the sync and async movie controllers."""
+
+from datetime import datetime
+from typing import Any, AsyncIterable, Iterable, List, Optional, Union
+from fastapi import Query
+from fastapi.responses import Response, StreamingResponse
+
+from app.config import settings
+from app.responses import FastJSONResponse, etag_matches, not_modified, validator_headers
+from app.services.export_service import EXPORT_FORMATS
+
+
+# =============================================================================
+# Statement budgets with cold caches; both stacks send the same statements
+# =============================================================================
+
+# estimated + exact count, page IDs, movies, genres IN, directors, genre dictionary reload
+LIST_MOVIES_BUDGET = 7
+# genre dictionary reload, ranking, movies, genres IN, directors, refreshed_at
+TOP_MOVIES_BUDGET = 6
+# version check, movie joined with director and genres
+GET_MOVIE_BUDGET = 2
+# director lookup, genre dictionary reload, INSERT movie, INSERT genre links
+CREATE_MOVIE_BUDGET = 4
+# movie, director lookup, genre dictionary reload, UPDATE movie, DELETE + INSERT genre links
+UPDATE_MOVIE_BUDGET = 6
+# DELETE movie RETURNING
+DELETE_MOVIE_BUDGET = 1
+# movie exists, INSERT rating, UPDATE aggregates, histogram upsert, refresh rating
+CREATE_RATING_BUDGET = 5
+# histogram, movie exists when it is empty
+RATING_STATS_BUDGET = 2
+# movies exist, INSERT ratings, lock movies, UPDATE aggregates, histogram upsert: any batch size
+RATINGS_BATCH_BUDGET = 5
+# director and genre name maps; each committed batch extends it by IMPORT_BATCH_STATEMENTS
+IMPORT_MOVIES_BUDGET = 2
+
+
+# =============================================================================
+# Query parameters
+# =============================================================================
+
+class MovieListParams:
+    """Query parameters of GET /movies."""
+
+    def __init__(
+        self,
+        page: int = Query(1, ge=1, description="Page number"),
+        page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+        title: Optional[str] = Query(None, description="Filter by title (partial match)"),
+        release_year: Optional[int] = Query(None, ge=1800, le=2100, description="Filter by release year"),
+        genre: Optional[str] = Query(None, description="Filter by genre name"),
+        search: Optional[str] = Query(None, min_length=1, description="Fuzzy title search, ranked by similarity"),
+        sort: str = Query("id", pattern="^(id|title|release_year)$", description="Sort key"),
+        cursor: Optional[str] = Query(None, description="Opaque cursor from a previous next_cursor"),
+        count_mode: Optional[str] = Query(
+            None,
+            pattern="^(exact|cached|estimated|none)$",
+            description="How total_items is computed",
+        ),
+    ):
+        self.page = page
+        self.page_size = page_size
+        self.title = title
+        self.release_year = release_year
+        self.genre = genre
+        self.search = search
+        self.sort = sort
+        self.cursor = cursor
+        self.count_mode = count_mode or settings.LIST_COUNT_MODE
+
+    def cursor_args(self) -> dict:
+        """Keyword arguments of the service's cursor-mode ETag lookup and query."""
+        return {
+            "cursor": self.cursor,
+            "page_size": self.page_size,
+            "title": self.title,
+            "release_year": self.release_year,
+            "genre": self.genre,
+            "sort": self.sort,
+            "search": self.search,
+        }
+
+    def page_args(self) -> dict:
+        """Keyword arguments of the service's page-mode ETag lookup and query."""
+        return {
+            "page": self.page,
+            "page_size": self.page_size,
+            "title": self.title,
+            "release_year": self.release_year,
+            "genre": self.genre,
+            "sort": self.sort,
+            "count_mode": self.count_mode,
+            "search": self.search,
+        }
+
+
+class ExportParams:
+    """Query parameters of GET /movies/export."""
+
+    def __init__(
+        self,
+        format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="Output format"),
+        title: Optional[str] = Query(None, description="Filter by title (partial match)"),
+        release_year: Optional[int] = Query(None, ge=1800, le=2100, description="Filter by release year"),
+        genre: Optional[str] = Query(None, description="Filter by genre name"),
+        search: Optional[str] = Query(None, min_length=1, description="Fuzzy title search"),
+    ):
+        self.format = format
+        self.title = title
+        self.release_year = release_year
+        self.genre = genre
+        self.search = search
+
+    def filters(self) -> dict:
+        """Keyword arguments of the export service's stream."""
+        return {
+            "title": self.title,
+            "release_year": self.release_year,
+            "genre": self.genre,
+            "search": self.search,
+        }
+
+
+class TopMoviesParams:
+    """Query parameters of GET /movies/top."""
+
+    def __init__(
+        self,
+        limit: int = Query(10, ge=1, le=100, description="Number of movies"),
+        genre: Optional[str] = Query(None, description="Filter by genre name"),
+        release_year: Optional[int] = Query(None, ge=1800, le=2100, description="Filter by release year"),
+    ):
+        self.limit = limit
+        self.genre = genre
+        self.release_year = release_year
+
+    def args(self) -> dict:
+        """Keyword arguments of the service's ETag lookup and query."""
+        return {"limit": self.limit, "genre": self.genre, "release_year": self.release_year}
+
+
+# =============================================================================
+# Responses
+# =============================================================================
+
+def revalidate(if_none_match: Optional[str], etag: str, cache_control: str) -> Optional[Response]:
+    """Return a 304 response when If-None-Match matches the ETag, otherwise None."""
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, cache_control)
+    return None
+
+
+def success(data: Any) -> dict:
+    """Wrap a payload in the success envelope."""
+    return {
+        "status": "success",
+        "data": data,
+    }
+
+
+def validated_response(data: Any, etag: str, cache_control: str) -> FastJSONResponse:
+    """Build a success response carrying the ETag and Cache-Control validators."""
+    return FastJSONResponse(success(data), headers=validator_headers(etag, cache_control))
+
+
+def cursor_page(params: MovieListParams, movies: List[dict], next_cursor: Optional[str]) -> dict:
+    """Build the data of a cursor-mode GET /movies response."""
+    return {
+        "page_size": params.page_size,
+        "next_cursor": next_cursor,
+        "items": movies,
+    }
+
+
+def numbered_page(
+    params: MovieListParams,
+    movies: List[dict],
+    total_count: Optional[int],
+    count_mode: str,
+    next_cursor: Optional[str],
+) -> dict:
+    """Build the data of a page-mode GET /movies response, with the count_mode actually used."""
+    return {
+        "page": params.page,
+        "page_size": params.page_size,
+        "total_items": total_count,
+        "count_mode": count_mode,
+        "next_cursor": next_cursor,
+        "items": movies,
+    }
+
+
+def top_page(movies: List[dict], refreshed_at: Optional[datetime]) -> dict:
+    """Build the data of a GET /movies/top response."""
+    return {
+        "refreshed_at": refreshed_at,
+        "items": movies,
+    }
+
+
+def export_response(params: ExportParams, chunks: Union[Iterable[str], AsyncIterable[str]]) -> StreamingResponse:
+    """Stream export chunks as a download in the requested format."""
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_FORMATS[params.format],
+        headers={"Content-Disposition": f'attachment; filename="movies.{params.format}"'},
+    )
@@ -1,13 +1,40 @@
 """Movie controller - API endpoints for movies and ratings."""
 
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Header, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
+from app.config import settings
+from app.controllers.common import (
+    CREATE_MOVIE_BUDGET,
+    CREATE_RATING_BUDGET,
+    DELETE_MOVIE_BUDGET,
+    GET_MOVIE_BUDGET,
+    IMPORT_MOVIES_BUDGET,
+    LIST_MOVIES_BUDGET,
+    RATING_STATS_BUDGET,
+    RATINGS_BATCH_BUDGET,
+    TOP_MOVIES_BUDGET,
+    UPDATE_MOVIE_BUDGET,
+    ExportParams,
+    MovieListParams,
+    TopMoviesParams,
+    cursor_page,
+    export_response,
+    numbered_page,
+    revalidate,
+    success,
+    top_page,
+    validated_response,
+)
+from app.instrumentation import query_budget
+from app.responses import FastJSONResponse
 from app.db.database import get_db
-from app.services import MovieService, RatingService
-from app.schemas import RatingCreate, MovieCreate, MovieUpdate
+from app.services import MovieService, RatingService, MovieImportService, MovieExportService
+from app.services.import_service import iter_line_batches
+from app.schemas import RatingCreate, RatingBatchCreate, MovieCreate, MovieUpdate
 
 router = APIRouter()
 
@@ -17,12 +44,10 @@ router = APIRouter()
 # =============================================================================
 
 @router.get("/movies")
+@query_budget(LIST_MOVIES_BUDGET)
 def get_movies(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
-    title: Optional[str] = Query(None, description="Filter by title (partial match)"),
-    release_year: Optional[int] = Query(None, ge=1800, le=2100, description="Filter by release year"),
-    genre: Optional[str] = Query(None, description="Filter by genre name"),
+    params: MovieListParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     """
@@ -33,25 +58,118 @@ def get_movies(
     - **title**: Filter by title (partial match, case-insensitive)
     - **release_year**: Filter by exact release year
     - **genre**: Filter by genre name (partial match, case-insensitive)
+    - **search**: Fuzzy title search; results are ranked by similarity and `sort` is ignored
+    - **sort**: Sort key, one of id, title, release_year (ties broken by id)
+    - **cursor**: Continue from a previous response's `next_cursor` instead of using `page`
+    - **count_mode**: exact, cached (TTL per filter set), estimated (planner statistics)
+      or none (total_items is null); defaults to the LIST_COUNT_MODE setting
+
+    Responses carry an ETag; a matching `If-None-Match` gets a 304 without running any query.
     """
     service = MovieService(db)
-    movies, total_count = service.get_movies(
-        page=page,
-        page_size=page_size,
-        title=title,
-        release_year=release_year,
-        genre=genre,
+    cache_control = settings.MOVIE_LIST_CACHE_CONTROL
+
+    if params.cursor is not None:
+        etag = service.get_movies_by_cursor_etag(**params.cursor_args())
+        not_modified = revalidate(if_none_match, etag, cache_control)
+        if not_modified is not None:
+            return not_modified
+
+        movies, next_cursor = service.get_movies_by_cursor(**params.cursor_args())
+        return validated_response(cursor_page(params, movies, next_cursor), etag, cache_control)
+
+    etag = service.get_movies_etag(**params.page_args())
+    not_modified = revalidate(if_none_match, etag, cache_control)
+    if not_modified is not None:
+        return not_modified
+
+    movies, total_count, count_mode, next_cursor = service.get_movies(**params.page_args())
+    return validated_response(
+        numbered_page(params, movies, total_count, count_mode, next_cursor), etag, cache_control
     )
 
-    return {
-        "status": "success",
-        "data": {
-            "page": page,
-            "page_size": page_size,
-            "total_items": total_count,
-            "items": movies,
-        }
-    }
+
+# =============================================================================
+# POST /movies/import - Bulk import movies from NDJSON
+# =============================================================================
+
+@router.post("/movies/import")
+@query_budget(IMPORT_MOVIES_BUDGET)
+async def import_movies(
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """
+    Import movies from an NDJSON request body, one movie per line.
+
+    Each line takes the fields of `POST /movies`; `director` (name) may replace
+    `director_id` and `genres` may list names as well as IDs. The body is read and
+    inserted in batches as it streams in. Invalid lines are reported by line number
+    and skipped; the rest of the file is still imported.
+    """
+    service = await run_in_threadpool(MovieImportService, db)
+
+    async for lines in iter_line_batches(request.stream(), service.batch_size):
+        await run_in_threadpool(service.feed, lines)
+
+    result = await run_in_threadpool(service.finish)
+
+    return success(result)
+
+
+# =============================================================================
+# GET /movies/export - Stream the catalog as NDJSON or CSV
+# =============================================================================
+
+# Budgeted by the export service on its own session, which streams rows after this returns
+@router.get("/movies/export")
+def export_movies(params: ExportParams = Depends()):
+    """
+    Stream every movie matching the filters, ordered by ID.
+
+    - **format**: ndjson (one JSON object per line) or csv (genres joined by "|")
+    - **title**, **release_year**, **genre**, **search**: Same filters as `GET /movies`
+
+    Each row carries the director name, genre names, ratings_count and average_rating.
+    Rows are streamed from a server-side cursor, so the catalog is never held in memory.
+    """
+    service = MovieExportService(export_format=params.format)
+    return export_response(params, service.stream(**params.filters()))
+
+
+# =============================================================================
+# GET /movies/top - Top-rated movies by Bayesian average
+# =============================================================================
+
+@router.get("/movies/top")
+@query_budget(TOP_MOVIES_BUDGET)
+def get_top_movies(
+    params: TopMoviesParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the best-rated movies, ranked by Bayesian average.
+
+    - **limit**: Number of movies (default: 10, max: 100)
+    - **genre**: Filter by genre name (partial match, case-insensitive)
+    - **release_year**: Filter by exact release year
+
+    Each movie's mean is pulled toward the catalog mean by TOP_RATED_PRIOR_WEIGHT
+    phantom ratings, so a single high rating cannot top the chart. The ranking is
+    precomputed and rebuilt every TOP_RATED_REFRESH_INTERVAL seconds; `refreshed_at`
+    tells how current it is.
+    """
+    service = MovieService(db)
+    cache_control = settings.MOVIE_TOP_CACHE_CONTROL
+
+    etag = service.get_top_movies_etag(**params.args())
+    not_modified = revalidate(if_none_match, etag, cache_control)
+    if not_modified is not None:
+        return not_modified
+
+    movies, refreshed_at = service.get_top_movies(**params.args())
+    return validated_response(top_page(movies, refreshed_at), etag, cache_control)
 
 
 # =============================================================================
@@ -59,22 +177,30 @@ def get_movies(
 # =============================================================================
 
 @router.get("/movies/{movie_id}")
+@query_budget(GET_MOVIE_BUDGET)
 def get_movie(
     movie_id: int,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
     """
     Get detailed information about a specific movie.
 
     - **movie_id**: The ID of the movie to retrieve
+
+    Responses carry an ETag; a matching `If-None-Match` gets a 304 without loading the movie.
     """
     service = MovieService(db)
-    movie = service.get_movie_by_id(movie_id)
+    cache_control = settings.MOVIE_DETAIL_CACHE_CONTROL
+
+    # Without a validator to compare, skip the version lookup
+    if if_none_match:
+        not_modified = revalidate(if_none_match, service.get_movie_etag(movie_id), cache_control)
+        if not_modified is not None:
+            return not_modified
 
-    return {
-        "status": "success",
-        "data": movie,
-    }
+    movie, etag = service.get_movie_by_id(movie_id)
+    return validated_response(movie, etag, cache_control)
 
 
 # =============================================================================
@@ -82,6 +208,7 @@ def get_movie(
 # =============================================================================
 
 @router.post("/movies", status_code=status.HTTP_201_CREATED)
+@query_budget(CREATE_MOVIE_BUDGET)
 def create_movie(
     movie_data: MovieCreate,
     db: Session = Depends(get_db),
@@ -98,10 +225,7 @@ def create_movie(
     service = MovieService(db)
     movie = service.create_movie(movie_data.model_dump())
 
-    return {
-        "status": "success",
-        "data": movie,
-    }
+    return success(movie)
 
 
 # =============================================================================
@@ -109,6 +233,7 @@ def create_movie(
 # =============================================================================
 
 @router.put("/movies/{movie_id}")
+@query_budget(UPDATE_MOVIE_BUDGET)
 def update_movie(
     movie_id: int,
     movie_data: MovieUpdate,
@@ -127,17 +252,15 @@ def update_movie(
     service = MovieService(db)
     movie = service.update_movie(movie_id, movie_data.model_dump(exclude_unset=True))
 
-    return {
-        "status": "success",
-        "data": movie,
-    }
+    return success(movie)
 
 
 # =============================================================================
-# API 6: DELETE /movies/{movie_id} - Delete a moviemovie_controller.py
+# API 6: DELETE /movies/{movie_id} - Delete a movie
 # =============================================================================
 
 @router.delete("/movies/{movie_id}", status_code=status.HTTP_204_NO_CONTENT)
+@query_budget(DELETE_MOVIE_BUDGET)
 def delete_movie(
     movie_id: int,
     db: Session = Depends(get_db),
@@ -160,9 +283,11 @@ def delete_movie(
 # =============================================================================
 
 @router.post("/movies/{movie_id}/ratings", status_code=status.HTTP_201_CREATED)
+@query_budget(CREATE_RATING_BUDGET)
 def create_rating(
     movie_id: int,
     rating_data: RatingCreate,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """
@@ -170,11 +295,67 @@ def create_rating(
 
     - **movie_id**: The ID of the movie to rate
     - **score**: Rating score between 1 and 10
+
+    With RATINGS_WRITE_BEHIND enabled the rating is queued and saved in the next
+    batched flush: the response is 202 without rating_id, and 503 when the buffer is full.
+    """
+    service = RatingService(db)
+
+    if settings.RATINGS_WRITE_BEHIND:
+        rating = service.enqueue_rating(movie_id=movie_id, score=rating_data.score)
+        response.status_code = status.HTTP_202_ACCEPTED
+    else:
+        rating = service.create_rating(movie_id=movie_id, score=rating_data.score)
+
+    return success(rating)
+
+
+# =============================================================================
+# GET /movies/{movie_id}/ratings/stats - Score distribution of a movie
+# =============================================================================
+
+@router.get("/movies/{movie_id}/ratings/stats")
+@query_budget(RATING_STATS_BUDGET)
+def get_rating_stats(
+    movie_id: int,
+    db: Session = Depends(get_db),
+):
+    """
+    Get the score distribution of a movie.
+
+    - **movie_id**: The ID of the movie
+
+    Returns the count of each score from 1 to 10, the average, median, percentiles
+    and standard deviation. They are computed from the movie's stored histogram,
+    which every rating write keeps current, so the cost does not grow with the
+    number of ratings.
+    """
+    service = RatingService(db)
+    stats = service.get_rating_stats(movie_id)
+
+    return FastJSONResponse(success(stats))
+
+
+# =============================================================================
+# POST /ratings:batch - Create many ratings in one call
+# =============================================================================
+
+@router.post("/ratings:batch")
+@query_budget(RATINGS_BATCH_BUDGET)
+def create_ratings_batch(
+    batch: RatingBatchCreate,
+    db: Session = Depends(get_db),
+):
+    """
+    Submit many ratings at once, e.g. from a partner feed.
+
+    - **items**: List of {movie_id, score}; each score must be between 1 and 10
+
+    Items are validated one by one: valid ones are saved in a single transaction,
+    invalid ones are reported with their own error. The response lists one result
+    per item, in request order.
     """
     service = RatingService(db)
-    rating = service.create_rating(movie_id=movie_id, score=rating_data.score)
+    result = service.create_ratings_batch([item.model_dump() for item in batch.items])
 
-    return {
-        "status": "success",
-        "data": rating,
-    }
\ No newline at end of file
+    return success(result)
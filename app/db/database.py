@@ -1,15 +1,55 @@
+import os
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.config import settings
+from app.db.pool import engine_options
 
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(settings.DATABASE_URL, **engine_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def get_async_database_url() -> str:
+    """Return the asyncpg URL, derived from DATABASE_URL unless set explicitly."""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+    return url.render_as_string(hide_password=False)
+
+
+# Async stack; connections are only opened when DB_STACK=async routes use it
+async_engine = create_async_engine(get_async_database_url(), **engine_options(async_driver=True))
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
+def _reset_pools_after_fork() -> None:
+    """
+    Give a forked worker fresh, empty pools. close=False leaves the inherited
+    sockets to the parent instead of closing connections it is still using.
+    """
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""Connection pool configuration and checkout timing."""
+
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import settings
+from app.logging_config import logger
+
+
+class CheckoutStats:
+    """Running totals of how long requests waited for a pooled connection."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.slow_count = 0
+        self.timeouts = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        """Record one checkout and log it when it crosses the slow threshold."""
+        slow = seconds * 1000 >= settings.DB_POOL_SLOW_CHECKOUT_MS
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            if slow:
+                self.slow_count += 1
+            if timed_out:
+                self.timeouts += 1
+
+        if timed_out:
+            logger.error(f"Connection pool checkout timed out after {seconds * 1000:.1f} ms")
+        elif slow:
+            logger.warning(f"Slow connection pool checkout: {seconds * 1000:.1f} ms")
+
+    def record_error(self, seconds: float, error: Exception) -> None:
+        """Record a checkout that failed for another reason than the pool timeout, e.g. a refused connect."""
+        with self._lock:
+            self.errors += 1
+        logger.error(f"Connection pool checkout failed after {seconds * 1000:.1f} ms: {error}")
+
+
+checkout_stats = CheckoutStats()
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            checkout_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        except Exception as e:
+            checkout_stats.record_error(time.perf_counter() - started, e)
+            raise
+        checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long each checkout waits."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            checkout_stats.record(time.perf_counter() - started, timed_out=True)
+            raise
+        except Exception as e:
+            checkout_stats.record_error(time.perf_counter() - started, e)
+            raise
+        checkout_stats.record(time.perf_counter() - started)
+        return connection
+
+
+def pool_sizing(async_driver: bool = False) -> tuple:
+    """
+    Return (pool_size, max_overflow) of one engine for this worker process.
+    With DB_CONNECTION_BUDGET set, the budget is split evenly across
+    WEB_CONCURRENCY workers and overflow is disabled. Each worker's share then
+    goes to the engines it uses: the sync engine alone with DB_STACK=sync, or
+    halves of it with DB_STACK=async, where the sync engine still serves the
+    sync-only routes and the background threads. The unused async engine of the
+    sync stack gets a single connection it never opens. The total is never exceeded
+    unless the budget leaves a worker fewer connections than engines in use.
+    """
+    if settings.DB_CONNECTION_BUDGET > 0:
+        workers = max(1, settings.WEB_CONCURRENCY)
+        share = max(1, settings.DB_CONNECTION_BUDGET // workers)
+        if settings.DB_STACK != "async":
+            return (1 if async_driver else share), 0
+        # The async engine serves the request traffic, so it gets the odd connection
+        return max(1, (share + 1) // 2 if async_driver else share // 2), 0
+    return settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+
+
+def engine_options(async_driver: bool = False) -> dict:
+    """Build create_engine/create_async_engine keyword arguments from settings."""
+    pool_size, max_overflow = pool_sizing(async_driver)
+
+    # Session-level server timeouts; 0 keeps the server default (disabled)
+    server_settings = {}
+    if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+        server_settings["statement_timeout"] = str(settings.DB_STATEMENT_TIMEOUT_MS)
+    if settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS > 0:
+        server_settings["idle_in_transaction_session_timeout"] = str(
+            settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS
+        )
+
+    if async_driver:
+        connect_args = {"server_settings": server_settings} if server_settings else {}
+    else:
+        connect_args = {
+            "options": " ".join(f"-c {name}={value}" for name, value in server_settings.items())
+        } if server_settings else {}
+
+    return {
+        "poolclass": TimedAsyncAdaptedQueuePool if async_driver else TimedQueuePool,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "connect_args": connect_args,
+    }
@@ -0,0 +1,46 @@
+"""Unit of work: one transaction per business operation."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+class UnitOfWork:
+    """
+    Groups the changes of one operation into a single transaction.
+
+    Repositories only add and flush inside the block; the block commits once
+    when it exits normally and rolls back when it raises, so a failure never
+    leaves a half-written entity behind.
+
+        with UnitOfWork(db):
+            movie = movie_repo.create(data, genres)
+            response = build_response(movie)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            self.db.commit()
+        else:
+            self.db.rollback()
+
+
+class AsyncUnitOfWork:
+    """Async counterpart of UnitOfWork for an AsyncSession."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def __aenter__(self) -> "AsyncUnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback) -> None:
+        if exc_type is None:
+            await self.db.commit()
+        else:
+            await self.db.rollback()
@@ -6,6 +6,7 @@ from app.exceptions.http_exceptions import (
     ValidationException,
     BadRequestException,
     ConflictException,
+    ServiceUnavailableException,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "ValidationException",
     "BadRequestException",
     "ConflictException",
+    "ServiceUnavailableException",
 ]
\ No newline at end of file
@@ -28,4 +28,11 @@ class ConflictException(AppException):
     """Raised when there's a conflict (e.g., duplicate entry)."""
 
     def __init__(self, message: str = "Conflict"):
-        super().__init__(message=message, code=409)
\ No newline at end of file
+        super().__init__(message=message, code=409)
+
+
+class ServiceUnavailableException(AppException):
+    """Raised when the service is temporarily overloaded and the client should retry."""
+
+    def __init__(self, message: str = "Service unavailable"):
+        super().__init__(message=message, code=503)
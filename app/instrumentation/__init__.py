@@ -0,0 +1,49 @@
+"""Request instrumentation."""
+
+from app.instrumentation.metrics import (
+    MetricsMiddleware,
+    observe_query,
+    register_cache_metrics,
+    register_pool_metrics,
+    registry,
+    track_operations,
+)
+from app.instrumentation.query_budget import (
+    QueryBudget,
+    QueryBudgetExceeded,
+    allow_statements,
+    connection_budget,
+    query_budget,
+    query_budgets_enabled,
+    statement_shape,
+    watch_statements,
+)
+from app.instrumentation.timing import (
+    RequestTiming,
+    TimingMiddleware,
+    current_timing,
+    instrument_engine,
+    record_serialization,
+)
+
+__all__ = [
+    "MetricsMiddleware",
+    "observe_query",
+    "register_cache_metrics",
+    "register_pool_metrics",
+    "registry",
+    "track_operations",
+    "QueryBudget",
+    "QueryBudgetExceeded",
+    "allow_statements",
+    "connection_budget",
+    "query_budget",
+    "query_budgets_enabled",
+    "statement_shape",
+    "watch_statements",
+    "RequestTiming",
+    "TimingMiddleware",
+    "current_timing",
+    "instrument_engine",
+    "record_serialization",
+]
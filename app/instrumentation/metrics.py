@@ -0,0 +1,342 @@
+"""Process-wide metrics in the Prometheus text exposition format."""
+
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# Upper bounds in seconds; one more bucket catches everything slower
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Label of statements sent outside any instrumented repository method
+UNTRACKED_OPERATION = "other"
+
+
+class _Sharded:
+    """
+    Base of metrics whose updates go to a per-thread shard.
+
+    Each thread only writes its own shard, so recording takes no lock and never
+    contends with other threads; a scrape sums the shards. The lock is only taken
+    when a thread records its first value.
+    """
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def _format_labels(self, values: Tuple, extra: str = "") -> str:
+        pairs = [f'{label}="{_escape(value)}"' for label, value in zip(self.labels, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram(_Sharded):
+    """Histogram family keyed by label values."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, label_values: Tuple, value: float) -> None:
+        """Record one value under the given label values."""
+        shard = self._shard()
+        series = shard.get(label_values)
+        if series is None:
+            # Per-bucket counts (not cumulative), then sum and count
+            series = shard[label_values] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def render(self) -> List[str]:
+        totals: Dict[Tuple, list] = {}
+        for shard in list(self._shards):
+            for label_values, series in list(shard.items()):
+                total = totals.setdefault(label_values, [0] * len(series))
+                for index, value in enumerate(series):
+                    total[index] += value
+
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for label_values, series in sorted(totals.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound}"'
+                lines.append(f"{self.name}_bucket{self._format_labels(label_values, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._format_labels(label_values)} {series[-2]}")
+            lines.append(f"{self.name}_count{self._format_labels(label_values)} {series[-1]}")
+        return lines
+
+
+class Gauge(_Sharded):
+    """Gauge family moved up and down by the code it measures."""
+
+    def inc(self, label_values: Tuple = (), amount: float = 1) -> None:
+        shard = self._shard()
+        shard[label_values] = shard.get(label_values, 0) + amount
+
+    def dec(self, label_values: Tuple = (), amount: float = 1) -> None:
+        self.inc(label_values, -amount)
+
+    def render(self) -> List[str]:
+        totals: Dict[Tuple, float] = {}
+        for shard in list(self._shards):
+            for label_values, value in list(shard.items()):
+                totals[label_values] = totals.get(label_values, 0) + value
+
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge"]
+        if not totals and not self.labels:
+            totals[()] = 0
+        for label_values, value in sorted(totals.items()):
+            lines.append(f"{self.name}{self._format_labels(label_values)} {value}")
+        return lines
+
+
+class Collected:
+    """Gauge or counter family read at scrape time from a callback returning {label_values: value}."""
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str],
+        collect: Callable[[], Dict[Tuple, float]],
+        kind: str = "gauge",
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self.collect = collect
+        self.kind = kind
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for label_values, value in sorted(self.collect().items()):
+            pairs = ",".join(f'{label}="{_escape(v)}"' for label, v in zip(self.labels, label_values))
+            lines.append(f"{self.name}{{{pairs}}} {value}" if pairs else f"{self.name} {value}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ordered set of metric families rendered together."""
+
+    def __init__(self):
+        self.metrics: list = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render every family in the Prometheus text format (version 0.0.4)."""
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight",
+    "HTTP requests being handled by this worker.",
+))
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status.",
+    labels=("method", "route", "status"),
+))
+db_query_duration = registry.register(Histogram(
+    "db_query_duration_seconds",
+    "SQL statement latency by the repository method that sent it.",
+    labels=("operation",),
+))
+
+
+def register_pool_metrics(engines: Dict[str, object], checkout_stats) -> None:
+    """Expose the connection pools of the given {label: engine} and the shared checkout wait totals."""
+    def connections() -> Dict[Tuple, float]:
+        values = {}
+        for label, engine in engines.items():
+            pool = engine.pool
+            values[(label, "checked_out")] = pool.checkedout()
+            values[(label, "idle")] = pool.checkedin()
+            # QueuePool counts overflow from -pool_size; only opened overflow connections matter
+            values[(label, "overflow")] = max(pool.overflow(), 0)
+            values[(label, "size")] = pool.size()
+        return values
+
+    registry.register(Collected(
+        "db_pool_connections",
+        "Pooled connections per engine by state.",
+        ("engine", "state"),
+        connections,
+    ))
+    registry.register(Collected(
+        "db_pool_checkouts_total",
+        "Connection checkouts from the pools.",
+        (),
+        lambda: {(): checkout_stats.count},
+        kind="counter",
+    ))
+    registry.register(Collected(
+        "db_pool_checkout_wait_seconds_total",
+        "Total time spent waiting for a pooled connection.",
+        (),
+        lambda: {(): round(checkout_stats.total_seconds, 6)},
+        kind="counter",
+    ))
+    registry.register(Collected(
+        "db_pool_checkout_wait_seconds_max",
+        "Longest wait for a pooled connection since start.",
+        (),
+        lambda: {(): round(checkout_stats.max_seconds, 6)},
+    ))
+    registry.register(Collected(
+        "db_pool_checkout_timeouts_total",
+        "Checkouts that gave up after DB_POOL_TIMEOUT.",
+        (),
+        lambda: {(): checkout_stats.timeouts},
+        kind="counter",
+    ))
+    registry.register(Collected(
+        "db_pool_checkout_errors_total",
+        "Checkouts that failed for another reason than the pool timeout, e.g. a refused connect.",
+        (),
+        lambda: {(): checkout_stats.errors},
+        kind="counter",
+    ))
+
+
+def register_cache_metrics(caches: Dict[str, Callable[[], dict]]) -> None:
+    """Expose hit, miss and eviction counters of the given {label: stats callable} caches."""
+    for field in ("hits", "misses", "evictions"):
+        registry.register(Collected(
+            f"cache_{field}_total",
+            f"Cache {field} per cache.",
+            ("cache",),
+            functools.partial(_cache_field, caches, field),
+            kind="counter",
+        ))
+
+
+def _cache_field(caches: Dict[str, Callable[[], dict]], field: str) -> Dict[Tuple, float]:
+    return {(label,): stats()[field] for label, stats in caches.items()}
+
+
+# =============================================================================
+# Repository operation labels
+# =============================================================================
+
+_current_operation: ContextVar[str] = ContextVar("repository_operation", default=UNTRACKED_OPERATION)
+
+
+def observe_query(seconds: float) -> None:
+    """Record one SQL statement under the repository method currently running."""
+    db_query_duration.observe((_current_operation.get(),), seconds)
+
+
+def track_operations(cls):
+    """
+    Class decorator labelling the SQL sent by each public method as "Class.method".
+    Generator methods are left alone, since a label set across their yields would
+    leak into the caller; their statements count as "other".
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(method):
+            continue
+        if inspect.isgeneratorfunction(method) or inspect.isasyncgenfunction(method):
+            continue
+        setattr(cls, name, _labelled(method, f"{cls.__name__}.{name}"))
+    return cls
+
+
+def _labelled(method: Callable, operation: str) -> Callable:
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(*args, **kwargs):
+            token = _current_operation.set(operation)
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                _current_operation.reset(token)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        token = _current_operation.set(operation)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _current_operation.reset(token)
+    return wrapper
+
+
+# =============================================================================
+# Middleware
+# =============================================================================
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording in-flight requests and latency per route.
+    Routes are labelled by their path template, so IDs do not multiply the series;
+    requests that match no route share the "unmatched" label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            route = scope.get("route")
+            http_request_duration.observe(
+                (scope["method"], getattr(route, "path", "unmatched"), str(status_code)),
+                time.perf_counter() - started,
+            )
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
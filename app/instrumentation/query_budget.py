@@ -0,0 +1,181 @@
+"""Statement budgets that catch N+1 queries and query-count regressions."""
+
+import functools
+import inspect
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from app.config import settings
+from app.logging_config import logger
+
+# Runs of bind placeholders (psycopg2 %(name)s, asyncpg $1 with its optional cast, qmark ?)
+# collapse to one, so IN lists and multi-row VALUES of any length share a shape
+_PLACEHOLDER = r"(?:%\(\w+\)s|\$\d+(?:::\w+(?:\[\])?)?|\?)"
+_PLACEHOLDER_RUN = re.compile(rf"{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised in strict mode when a block sends more statements than its budget allows."""
+
+
+class QueryBudget:
+    """
+    Counts the SQL statements sent inside a block, by the current task or thread.
+
+    On exit the block is checked against limit (total statements) and repeat_limit
+    (times one statement shape may run, which is how an N+1 lazy load shows up).
+    A violation raises QueryBudgetExceeded when strict, and is logged as a warning
+    otherwise. Budgets nest; each statement counts toward every open budget.
+
+        with QueryBudget(2, name="create movie", strict=True) as budget:
+            service.create_movie(data)
+
+    Statements are only seen on engines passed to watch_statements().
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int],
+        name: str = "block",
+        repeat_limit: Optional[int] = None,
+        strict: Optional[bool] = None,
+    ):
+        self.limit = limit
+        self.name = name
+        self.repeat_limit = settings.QUERY_BUDGET_REPEAT_LIMIT if repeat_limit is None else repeat_limit
+        self.strict = settings.QUERY_BUDGET_STRICT if strict is None else strict
+        self.statements: List[str] = []
+        self._token = None
+
+    def __enter__(self) -> "QueryBudget":
+        self._token = _active_budgets.set(_active_budgets.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        _active_budgets.reset(self._token)
+        # An error from the block itself matters more than its statement count
+        if exc_type is None:
+            self.check()
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def violations(self) -> List[str]:
+        """Describe every way the recorded statements break the budget."""
+        problems = []
+        if self.limit is not None and self.count > self.limit:
+            problems.append(f"{self.count} statements (budget {self.limit})")
+
+        if self.repeat_limit and self.statements:
+            shape, repeats = Counter(map(statement_shape, self.statements)).most_common(1)[0]
+            if repeats > self.repeat_limit:
+                problems.append(f"same statement {repeats} times (limit {self.repeat_limit}): {shape[:120]}")
+
+        return problems
+
+    def check(self) -> None:
+        """Raise or warn if the budget was broken."""
+        problems = self.violations()
+        if not problems:
+            return
+
+        message = f"Query budget exceeded in {self.name}: {'; '.join(problems)}"
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+_active_budgets: ContextVar[Tuple[QueryBudget, ...]] = ContextVar("query_budgets", default=())
+
+
+def query_budgets_enabled() -> bool:
+    """Budgets are checked when QUERY_BUDGET_ENABLED is set, and by default in DEBUG mode."""
+    if settings.QUERY_BUDGET_ENABLED is not None:
+        return settings.QUERY_BUDGET_ENABLED
+    return settings.DEBUG
+
+
+def query_budget(limit: Optional[int], repeat_limit: Optional[int] = None) -> Callable:
+    """
+    Decorator declaring the statement budget of an endpoint or service call; see QueryBudget.
+    limit=None declares no total (for work that scales with the input) and repeat_limit=0
+    turns off the repeat check. When budgets are disabled the function is returned unchanged.
+    """
+    def decorator(func: Callable) -> Callable:
+        if not query_budgets_enabled():
+            return func
+
+        name = func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with QueryBudget(limit, name=name, repeat_limit=repeat_limit):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with QueryBudget(limit, name=name, repeat_limit=repeat_limit):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def allow_statements(count: int) -> None:
+    """
+    Raise every open budget by count statements and one more repeat of each shape, for
+    work that runs the same few statements once per step (e.g. per committed import batch).
+    Budgets that declare no total only get the extra repeat.
+    """
+    for budget in _active_budgets.get():
+        if budget.limit is not None:
+            budget.limit += count
+        if budget.repeat_limit:
+            budget.repeat_limit += 1
+
+
+@contextmanager
+def connection_budget(connection: Connection, budget: QueryBudget) -> Iterator[QueryBudget]:
+    """
+    Count the statements sent on one connection toward budget, whichever task or thread
+    sends them, and check it when the block ends without an error. For work that outlives
+    its request, such as a streamed export, where the budgets of the current context do not
+    follow the statements. A no-op when budgets are disabled.
+    """
+    if not query_budgets_enabled():
+        yield budget
+        return
+
+    def before_cursor_execute(_conn, _cursor, statement, _parameters, _context, _executemany):
+        budget.statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield budget
+    finally:
+        event.remove(connection, "before_cursor_execute", before_cursor_execute)
+    budget.check()
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so executions differing only in parameters compare equal."""
+    return _PLACEHOLDER_RUN.sub("?", _WHITESPACE.sub(" ", statement).strip())
+
+
+def watch_statements(engine: Engine) -> None:
+    """Count statements sent through engine toward the open budgets (pass an async engine's sync_engine)."""
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(_conn, _cursor, statement, _parameters, _context, _executemany):
+        budgets = _active_budgets.get()
+        for budget in budgets:
+            budget.statements.append(statement)
@@ -0,0 +1,140 @@
+"""Per-request timing: query count, DB time, serialization time and the Server-Timing header."""
+
+import random
+import time
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.logging_config import logger
+
+
+class RequestTiming:
+    """Timings accumulated while one request is handled."""
+
+    __slots__ = ("started", "queries", "db_seconds", "serialize_seconds", "total_seconds")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.total_seconds = 0.0
+
+    @property
+    def app_seconds(self) -> float:
+        """Time spent in application code: everything that is neither SQL nor serialization."""
+        return max(self.total_seconds - self.db_seconds - self.serialize_seconds, 0.0)
+
+    def finish(self) -> None:
+        self.total_seconds = time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Render the Server-Timing header value."""
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.queries} queries", '
+            f"app;dur={self.app_seconds * 1000:.2f}, "
+            f"ser;dur={self.serialize_seconds * 1000:.2f}, "
+            f"total;dur={self.total_seconds * 1000:.2f}"
+        )
+
+
+# The timing of the request being handled; copied into the threadpool running sync
+# endpoints, where the shared object is updated in place
+_current_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Return the timing of the request being handled, if any."""
+    return _current_timing.get()
+
+
+def record_serialization(seconds: float) -> None:
+    """Add response rendering time to the current request."""
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.serialize_seconds += seconds
+
+
+def instrument_engine(engine: Engine, on_query: Optional[Callable[[float], None]] = None) -> None:
+    """
+    Time every statement sent through engine (for the async engine, pass its sync_engine).
+    Durations go to the current request, if any, and to on_query; without on_query,
+    statements outside a request, e.g. from background threads, are not timed.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+        if on_query is not None or _current_timing.get() is not None:
+            conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany):
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        seconds = time.perf_counter() - started.pop()
+
+        timing = _current_timing.get()
+        if timing is not None:
+            timing.queries += 1
+            timing.db_seconds += seconds
+        if on_query is not None:
+            on_query(seconds)
+
+
+class TimingMiddleware:
+    """
+    ASGI middleware timing each HTTP request.
+
+    The totals go out as a Server-Timing header when the response starts, and as
+    one key=value log line when it ends, for a sample_rate fraction of requests and
+    for every request slower than slow_ms. The work per request is a few counter
+    updates, so it can stay on in production. Statements run while a streamed body
+    is being sent count toward the log line but not the header.
+    """
+
+    def __init__(self, app, sample_rate: float = 0.01, slow_ms: float = 500, header: bool = True):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.header = header
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current_timing.set(timing)
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.header:
+                    timing.finish()
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timing.server_timing().encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_timing.reset(token)
+            timing.finish()
+            self._log(scope, status_code, timing)
+
+    def _log(self, scope, status_code: int, timing: RequestTiming) -> None:
+        total_ms = timing.total_seconds * 1000
+        if total_ms < self.slow_ms and random.random() >= self.sample_rate:
+            return
+        logger.info(
+            f"request method={scope['method']} path={scope['path']} status={status_code} "
+            f"total_ms={total_ms:.2f} db_ms={timing.db_seconds * 1000:.2f} "
+            f"queries={timing.queries} app_ms={timing.app_seconds * 1000:.2f} "
+            f"serialize_ms={timing.serialize_seconds * 1000:.2f}"
+        )
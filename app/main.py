@@ -1,16 +1,93 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from app.cache import movie_detail_cache, movie_list_cache, genre_dictionary, director_cache
+from app.config import settings
+from app.db.database import engine, async_engine
+from app.db.pool import checkout_stats
 from app.exceptions import AppException
-from app.controllers import movie_router
+from app.logging_config import logger
+from app.controllers import movie_router, async_movie_router
+from app.instrumentation import (
+    MetricsMiddleware,
+    TimingMiddleware,
+    instrument_engine,
+    observe_query,
+    query_budgets_enabled,
+    register_cache_metrics,
+    register_pool_metrics,
+    registry,
+    watch_statements,
+)
+from app.responses import FastJSONResponse
+from app.services.rating_buffer import rating_buffer
+from app.services.top_rated_refresher import top_rated_refresher
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Run the write-behind rating flusher and the top-rated refresher for the lifetime of the worker."""
+    # Load the genre dictionary before the first request, off the event loop
+    try:
+        if settings.DB_STACK == "async":
+            await genre_dictionary.refresh_async()
+        else:
+            await run_in_threadpool(genre_dictionary.all_genres)
+    except Exception as e:
+        logger.warning(f"Genre dictionary preload failed, loading on first use: {e}")
+    if settings.RATINGS_WRITE_BEHIND:
+        rating_buffer.start()
+    if settings.TOP_RATED_REFRESH_ENABLED:
+        top_rated_refresher.start()
+    yield
+    top_rated_refresher.stop()
+    # Flush ratings that were acknowledged but not yet written
+    rating_buffer.stop()
+
 
 app = FastAPI(
     title="Movie Rating System",
     description="Backend API for managing movies and ratings",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
+# =============================================================================
+# Instrumentation
+# =============================================================================
+
+if settings.TIMING_ENABLED or settings.METRICS_ENABLED:
+    on_query = observe_query if settings.METRICS_ENABLED else None
+    instrument_engine(engine, on_query=on_query)
+    instrument_engine(async_engine.sync_engine, on_query=on_query)
+
+if query_budgets_enabled():
+    watch_statements(engine)
+    watch_statements(async_engine.sync_engine)
+
+if settings.TIMING_ENABLED:
+    app.add_middleware(
+        TimingMiddleware,
+        sample_rate=settings.TIMING_LOG_SAMPLE_RATE,
+        slow_ms=settings.TIMING_SLOW_REQUEST_MS,
+        header=settings.TIMING_HEADER,
+    )
+
+if settings.METRICS_ENABLED:
+    register_pool_metrics({"sync": engine, "async": async_engine.sync_engine}, checkout_stats)
+    register_cache_metrics({
+        "movie_detail": movie_detail_cache.stats,
+        "movie_list": movie_list_cache.stats,
+        "directors": director_cache.stats,
+    })
+    app.add_middleware(MetricsMiddleware)
+
+
 # =============================================================================
 # Exception Handlers
 # =============================================================================
@@ -49,6 +126,12 @@ async def general_exception_handler(_request: Request, _exc: Exception):
 # Routers
 # =============================================================================
 
+# With DB_STACK=async the async routes are registered first and take
+# precedence; routes only the sync stack provides stay reachable. They mirror
+# the sync routes one-to-one, so the OpenAPI schema is documented once.
+if settings.DB_STACK == "async":
+    app.include_router(async_movie_router, prefix="/api/v1", include_in_schema=False)
+
 app.include_router(movie_router, prefix="/api/v1", tags=["Movies"])
 
 
@@ -65,4 +148,34 @@ def root():
 @app.get("/health")
 def health_check():
     """Health check endpoint."""
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    """Cache hit/miss/eviction counters for this worker process."""
+    return {
+        "movie_detail": movie_detail_cache.stats(),
+        "movie_list": movie_list_cache.stats(),
+        "genres": genre_dictionary.stats(),
+        "directors": director_cache.stats(),
+    }
+
+
+@app.get("/ratings/buffer/stats")
+def rating_buffer_stats():
+    """Write-behind rating buffer flush latency, batch sizes and queue depth for this worker process."""
+    return rating_buffer.stats()
+
+
+@app.get("/top-rated/stats")
+def top_rated_stats():
+    """Top-rated ranking rebuild counters for this worker process."""
+    return top_rated_refresher.stats()
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        """Route latency, SQL per repository method, pool and cache metrics in the Prometheus text format."""
+        return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
@@ -4,6 +4,8 @@ from app.models.genre import Genre
 from app.models.movie_genre import movie_genres
 from app.models.movie import Movie
 from app.models.movie_rating import MovieRating
+from app.models.movie_top_rating import MovieTopRating
+from app.models.movie_score_count import MovieScoreCount
 
 __all__ = [
     "BaseModel",
@@ -12,4 +14,6 @@ __all__ = [
     "movie_genres",
     "Movie",
     "MovieRating",
+    "MovieTopRating",
+    "MovieScoreCount",
 ]
\ No newline at end of file
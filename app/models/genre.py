@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text
+from sqlalchemy import Column, String, Text, Index
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -14,4 +14,14 @@ class Genre(BaseModel):
         "Movie",
         secondary="movie_genres",
         back_populates="genres"
+    )
+
+    # Trigram index serving ILIKE '%...%' on genre names
+    __table_args__ = (
+        Index(
+            "ix_genres_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
     )
\ No newline at end of file
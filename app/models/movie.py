@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, BigInteger, Text, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -11,6 +11,10 @@ class Movie(BaseModel):
     cast = Column(Text, nullable=True)
     description = Column(Text, nullable=True)
 
+    # Denormalized rating aggregates, maintained on every rating write
+    ratings_count = Column(Integer, nullable=False, default=0, server_default="0")
+    ratings_sum = Column(BigInteger, nullable=False, default=0, server_default="0")
+
     # Foreign Key to Director
     director_id = Column(Integer, ForeignKey("directors.id"), nullable=True)
 
@@ -23,8 +27,28 @@ class Movie(BaseModel):
         back_populates="movies"
     )
 
+    # Ratings are removed by the ON DELETE CASCADE foreign key, so deleting
+    # a movie never has to load its rating rows
     ratings = relationship(
         "MovieRating",
         back_populates="movie",
-        cascade="all, delete-orphan"
-    )
\ No newline at end of file
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    # Fetch server-generated columns (id, created_at, updated_at) with RETURNING
+    # on INSERT and UPDATE instead of a refresh afterwards
+    __mapper_args__ = {"eager_defaults": True}
+
+    __table_args__ = (
+        # Composite (sort_key, id) indexes backing keyset pagination
+        Index("ix_movies_title_id", "title", "id"),
+        Index("ix_movies_release_year_id", func.coalesce(release_year, 0), "id"),
+        # Trigram index serving ILIKE '%...%' and similarity search on titles
+        Index(
+            "ix_movies_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, Table
+from sqlalchemy import Column, Integer, ForeignKey, Index, Table
 from app.db.database import Base
 
 # Bridge table for Many-to-Many relationship between Movie and Genre
@@ -6,5 +6,7 @@ movie_genres = Table(
     "movie_genres",
     Base.metadata,
     Column("movie_id", Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True),
-    Column("genre_id", Integer, ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True)
+    Column("genre_id", Integer, ForeignKey("genres.id", ondelete="CASCADE"), primary_key=True),
+    # The primary key leads with movie_id; this serves genre_id IN (...) filters
+    Index("ix_movie_genres_genre_id_movie_id", "genre_id", "movie_id"),
 )
\ No newline at end of file
@@ -12,7 +12,7 @@ class MovieRating(Base):
     rated_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Foreign Key to Movie
-    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False)
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), nullable=False, index=True)
 
     # Relationship
     movie = relationship("Movie", back_populates="ratings")
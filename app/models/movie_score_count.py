@@ -0,0 +1,20 @@
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, SmallInteger
+from app.db.database import Base
+
+
+class MovieScoreCount(Base):
+    """
+    One bar of a movie's score histogram: how many ratings gave it a score.
+    Kept in step with movie_ratings by every rating write, so a movie's whole
+    distribution is at most ten rows.
+    """
+
+    __tablename__ = "movie_score_counts"
+
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    score = Column(SmallInteger, primary_key=True)
+    count = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("score >= 1 AND score <= 10", name="check_score_count_range"),
+    )
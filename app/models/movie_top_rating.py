@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Index, Integer
+from sqlalchemy.sql import func
+from app.db.database import Base
+
+
+class MovieTopRating(Base):
+    """
+    Precomputed row of the top-rated ranking, one per movie with enough ratings.
+    The table is rebuilt as a whole by the top-rated refresher, never per request.
+    """
+
+    __tablename__ = "movie_top_ratings"
+
+    movie_id = Column(Integer, ForeignKey("movies.id", ondelete="CASCADE"), primary_key=True)
+    release_year = Column(Integer, nullable=True)
+    ratings_count = Column(Integer, nullable=False)
+    ratings_sum = Column(BigInteger, nullable=False)
+
+    # Bayesian average: (ratings_sum + prior_mean * prior_weight) / (ratings_count + prior_weight)
+    score = Column(Float, nullable=False)
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_movie_top_ratings_score", score.desc(), movie_id),
+        Index("ix_movie_top_ratings_release_year_score", release_year, score.desc(), movie_id),
+    )
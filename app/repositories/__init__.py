@@ -5,6 +5,12 @@ from app.repositories.movie_repository import MovieRepository
 from app.repositories.rating_repository import RatingRepository
 from app.repositories.director_repository import DirectorRepository
 from app.repositories.genre_repository import GenreRepository
+from app.repositories.top_rated_repository import TopRatedRepository
+from app.repositories.async_movie_repository import AsyncMovieRepository
+from app.repositories.async_rating_repository import AsyncRatingRepository
+from app.repositories.async_director_repository import AsyncDirectorRepository
+from app.repositories.async_genre_repository import AsyncGenreRepository
+from app.repositories.async_top_rated_repository import AsyncTopRatedRepository
 
 __all__ = [
     "BaseRepository",
@@ -12,4 +18,10 @@ __all__ = [
     "RatingRepository",
     "DirectorRepository",
     "GenreRepository",
+    "TopRatedRepository",
+    "AsyncMovieRepository",
+    "AsyncRatingRepository",
+    "AsyncDirectorRepository",
+    "AsyncGenreRepository",
+    "AsyncTopRatedRepository",
 ]
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""Async director repository for database operations."""
+
+from typing import Dict, Iterable, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import director_cache
+from app.instrumentation import track_operations
+from app.models import Director
+from app.repositories.director_repository import DIRECTOR_RECORD_COLUMNS, to_director_record
+
+
+@track_operations
+class AsyncDirectorRepository:
+    """Async repository for director-related database operations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_record(self, director_id: int) -> Optional[dict]:
+        """Get a director's record (id, name, birth_year, description), read through the cache."""
+        return (await self.get_records([director_id])).get(director_id)
+
+    async def get_records(self, director_ids: Iterable[int]) -> Dict[int, dict]:
+        """
+        Get director records keyed by ID, read through the cache.
+        Misses are loaded with a single IN query; unknown IDs are left out.
+        """
+        director_ids = {director_id for director_id in director_ids if director_id is not None}
+        records = director_cache.get_many(director_ids)
+
+        missing = director_ids - records.keys()
+        if missing:
+            rows = (await self.db.execute(
+                select(*DIRECTOR_RECORD_COLUMNS).where(Director.id.in_(missing))
+            )).all()
+            for row in rows:
+                record = to_director_record(row)
+                director_cache.set(record)
+                records[record["id"]] = record
+
+        return records
+
+    async def exists(self, director_id: int) -> bool:
+        """Check if a director exists by ID."""
+        return await self.get_record(director_id) is not None
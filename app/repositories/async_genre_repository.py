@@ -0,0 +1,29 @@
+"""Async genre repository for database operations."""
+
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import genre_dictionary
+from app.instrumentation import track_operations
+from app.models import Genre
+
+
+@track_operations
+class AsyncGenreRepository:
+    """
+    Async repository for genre-related database operations.
+    Reads are served from the process-wide genre dictionary instead of the database.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_ids(self, genre_ids: List[int]) -> List[Genre]:
+        """Get multiple genres by their IDs, attached to this session without a query."""
+        await genre_dictionary.refresh_async()
+        return [await self.db.merge(genre, load=False) for genre in genre_dictionary.get_many(genre_ids)]
+
+    async def all_exist(self, genre_ids: List[int]) -> bool:
+        """Check if all given genre IDs exist."""
+        await genre_dictionary.refresh_async()
+        return genre_dictionary.all_exist(genre_ids)
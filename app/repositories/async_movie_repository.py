@@ -0,0 +1,191 @@
+"""Async movie repository for database operations."""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Optional, List, Set, Tuple
+from sqlalchemy import Row, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.cache import genre_dictionary
+from app.instrumentation import track_operations
+from app.models import Movie, Genre
+from app.repositories.movie_repository import (
+    MovieRepository,
+    apply_movie_changes,
+    export_select,
+    keyset_ids_select,
+    movies_by_ids_select,
+    order_by_ids,
+    page_ids_select,
+    version_select,
+)
+
+
+@track_operations
+class AsyncMovieRepository:
+    """Async repository for movie-related database operations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_movies_paginated(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+        count_mode: str = "exact",
+        search: Optional[str] = None,
+    ) -> Tuple[List[Movie], Optional[int], str]:
+        """
+        Get movies with pagination and optional filters.
+        Returns tuple of (movies, total_count, count_mode_used).
+        """
+        await genre_dictionary.refresh_async()
+        total_count, count_mode = await self.count_movies(
+            title=title,
+            release_year=release_year,
+            genre=genre,
+            mode=count_mode,
+            search=search,
+        )
+
+        movie_ids = (await self.db.scalars(
+            page_ids_select(page, page_size, title, release_year, genre, sort, search)
+        )).all()
+
+        return await self.get_by_ids(movie_ids), total_count, count_mode
+
+    async def count_movies(
+        self,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        mode: str = "exact",
+        search: Optional[str] = None,
+    ) -> Tuple[Optional[int], str]:
+        """
+        Count movies matching the filters using the given strategy.
+        Returns tuple of (count, mode_used).
+        """
+        await genre_dictionary.refresh_async()
+        # The count strategies and their shared cache live in the sync repository;
+        # run_sync drives them over this session's async connection
+        return await self.db.run_sync(
+            lambda session: MovieRepository(session).count_movies(
+                title=title,
+                release_year=release_year,
+                genre=genre,
+                mode=mode,
+                search=search,
+            )
+        )
+
+    async def get_movies_after(
+        self,
+        after: Optional[Tuple[Any, int]] = None,
+        limit: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+    ) -> List[Movie]:
+        """Get movies positioned after the given (sort_key, id) pair (keyset pagination)."""
+        await genre_dictionary.refresh_async()
+        movie_ids = (await self.db.scalars(
+            keyset_ids_select(after, limit, title, release_year, genre, sort)
+        )).all()
+
+        return await self.get_by_ids(movie_ids)
+
+    async def stream_export(
+        self,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        search: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Row]:
+        """Yield flat export rows for the matching movies from a server-side cursor, in ID order."""
+        await genre_dictionary.refresh_async()
+        result = await self.db.stream(
+            export_select(title, release_year, genre, search).execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    async def get_by_ids(self, movie_ids: List[int]) -> List[Movie]:
+        """Get movies by IDs with genres loaded, preserving the order of movie_ids."""
+        if not movie_ids:
+            return []
+
+        movies = (await self.db.scalars(movies_by_ids_select(movie_ids))).all()
+        return order_by_ids(movies, movie_ids)
+
+    async def get_by_id(self, movie_id: int) -> Optional[Movie]:
+        """Get a movie by ID with director and genres loaded."""
+        # Genres are joined as on the sync stack, so both send one statement
+        statement = select(Movie).options(
+            joinedload(Movie.director),
+            joinedload(Movie.genres)
+        ).where(Movie.id == movie_id)
+
+        return (await self.db.scalars(statement)).unique().first()
+
+    async def get_version(self, movie_id: int) -> Optional[Tuple[Optional[datetime], int]]:
+        """Return (updated_at, ratings_count) of a movie without loading it, or None if missing."""
+        row = (await self.db.execute(version_select(movie_id))).first()
+        return tuple(row) if row is not None else None
+
+    async def exists(self, movie_id: int) -> bool:
+        """Check if a movie exists by ID."""
+        result = await self.db.scalar(select(Movie.id).where(Movie.id == movie_id))
+        return result is not None
+
+    async def existing_ids(self, movie_ids: Iterable[int]) -> Set[int]:
+        """Return which of the given movie IDs exist, using a single IN query."""
+        movie_ids = set(movie_ids)
+        if not movie_ids:
+            return set()
+        result = await self.db.scalars(select(Movie.id).where(Movie.id.in_(movie_ids)))
+        return set(result.all())
+
+    async def create(self, data: dict, genres: List[Genre]) -> Movie:
+        """
+        Add a new movie with its genres and flush it (no commit).
+        Server-set columns come back with the INSERT, so the movie needs no refresh.
+        """
+        movie = Movie(
+            title=data["title"],
+            director_id=data["director_id"],
+            release_year=data.get("release_year"),
+            cast=data.get("cast"),
+            genres=genres,
+        )
+        self.db.add(movie)
+        await self.db.flush()
+        return movie
+
+    async def update(self, movie: Movie, data: dict, genres: Optional[List[Genre]] = None) -> Movie:
+        """
+        Apply changes to a movie and flush them (no commit).
+        Genres are replaced only when a list is given; the movie must have them loaded.
+        """
+        apply_movie_changes(movie, data, genres)
+        await self.db.flush()
+        return movie
+
+    async def delete_by_id(self, movie_id: int) -> bool:
+        """
+        Delete a movie with a single DELETE ... RETURNING (no commit).
+        Returns False if no such movie existed.
+        """
+        deleted_id = await self.db.scalar(
+            delete(Movie)
+            .where(Movie.id == movie_id)
+            .returning(Movie.id)
+            .execution_options(synchronize_session=False)
+        )
+        return deleted_id is not None
\ No newline at end of file
@@ -0,0 +1,101 @@
+"""Async rating repository for database operations."""
+
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from sqlalchemy import Row, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.instrumentation import track_operations
+from app.models import Movie, MovieRating, MovieScoreCount
+from app.repositories.rating_repository import aggregates_update, lock_movies_select, score_counts_upsert
+
+
+@track_operations
+class AsyncRatingRepository:
+    """Async repository for rating-related database operations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, movie_id: int, score: int) -> Tuple[MovieRating, Tuple[int, int]]:
+        """
+        Create a new rating for a movie and update its aggregates.
+        Returns tuple of (rating, (ratings_count, ratings_sum)) with the movie's new aggregates.
+        """
+        rating = MovieRating(movie_id=movie_id, score=score)
+        self.db.add(rating)
+        await self.db.flush()
+        aggregates = await self.increment_aggregates(movie_id, count=1, total=score)
+        await self.db.execute(score_counts_upsert({(movie_id, score): 1}))
+        await self.db.commit()
+        await self.db.refresh(rating)
+        return rating, aggregates
+
+    async def create_many(
+        self, ratings: List[Tuple[int, int]]
+    ) -> Tuple[List[Row], Dict[int, Tuple[int, int]]]:
+        """
+        Insert (movie_id, score) pairs with one multi-row INSERT, update the movies'
+        aggregates with one UPDATE and their score histograms with one upsert, all in
+        a single transaction, so the statement count does not grow with the batch.
+        Returns tuple of (rows, aggregates): rows carry id, movie_id, score and rated_at
+        in input order; aggregates maps movie_id to its new (ratings_count, ratings_sum).
+        """
+        result = await self.db.execute(
+            insert(MovieRating).returning(
+                MovieRating.id,
+                MovieRating.movie_id,
+                MovieRating.score,
+                MovieRating.rated_at,
+                sort_by_parameter_order=True,
+            ).execution_options(insertmanyvalues_page_size=max(len(ratings), 1)),
+            [{"movie_id": movie_id, "score": score} for movie_id, score in ratings],
+        )
+        rows = result.all()
+
+        totals = defaultdict(lambda: [0, 0])
+        score_counts = defaultdict(int)
+        for movie_id, score in ratings:
+            totals[movie_id][0] += 1
+            totals[movie_id][1] += score
+            score_counts[(movie_id, score)] += 1
+
+        # Lock movie rows in a fixed order so concurrent batches cannot deadlock,
+        # then add every movie's increments with one UPDATE
+        aggregates = {}
+        if totals:
+            await self.db.execute(lock_movies_select(totals))
+            result = await self.db.execute(aggregates_update(totals))
+            aggregates = {movie_id: (ratings_count, ratings_sum) for movie_id, ratings_count, ratings_sum in result}
+        await self.db.execute(score_counts_upsert(score_counts))
+
+        await self.db.commit()
+        return rows, aggregates
+
+    async def increment_aggregates(self, movie_id: int, count: int, total: int) -> Tuple[int, int]:
+        """
+        Add ratings to a movie's denormalized count and sum (no commit).
+        Returns the new (ratings_count, ratings_sum).
+        """
+        result = await self.db.execute(
+            update(Movie)
+            .where(Movie.id == movie_id)
+            .values(
+                ratings_count=Movie.ratings_count + count,
+                ratings_sum=Movie.ratings_sum + total,
+                # A new rating is not an edit of the movie itself
+                updated_at=Movie.updated_at,
+            )
+            .returning(Movie.ratings_count, Movie.ratings_sum)
+            .execution_options(synchronize_session=False)
+        )
+        ratings_count, ratings_sum = result.one()
+        return ratings_count, ratings_sum
+
+    async def get_score_counts(self, movie_id: int) -> Dict[int, int]:
+        """Get a movie's score histogram as {score: count}; scores nobody gave are left out."""
+        result = await self.db.execute(
+            select(MovieScoreCount.score, MovieScoreCount.count)
+            .where(MovieScoreCount.movie_id == movie_id)
+        )
+        return {score: count for score, count in result}
@@ -0,0 +1,36 @@
+"""Async top-rated ranking repository for database operations."""
+
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import genre_dictionary
+from app.instrumentation import track_operations
+from app.models import MovieTopRating
+from app.repositories.top_rated_repository import top_rated_select
+
+
+@track_operations
+class AsyncTopRatedRepository:
+    """
+    Async repository for reading the top-rated ranking.
+    Rebuilds always run on the sync stack, in the refresher thread.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_top(
+        self,
+        limit: int,
+        genre: Optional[str] = None,
+        release_year: Optional[int] = None,
+    ) -> List[Row]:
+        """Get up to limit (movie_id, score) rows of the ranking, best first."""
+        await genre_dictionary.refresh_async()
+        return (await self.db.execute(top_rated_select(limit, genre, release_year))).all()
+
+    async def refreshed_at(self) -> Optional[datetime]:
+        """Get when the ranking was last rebuilt, or None if it is empty."""
+        return await self.db.scalar(select(MovieTopRating.refreshed_at).limit(1))
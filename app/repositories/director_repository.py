@@ -1,11 +1,18 @@
 """Director repository for database operations."""
 
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from app.cache import director_cache
+from app.instrumentation import track_operations
 from app.models import Director
 
+# Columns making up a cached director record
+DIRECTOR_RECORD_COLUMNS = (Director.id, Director.name, Director.birth_year, Director.description)
 
+
+@track_operations
 class DirectorRepository:
     """Repository for director-related database operations."""
 
@@ -16,7 +23,44 @@ class DirectorRepository:
         """Get a director by ID."""
         return self.db.query(Director).filter(Director.id == director_id).first()
 
+    def get_record(self, director_id: int) -> Optional[dict]:
+        """Get a director's record (id, name, birth_year, description), read through the cache."""
+        return self.get_records([director_id]).get(director_id)
+
+    def get_records(self, director_ids: Iterable[int]) -> Dict[int, dict]:
+        """
+        Get director records keyed by ID, read through the cache.
+        Misses are loaded with a single IN query; unknown IDs are left out.
+        """
+        director_ids = {director_id for director_id in director_ids if director_id is not None}
+        records = director_cache.get_many(director_ids)
+
+        missing = director_ids - records.keys()
+        if missing:
+            rows = self.db.execute(
+                select(*DIRECTOR_RECORD_COLUMNS).where(Director.id.in_(missing))
+            ).all()
+            for row in rows:
+                record = to_director_record(row)
+                director_cache.set(record)
+                records[record["id"]] = record
+
+        return records
+
     def exists(self, director_id: int) -> bool:
         """Check if a director exists by ID."""
-        result = self.db.query(Director.id).filter(Director.id == director_id).first()
-        return result is not None
\ No newline at end of file
+        return self.get_record(director_id) is not None
+
+    def all_names(self) -> List[Tuple[int, str]]:
+        """Get (id, name) of all directors, ordered by ID."""
+        return self.db.query(Director.id, Director.name).order_by(Director.id).all()
+
+
+def to_director_record(row) -> dict:
+    """Transform a director row to its cached record."""
+    return {
+        "id": row.id,
+        "name": row.name,
+        "birth_year": row.birth_year,
+        "description": row.description,
+    }
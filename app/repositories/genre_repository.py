@@ -1,33 +1,40 @@
 """Genre repository for database operations."""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 
+from app.cache import genre_dictionary
+from app.instrumentation import track_operations
 from app.models import Genre
 
 
+@track_operations
 class GenreRepository:
-    """Repository for genre-related database operations."""
+    """
+    Repository for genre-related database operations.
+    Reads are served from the process-wide genre dictionary instead of the database.
+    """
 
     def __init__(self, db: Session):
         self.db = db
 
     def get_by_id(self, genre_id: int) -> Optional[Genre]:
-        """Get a genre by ID."""
-        return self.db.query(Genre).filter(Genre.id == genre_id).first()
+        """Get a genre by ID, attached to this session."""
+        genre = genre_dictionary.get(genre_id)
+        return self.db.merge(genre, load=False) if genre else None
 
     def get_by_ids(self, genre_ids: List[int]) -> List[Genre]:
-        """Get multiple genres by their IDs."""
-        return self.db.query(Genre).filter(Genre.id.in_(genre_ids)).all()
+        """Get multiple genres by their IDs, attached to this session without a query."""
+        return [self.db.merge(genre, load=False) for genre in genre_dictionary.get_many(genre_ids)]
 
     def exists(self, genre_id: int) -> bool:
         """Check if a genre exists by ID."""
-        result = self.db.query(Genre.id).filter(Genre.id == genre_id).first()
-        return result is not None
+        return genre_dictionary.get(genre_id) is not None
 
     def all_exist(self, genre_ids: List[int]) -> bool:
         """Check if all given genre IDs exist."""
-        if not genre_ids:
-            return True
-        count = self.db.query(Genre).filter(Genre.id.in_(genre_ids)).count()
-        return count == len(genre_ids)
\ No newline at end of file
+        return genre_dictionary.all_exist(genre_ids)
+
+    def all_names(self) -> List[Tuple[int, str]]:
+        """Get (id, name) of all genres, ordered by ID."""
+        return [(genre.id, genre.name) for genre in genre_dictionary.all_genres()]
@@ -1,11 +1,38 @@
 """Movie repository for database operations."""
 
-from typing import Optional, List, Tuple
-from sqlalchemy.orm import Session, joinedload
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional, List, Set, Tuple
+from sqlalchemy import Row, Select, delete, func, insert, or_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by, array_agg
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm.attributes import flag_modified
 
-from app.models import Movie, Genre
+from app.cache import MemoryCache, genre_dictionary
+from app.config import settings
+from app.instrumentation import track_operations
+from app.models import Director, Movie, Genre, movie_genres
 
+# Strategies for the total item count of a listing
+COUNT_MODES = ("exact", "cached", "estimated", "none")
 
+# Exact counts shared across requests, keyed by the normalized filter tuple
+_count_cache = MemoryCache(
+    max_size=settings.LIST_COUNT_CACHE_SIZE,
+    ttl=settings.LIST_COUNT_CACHE_TTL,
+)
+
+# Sort keys available for listings; Movie.id is always the tiebreaker so the
+# ordering is total and stable across requests
+SORT_KEYS = {
+    "id": Movie.id,
+    "title": Movie.title,
+    "release_year": func.coalesce(Movie.release_year, 0),
+}
+
+RELTUPLES_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'movies'::regclass")
+
+
+@track_operations
 class MovieRepository:
     """Repository for movie-related database operations."""
 
@@ -19,84 +46,442 @@ class MovieRepository:
         title: Optional[str] = None,
         release_year: Optional[int] = None,
         genre: Optional[str] = None,
-    ) -> Tuple[List[Movie], int]:
+        sort: str = "id",
+        count_mode: str = "exact",
+        search: Optional[str] = None,
+    ) -> Tuple[List[Movie], Optional[int], str]:
         """
         Get movies with pagination and optional filters.
-        Returns tuple of (movies, total_count).
+        When search is given, results are ranked by title similarity instead of sort.
+        Returns tuple of (movies, total_count, count_mode_used).
         """
-        query = self.db.query(Movie).options(
-            joinedload(Movie.director),
-            joinedload(Movie.genres),
-            joinedload(Movie.ratings)
+        total_count, count_mode = self.count_movies(
+            title=title,
+            release_year=release_year,
+            genre=genre,
+            mode=count_mode,
+            search=search,
         )
 
-        # Apply filters
-        if title:
-            query = query.filter(Movie.title.ilike(f"%{title}%"))
+        # Select only the page's IDs, then load the rows and relations for them
+        movie_ids = self.db.scalars(
+            page_ids_select(page, page_size, title, release_year, genre, sort, search)
+        ).all()
+
+        return self.get_by_ids(movie_ids), total_count, count_mode
+
+    def count_movies(
+        self,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        mode: str = "exact",
+        search: Optional[str] = None,
+    ) -> Tuple[Optional[int], str]:
+        """
+        Count movies matching the filters using the given strategy.
+        Returns tuple of (count, mode_used); count is None when mode is "none".
+        Falls back to an exact count when no estimate is available.
+        """
+        if mode == "none":
+            return None, mode
+
+        if mode == "cached":
+            key = filter_key(title, release_year, genre, search)
+            count = _count_cache.get(key)
+            if count is None:
+                count = self._exact_count(title, release_year, genre, search)
+                _count_cache.set(key, count)
+            return count, mode
 
-        if release_year:
-            query = query.filter(Movie.release_year == release_year)
+        if mode == "estimated":
+            count = self._estimated_count(title, release_year, genre, search)
+            if count is not None:
+                return count, mode
+
+        return self._exact_count(title, release_year, genre, search), "exact"
+
+    def get_movies_after(
+        self,
+        after: Optional[Tuple[Any, int]] = None,
+        limit: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+    ) -> List[Movie]:
+        """
+        Get movies positioned after the given (sort_key, id) pair (keyset pagination).
+        Pass after=None to start from the beginning.
+        """
+        movie_ids = self.db.scalars(
+            keyset_ids_select(after, limit, title, release_year, genre, sort)
+        ).all()
 
-        if genre:
-            query = query.join(Movie.genres).filter(Genre.name.ilike(f"%{genre}%"))
+        return self.get_by_ids(movie_ids)
 
-        # Get total count before pagination
-        total_count = query.distinct().count()
+    def stream_export(
+        self,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        search: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Row]:
+        """
+        Yield flat export rows (see export_select) for the matching movies in ID order.
+        Rows come from a server-side cursor batch_size at a time, so memory stays flat.
+        """
+        result = self.db.execute(
+            export_select(title, release_year, genre, search).execution_options(yield_per=batch_size)
+        )
+        yield from result
 
-        # Apply pagination
-        offset = (page - 1) * page_size
-        movies = query.distinct().offset(offset).limit(page_size).all()
+    def get_by_ids(self, movie_ids: List[int]) -> List[Movie]:
+        """
+        Get movies by IDs with genres loaded, preserving the order of movie_ids.
+        Genres are loaded with a separate IN query, so no row is ever multiplied.
+        """
+        if not movie_ids:
+            return []
 
-        return movies, total_count
+        movies = self.db.scalars(movies_by_ids_select(movie_ids)).all()
+        return order_by_ids(movies, movie_ids)
 
     def get_by_id(self, movie_id: int) -> Optional[Movie]:
-        """Get a movie by ID with all relations loaded."""
+        """Get a movie by ID with director and genres loaded."""
         return self.db.query(Movie).options(
             joinedload(Movie.director),
-            joinedload(Movie.genres),
-            joinedload(Movie.ratings)
+            joinedload(Movie.genres)
         ).filter(Movie.id == movie_id).first()
 
+    def get_version(self, movie_id: int) -> Optional[Tuple[Optional[datetime], int]]:
+        """Return (updated_at, ratings_count) of a movie without loading it, or None if missing."""
+        row = self.db.execute(version_select(movie_id)).first()
+        return tuple(row) if row is not None else None
+
     def exists(self, movie_id: int) -> bool:
         """Check if a movie exists by ID."""
         result = self.db.query(Movie.id).filter(Movie.id == movie_id).first()
         return result is not None
 
-    def create(self, data: dict) -> Movie:
-        """Create a new movie."""
+    def existing_ids(self, movie_ids: Iterable[int]) -> Set[int]:
+        """Return which of the given movie IDs exist, using a single IN query."""
+        movie_ids = set(movie_ids)
+        if not movie_ids:
+            return set()
+        return set(self.db.scalars(select(Movie.id).where(Movie.id.in_(movie_ids))).all())
+
+    def create(self, data: dict, genres: List[Genre]) -> Movie:
+        """
+        Add a new movie with its genres and flush it (no commit).
+        Server-set columns come back with the INSERT, so the movie needs no refresh.
+        """
         movie = Movie(
             title=data["title"],
             director_id=data["director_id"],
             release_year=data.get("release_year"),
             cast=data.get("cast"),
+            genres=genres,
         )
         self.db.add(movie)
-        self.db.commit()
-        self.db.refresh(movie)
+        self.db.flush()
         return movie
 
-    def update(self, movie: Movie, data: dict) -> Movie:
-        """Update an existing movie."""
-        if "title" in data and data["title"] is not None:
-            movie.title = data["title"]
-        if "director_id" in data and data["director_id"] is not None:
-            movie.director_id = data["director_id"]
-        if "release_year" in data:
-            movie.release_year = data["release_year"]
-        if "cast" in data:
-            movie.cast = data["cast"]
-
-        self.db.commit()
-        self.db.refresh(movie)
+    def create_many(self, rows: List[dict], genre_ids: List[List[int]]) -> List[int]:
+        """
+        Insert movies with one multi-row INSERT and link their genres with another (no commit),
+        however many rows there are. genre_ids[i] holds the genres of rows[i].
+        Returns the new movie IDs in input order.
+        """
+        movie_ids = self.db.scalars(
+            insert(Movie)
+            .returning(Movie.id, sort_by_parameter_order=True)
+            .execution_options(insertmanyvalues_page_size=max(len(rows), 1)),
+            rows,
+        ).all()
+
+        links = [
+            {"movie_id": movie_id, "genre_id": genre_id}
+            for movie_id, ids in zip(movie_ids, genre_ids)
+            for genre_id in ids
+        ]
+        if links:
+            self.db.execute(
+                insert(movie_genres).execution_options(insertmanyvalues_page_size=len(links)),
+                links,
+            )
+
+        return movie_ids
+
+    def update(self, movie: Movie, data: dict, genres: Optional[List[Genre]] = None) -> Movie:
+        """
+        Apply changes to a movie and flush them (no commit).
+        Genres are replaced only when a list is given; the movie must have them loaded.
+        """
+        apply_movie_changes(movie, data, genres)
+        self.db.flush()
         return movie
 
-    def delete(self, movie: Movie) -> None:
-        """Delete a movie."""
-        self.db.delete(movie)
-        self.db.commit()
+    def delete_by_id(self, movie_id: int) -> bool:
+        """
+        Delete a movie with a single DELETE ... RETURNING (no commit).
+        Genre links and ratings go with it through ON DELETE CASCADE, so nothing is loaded first.
+        Returns False if no such movie existed.
+        """
+        deleted_id = self.db.execute(
+            delete(Movie)
+            .where(Movie.id == movie_id)
+            .returning(Movie.id)
+            .execution_options(synchronize_session=False)
+        ).scalar()
+        return deleted_id is not None
+
+    @staticmethod
+    def sort_key_value(movie: Movie, sort: str) -> Any:
+        """Return the value of the sort key for a movie, as used in keyset filters."""
+        if sort == "title":
+            return movie.title
+        if sort == "release_year":
+            return movie.release_year or 0
+        return movie.id
+
+    # =========================================================================
+    # Helper methods
+    # =========================================================================
+
+    def _exact_count(
+        self,
+        title: Optional[str],
+        release_year: Optional[int],
+        genre: Optional[str],
+        search: Optional[str] = None,
+    ) -> int:
+        """Count matching movies over the narrow filtered query."""
+        return self.db.execute(
+            filtered_select(func.count(Movie.id), title, release_year, genre, search)
+        ).scalar()
+
+    def _estimated_count(
+        self,
+        title: Optional[str],
+        release_year: Optional[int],
+        genre: Optional[str],
+        search: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Estimate the number of matching movies without scanning them.
+        Uses pg_class.reltuples when unfiltered and the planner's row estimate otherwise.
+        """
+        if not (title or release_year or genre or search):
+            reltuples = self.db.execute(RELTUPLES_SQL).scalar()
+            # reltuples is -1 until the table has been vacuumed or analyzed
+            return reltuples if reltuples is not None and reltuples >= 0 else None
+
+        statement = filtered_select(Movie.id, title, release_year, genre, search)
+        compiled = statement.compile(
+            dialect=self.db.get_bind().dialect,
+            compile_kwargs={"render_postcompile": True},
+        )
+        params = compiled.params
+        if compiled.positiontup:
+            params = tuple(params[name] for name in compiled.positiontup)
+
+        plan = self.db.connection().exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled}", params
+        ).scalar()
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# =============================================================================
+# Statement builders (shared with the async repository)
+# =============================================================================
+
+def filtered_select(
+    entity: Any,
+    title: Optional[str],
+    release_year: Optional[int],
+    genre: Optional[str],
+    search: Optional[str] = None,
+) -> Select:
+    """Build a SELECT of the given entity or column over movies with optional filters applied."""
+    statement = select(entity).select_from(Movie)
+
+    if title:
+        statement = statement.where(Movie.title.ilike(f"%{title}%"))
+
+    if release_year:
+        statement = statement.where(Movie.release_year == release_year)
+
+    if genre:
+        # Names are matched in the genre dictionary, so only movie_genres is queried;
+        # EXISTS instead of a join, so each movie appears once without DISTINCT
+        genre_ids = genre_dictionary.ids_matching(genre)
+        statement = statement.where(
+            select(movie_genres.c.movie_id)
+            .where(
+                movie_genres.c.movie_id == Movie.id,
+                movie_genres.c.genre_id.in_(genre_ids),
+            )
+            .exists()
+        )
+
+    if search:
+        # Substring or fuzzy word match; both are served by the trigram GIN index
+        statement = statement.where(or_(
+            Movie.title.ilike(f"%{search}%"),
+            Movie.title.op("%>")(search),
+        ))
+
+    return statement
+
+
+def page_ids_select(
+    page: int,
+    page_size: int,
+    title: Optional[str],
+    release_year: Optional[int],
+    genre: Optional[str],
+    sort: str = "id",
+    search: Optional[str] = None,
+) -> Select:
+    """Build the narrow SELECT of movie IDs for one page (offset pagination)."""
+    order_by = search_rank(search) if search else sort_order(sort)
+    return (
+        filtered_select(Movie.id, title, release_year, genre, search)
+        .order_by(*order_by)
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    )
 
-    def sync_genres(self, movie: Movie, genres: List[Genre]) -> None:
-        """Sync movie genres (replace existing with new ones)."""
+
+def keyset_ids_select(
+    after: Optional[Tuple[Any, int]],
+    limit: int,
+    title: Optional[str],
+    release_year: Optional[int],
+    genre: Optional[str],
+    sort: str = "id",
+) -> Select:
+    """Build the narrow SELECT of movie IDs following a (sort_key, id) position."""
+    statement = filtered_select(Movie.id, title, release_year, genre)
+
+    if after is not None:
+        sort_value, last_id = after
+        if sort == "id":
+            statement = statement.where(Movie.id > last_id)
+        else:
+            statement = statement.where(
+                tuple_(SORT_KEYS[sort], Movie.id) > tuple_(sort_value, last_id)
+            )
+
+    return statement.order_by(*sort_order(sort)).limit(limit)
+
+
+def export_select(
+    title: Optional[str],
+    release_year: Optional[int],
+    genre: Optional[str],
+    search: Optional[str] = None,
+) -> Select:
+    """
+    Build the flat SELECT used by exports: movie columns, director name, genre names
+    and rating aggregates, one row per movie, in ID order.
+    """
+    genre_names = (
+        select(array_agg(aggregate_order_by(Genre.name, Genre.name)))
+        .join(movie_genres, movie_genres.c.genre_id == Genre.id)
+        .where(movie_genres.c.movie_id == Movie.id)
+        .correlate(Movie)
+        .scalar_subquery()
+    )
+
+    return (
+        filtered_select(Movie.id, title, release_year, genre, search)
+        .with_only_columns(
+            Movie.id,
+            Movie.title,
+            Movie.release_year,
+            Movie.director_id,
+            Director.name.label("director_name"),
+            genre_names.label("genres"),
+            Movie.cast,
+            Movie.ratings_count,
+            Movie.ratings_sum,
+            maintain_column_froms=False,
+        )
+        .outerjoin(Director, Director.id == Movie.director_id)
+        .order_by(Movie.id)
+    )
+
+
+def movies_by_ids_select(movie_ids: List[int]) -> Select:
+    """
+    Build the SELECT loading movies by ID with genres.
+    Directors are not joined; list responses take them from the director cache.
+    """
+    return select(Movie).options(
+        selectinload(Movie.genres)
+    ).where(Movie.id.in_(movie_ids))
+
+
+def order_by_ids(movies: List[Movie], movie_ids: List[int]) -> List[Movie]:
+    """Return movies in the order of movie_ids, skipping any that were not found."""
+    movies_by_id = {movie.id: movie for movie in movies}
+    return [movies_by_id[movie_id] for movie_id in movie_ids if movie_id in movies_by_id]
+
+
+def filter_key(
+    title: Optional[str],
+    release_year: Optional[int],
+    genre: Optional[str],
+    search: Optional[str] = None,
+) -> tuple:
+    """Normalize filters into a cache key component; all text filters are case-insensitive."""
+    return (
+        title.lower() if title else None,
+        release_year or None,
+        genre.lower() if genre else None,
+        search.lower() if search else None,
+    )
+
+
+def apply_movie_changes(movie: Movie, data: dict, genres: Optional[List[Genre]] = None) -> None:
+    """
+    Copy updatable fields from data onto a movie, and replace its genres when a list is given.
+    A genre change alone still updates the movie row, so updated_at (and the ETag built
+    from it) moves with it.
+    """
+    if "title" in data and data["title"] is not None:
+        movie.title = data["title"]
+    if "director_id" in data and data["director_id"] is not None:
+        movie.director_id = data["director_id"]
+    if "release_year" in data:
+        movie.release_year = data["release_year"]
+    if "cast" in data:
+        movie.cast = data["cast"]
+
+    if genres is not None and {g.id for g in genres} != {g.id for g in movie.genres}:
         movie.genres = genres
-        self.db.commit()
-        self.db.refresh(movie)
\ No newline at end of file
+        flag_modified(movie, "title")
+
+
+def version_select(movie_id: int) -> Select:
+    """Build the primary-key lookup of the columns a movie's ETag is derived from."""
+    return select(Movie.updated_at, Movie.ratings_count).where(Movie.id == movie_id)
+
+
+def sort_order(sort: str) -> tuple:
+    """Return the ORDER BY clause for a sort key."""
+    if sort == "id":
+        return (Movie.id,)
+    return SORT_KEYS[sort], Movie.id
+
+
+def search_rank(search: str) -> tuple:
+    """Return the ORDER BY clause ranking titles by similarity to the search term."""
+    return (
+        func.word_similarity(search, Movie.title).desc(),
+        func.similarity(Movie.title, search).desc(),
+        Movie.id,
+    )
@@ -1,20 +1,169 @@
 """Rating repository for database operations."""
 
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import BigInteger, Insert, Integer, Row, Select, Update, column, exists, insert, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.models import MovieRating
+from app.instrumentation import track_operations
+from app.models import Movie, MovieRating, MovieScoreCount
 
 
+@track_operations
 class RatingRepository:
     """Repository for rating-related database operations."""
 
     def __init__(self, db: Session):
         self.db = db
 
-    def create(self, movie_id: int, score: int) -> MovieRating:
-        """Create a new rating for a movie."""
+    def create(self, movie_id: int, score: int) -> Tuple[MovieRating, Tuple[int, int]]:
+        """
+        Create a new rating for a movie and update its aggregates.
+        Returns tuple of (rating, (ratings_count, ratings_sum)) with the movie's new aggregates.
+        """
         rating = MovieRating(movie_id=movie_id, score=score)
         self.db.add(rating)
+        self.db.flush()
+        aggregates = self.increment_aggregates(movie_id, count=1, total=score)
+        self.db.execute(score_counts_upsert({(movie_id, score): 1}))
         self.db.commit()
         self.db.refresh(rating)
-        return rating
\ No newline at end of file
+        return rating, aggregates
+
+    def create_many(
+        self, ratings: List[Tuple[int, int]], skip_missing_movies: bool = False
+    ) -> Tuple[List[Row], Dict[int, Tuple[int, int]]]:
+        """
+        Insert (movie_id, score) pairs with one multi-row INSERT, update the movies'
+        aggregates with one UPDATE and their score histograms with one upsert, all in
+        a single transaction, so the statement count does not grow with the batch.
+        Returns tuple of (rows, aggregates): rows carry id, movie_id, score and rated_at
+        in input order; aggregates maps movie_id to its new (ratings_count, ratings_sum).
+
+        With skip_missing_movies, ratings of movies that no longer exist are left out
+        by the INSERT itself instead of failing it, and rows come back in no set order.
+        """
+        if skip_missing_movies:
+            rows = self.db.execute(existing_movie_ratings_insert(ratings)).all()
+        else:
+            rows = self.db.execute(
+                insert(MovieRating).returning(
+                    MovieRating.id,
+                    MovieRating.movie_id,
+                    MovieRating.score,
+                    MovieRating.rated_at,
+                    sort_by_parameter_order=True,
+                ).execution_options(insertmanyvalues_page_size=max(len(ratings), 1)),
+                [{"movie_id": movie_id, "score": score} for movie_id, score in ratings],
+            ).all()
+
+        totals = defaultdict(lambda: [0, 0])
+        score_counts = defaultdict(int)
+        for _, movie_id, score, _ in rows:
+            totals[movie_id][0] += 1
+            totals[movie_id][1] += score
+            score_counts[(movie_id, score)] += 1
+
+        # Lock movie rows in a fixed order so concurrent batches cannot deadlock,
+        # then add every movie's increments with one UPDATE
+        aggregates = {}
+        if totals:
+            self.db.execute(lock_movies_select(totals))
+            result = self.db.execute(aggregates_update(totals))
+            aggregates = {movie_id: (ratings_count, ratings_sum) for movie_id, ratings_count, ratings_sum in result}
+        self.db.execute(score_counts_upsert(score_counts))
+
+        self.db.commit()
+        return rows, aggregates
+
+    def increment_aggregates(self, movie_id: int, count: int, total: int) -> Tuple[int, int]:
+        """
+        Add ratings to a movie's denormalized count and sum (no commit).
+        Returns the new (ratings_count, ratings_sum).
+        """
+        result = self.db.execute(
+            update(Movie)
+            .where(Movie.id == movie_id)
+            .values(
+                ratings_count=Movie.ratings_count + count,
+                ratings_sum=Movie.ratings_sum + total,
+                # A new rating is not an edit of the movie itself
+                updated_at=Movie.updated_at,
+            )
+            .returning(Movie.ratings_count, Movie.ratings_sum)
+            .execution_options(synchronize_session=False)
+        )
+        ratings_count, ratings_sum = result.one()
+        return ratings_count, ratings_sum
+
+    def get_score_counts(self, movie_id: int) -> Dict[int, int]:
+        """Get a movie's score histogram as {score: count}; scores nobody gave are left out."""
+        result = self.db.execute(
+            select(MovieScoreCount.score, MovieScoreCount.count)
+            .where(MovieScoreCount.movie_id == movie_id)
+        )
+        return {score: count for score, count in result}
+
+
+def lock_movies_select(movie_ids: Iterable[int]) -> Select:
+    """
+    Build the SELECT locking movie rows in ID order. FOR NO KEY UPDATE is the lock the
+    aggregate UPDATE takes anyway, so it does not wait on rating inserts' FK checks.
+    """
+    return (
+        select(Movie.id)
+        .where(Movie.id.in_(sorted(movie_ids)))
+        .order_by(Movie.id)
+        .with_for_update(key_share=True)
+    )
+
+
+def aggregates_update(totals: Dict[int, Tuple[int, int]]) -> Update:
+    """
+    Build one UPDATE ... FROM (VALUES ...) adding {movie_id: (count, total)} to the movies'
+    denormalized aggregates, returning each movie's new (id, ratings_count, ratings_sum).
+    """
+    increments = values(
+        column("movie_id", Integer), column("count", Integer), column("total", BigInteger), name="increments"
+    ).data([(movie_id, count, total) for movie_id, (count, total) in sorted(totals.items())])
+    return (
+        update(Movie)
+        .where(Movie.id == increments.c.movie_id)
+        .values(
+            ratings_count=Movie.ratings_count + increments.c.count,
+            ratings_sum=Movie.ratings_sum + increments.c.total,
+            # A new rating is not an edit of the movie itself
+            updated_at=Movie.updated_at,
+        )
+        .returning(Movie.id, Movie.ratings_count, Movie.ratings_sum)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def existing_movie_ratings_insert(ratings: List[Tuple[int, int]]) -> Insert:
+    """Build an INSERT ... SELECT of (movie_id, score) pairs that skips movies which no longer exist."""
+    pending = values(
+        column("movie_id", Integer), column("score", Integer), name="pending"
+    ).data(ratings)
+    return insert(MovieRating).from_select(
+        ["movie_id", "score"],
+        select(pending.c.movie_id, pending.c.score).where(
+            exists().where(Movie.id == pending.c.movie_id)
+        ),
+    ).returning(MovieRating.id, MovieRating.movie_id, MovieRating.score, MovieRating.rated_at)
+
+
+def score_counts_upsert(score_counts: Dict[Tuple[int, int], int]) -> Insert:
+    """
+    Build the upsert adding {(movie_id, score): count} to the score histograms.
+    Rows go in key order, so concurrent writers lock them in the same order.
+    """
+    statement = pg_insert(MovieScoreCount).values([
+        {"movie_id": movie_id, "score": score, "count": count}
+        for (movie_id, score), count in sorted(score_counts.items())
+    ])
+    return statement.on_conflict_do_update(
+        index_elements=[MovieScoreCount.movie_id, MovieScoreCount.score],
+        set_={"count": MovieScoreCount.count + statement.excluded.count},
+    )
@@ -0,0 +1,105 @@
+"""Top-rated ranking repository for database operations."""
+
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Float, Row, Select, bindparam, cast, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.cache import genre_dictionary
+from app.instrumentation import track_operations
+from app.models import Movie, MovieTopRating, movie_genres
+
+# Advisory lock held by the transaction rebuilding the ranking, so workers never rebuild at once
+REFRESH_LOCK_KEY = 7_301_912_465
+
+
+@track_operations
+class TopRatedRepository:
+    """Repository for the precomputed top-rated ranking."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_top(
+        self,
+        limit: int,
+        genre: Optional[str] = None,
+        release_year: Optional[int] = None,
+    ) -> List[Row]:
+        """Get up to limit (movie_id, score) rows of the ranking, best first."""
+        return self.db.execute(top_rated_select(limit, genre, release_year)).all()
+
+    def refreshed_at(self) -> Optional[datetime]:
+        """Get when the ranking was last rebuilt, or None if it is empty."""
+        return self.db.scalar(select(MovieTopRating.refreshed_at).limit(1))
+
+    def refresh(self, prior_weight: float, min_ratings: int, max_age: float = 0) -> bool:
+        """
+        Rebuild the ranking from the movies' rating aggregates in one transaction, so
+        readers see either the old or the new ranking. Skipped (returns False) while
+        another session holds the refresh lock, or when the ranking is younger than
+        max_age seconds.
+        """
+        if not self.db.scalar(select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))):
+            self.db.rollback()
+            return False
+
+        if max_age:
+            age = self.db.scalar(
+                select(func.extract("epoch", func.now() - MovieTopRating.refreshed_at)).limit(1)
+            )
+            if age is not None and age < max_age:
+                self.db.rollback()
+                return False
+
+        self.db.execute(delete(MovieTopRating))
+        self.db.execute(rebuild_insert(prior_weight, min_ratings))
+        self.db.commit()
+        return True
+
+
+# =============================================================================
+# Statement builders (shared with the async repository)
+# =============================================================================
+
+def top_rated_select(limit: int, genre: Optional[str], release_year: Optional[int]) -> Select:
+    """Build the SELECT of the best-ranked (movie_id, score) rows, served by the score indexes."""
+    statement = select(MovieTopRating.movie_id, MovieTopRating.score)
+
+    if release_year:
+        statement = statement.where(MovieTopRating.release_year == release_year)
+
+    if genre:
+        genre_ids = genre_dictionary.ids_matching(genre)
+        statement = statement.where(
+            select(movie_genres.c.movie_id)
+            .where(
+                movie_genres.c.movie_id == MovieTopRating.movie_id,
+                movie_genres.c.genre_id.in_(genre_ids),
+            )
+            .exists()
+        )
+
+    return statement.order_by(MovieTopRating.score.desc(), MovieTopRating.movie_id).limit(limit)
+
+
+def rebuild_insert(prior_weight: float, min_ratings: int):
+    """
+    Build the INSERT ... SELECT filling the ranking. Each movie's mean is pulled toward
+    the catalog-wide mean by prior_weight phantom ratings, so a movie with a single
+    10 cannot outrank one with hundreds of 9s.
+    """
+    prior_mean = select(
+        func.coalesce(
+            cast(func.sum(Movie.ratings_sum), Float) / func.nullif(func.sum(Movie.ratings_count), 0),
+            0,
+        )
+    ).scalar_subquery()
+    weight = bindparam("prior_weight", prior_weight, type_=Float)
+    score = (Movie.ratings_sum + prior_mean * weight) / (Movie.ratings_count + weight)
+
+    return insert(MovieTopRating).from_select(
+        ["movie_id", "release_year", "ratings_count", "ratings_sum", "score"],
+        select(Movie.id, Movie.release_year, Movie.ratings_count, Movie.ratings_sum, score)
+        .where(Movie.ratings_count >= max(min_ratings, 1)),
+    )
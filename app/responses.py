@@ -0,0 +1,48 @@
+"""Response classes."""
+
+import time
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+from app.instrumentation import record_serialization
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Hot endpoints return it directly, which also skips FastAPI's jsonable_encoder
+    pass; their content must then already be plain dicts, lists, strings, numbers,
+    None and datetimes, as built by the services.
+    """
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        body = orjson.dumps(content)
+        record_serialization(time.perf_counter() - started)
+        return body
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison, as the header requires)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag in {candidate.removeprefix("W/") for candidate in candidates}
+
+
+def validator_headers(etag: str, cache_control: str) -> dict:
+    """Build the ETag and, when configured, Cache-Control headers of a response."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return headers
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """Build an empty 304 response that repeats the validators."""
+    return Response(status_code=304, headers=validator_headers(etag, cache_control))
@@ -6,18 +6,27 @@ from app.schemas.base import (
     SuccessResponse,
     PaginatedData,
     PaginatedResponse,
+    CursorPaginatedData,
 )
 from app.schemas.director import DirectorBrief, DirectorResponse
 from app.schemas.genre import GenreResponse
 from app.schemas.movie import (
     MovieCreate,
+    MovieImportItem,
     MovieUpdate,
     MovieListItem,
     MovieDetail,
     MovieCreateResponse,
     MovieUpdateResponse,
 )
-from app.schemas.rating import RatingCreate, RatingResponse
+from app.schemas.rating import (
+    RatingCreate,
+    RatingResponse,
+    RatingBatchItem,
+    RatingBatchCreate,
+    ScoreCount,
+    RatingStats,
+)
 
 __all__ = [
     # Base
@@ -26,6 +35,7 @@ __all__ = [
     "SuccessResponse",
     "PaginatedData",
     "PaginatedResponse",
+    "CursorPaginatedData",
     # Director
     "DirectorBrief",
     "DirectorResponse",
@@ -33,6 +43,7 @@ __all__ = [
     "GenreResponse",
     # Movie
     "MovieCreate",
+    "MovieImportItem",
     "MovieUpdate",
     "MovieListItem",
     "MovieDetail",
@@ -41,4 +52,8 @@ __all__ = [
     # Rating
     "RatingCreate",
     "RatingResponse",
+    "RatingBatchItem",
+    "RatingBatchCreate",
+    "ScoreCount",
+    "RatingStats",
 ]
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Base schemas for API responses."""
 
-from typing import TypeVar, Generic, List
+from typing import TypeVar, Generic, List, Optional
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -32,7 +32,17 @@ class PaginatedData(BaseModel, Generic[T]):
 
     page: int
     page_size: int
-    total_items: int
+    total_items: Optional[int] = None
+    count_mode: str = "exact"
+    next_cursor: Optional[str] = None
+    items: List[T]
+
+
+class CursorPaginatedData(BaseModel, Generic[T]):
+    """Keyset-paginated data structure."""
+
+    page_size: int
+    next_cursor: Optional[str] = None
     items: List[T]
 
 
@@ -1,6 +1,6 @@
 """Movie schemas."""
 
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -17,6 +17,17 @@ class MovieCreate(BaseModel):
     genres: List[int] = Field(default_factory=list)
 
 
+class MovieImportItem(BaseModel):
+    """Schema for one line of a bulk import; director and genres may be given by ID or by name."""
+
+    title: str = Field(..., min_length=1, max_length=255)
+    director_id: Optional[int] = None
+    director: Optional[str] = None
+    release_year: Optional[int] = Field(None, ge=1800, le=2100)
+    cast: Optional[str] = None
+    genres: List[Union[int, str]] = Field(default_factory=list)
+
+
 class MovieUpdate(BaseModel):
     """Schema for updating a movie."""
 
@@ -1,8 +1,11 @@
 """Rating schemas."""
 
 from datetime import datetime
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
+from app.config import settings
+
 
 class RatingCreate(BaseModel):
     """Schema for creating a rating."""
@@ -18,4 +21,39 @@ class RatingResponse(BaseModel):
     score: int
     created_at: datetime
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+
+class RatingBatchItem(BaseModel):
+    """
+    Schema for one rating in a batch.
+    The score is checked per item by the service, so one bad item does not reject the batch.
+    """
+
+    movie_id: int
+    score: int
+
+
+class RatingBatchCreate(BaseModel):
+    """Schema for submitting many ratings at once."""
+
+    items: List[RatingBatchItem] = Field(..., min_length=1, max_length=settings.RATINGS_BATCH_MAX_SIZE)
+
+
+class ScoreCount(BaseModel):
+    """Schema for one bar of a score histogram."""
+
+    score: int
+    count: int
+
+
+class RatingStats(BaseModel):
+    """Schema for the score distribution of a movie."""
+
+    movie_id: int
+    ratings_count: int
+    histogram: List[ScoreCount]
+    average_rating: Optional[float] = None
+    median: Optional[float] = None
+    percentiles: Dict[str, Optional[float]]
+    std_dev: Optional[float] = None
@@ -2,8 +2,18 @@
 
 from app.services.movie_service import MovieService
 from app.services.rating_service import RatingService
+from app.services.async_movie_service import AsyncMovieService
+from app.services.async_rating_service import AsyncRatingService
+from app.services.import_service import MovieImportService
+from app.services.export_service import MovieExportService
+from app.services.async_export_service import AsyncMovieExportService
 
 __all__ = [
     "MovieService",
     "RatingService",
+    "AsyncMovieService",
+    "AsyncRatingService",
+    "MovieImportService",
+    "MovieExportService",
+    "AsyncMovieExportService",
 ]
\ No newline at end of file
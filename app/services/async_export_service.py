@@ -0,0 +1,65 @@
+"""Async movie export service for streaming the catalog as NDJSON or CSV."""
+
+from typing import AsyncIterator, Callable, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.db.database import AsyncSessionLocal
+from app.instrumentation import connection_budget
+from app.repositories import AsyncMovieRepository
+from app.services.export_service import BaseMovieExportService
+from app.logging_config import logger
+
+
+class AsyncMovieExportService(BaseMovieExportService):
+    """Streams matching movies as NDJSON or CSV from an async server-side cursor."""
+
+    def __init__(
+        self,
+        export_format: str = "ndjson",
+        batch_size: int = settings.EXPORT_BATCH_SIZE,
+        session_factory: Callable[[], AsyncSession] = AsyncSessionLocal,
+    ):
+        super().__init__(export_format, batch_size)
+        self.session_factory = session_factory
+
+    async def stream(
+        self,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Yield the export as text chunks of up to batch_size rows."""
+        logger.info(
+            f"Exporting movies (format={self.export_format}, title={title}, "
+            f"release_year={release_year}, genre={genre}, search={search})"
+        )
+
+        header = self._header()
+        if header:
+            yield header
+
+        exported = 0
+        batch = []
+        async with self.session_factory() as db:
+            connection = await db.connection()
+            with connection_budget(connection.sync_connection, self._budget()):
+                async for row in AsyncMovieRepository(db).stream_export(
+                    title=title,
+                    release_year=release_year,
+                    genre=genre,
+                    search=search,
+                    batch_size=self.batch_size,
+                ):
+                    batch.append(row)
+                    if len(batch) >= self.batch_size:
+                        exported += len(batch)
+                        yield self._format_batch(batch)
+                        batch = []
+
+        if batch:
+            exported += len(batch)
+            yield self._format_batch(batch)
+
+        logger.info(f"Exported {exported} movies (format={self.export_format})")
@@ -0,0 +1,345 @@
+"""Async movie service for business logic."""
+
+from datetime import datetime
+from typing import Optional, List, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import movie_detail_cache, movie_list_cache
+from app.db.unit_of_work import AsyncUnitOfWork
+from app.repositories import (
+    AsyncMovieRepository,
+    AsyncDirectorRepository,
+    AsyncGenreRepository,
+    AsyncTopRatedRepository,
+)
+from app.services.movie_service import BaseMovieService
+from app.exceptions import NotFoundException, ValidationException
+from app.logging_config import logger
+
+
+class AsyncMovieService(BaseMovieService):
+    """Async service for movie-related business logic."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.movie_repo = AsyncMovieRepository(db)
+        self.director_repo = AsyncDirectorRepository(db)
+        self.genre_repo = AsyncGenreRepository(db)
+        self.top_rated_repo = AsyncTopRatedRepository(db)
+
+    async def get_movies(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+        count_mode: str = "exact",
+        search: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[int], str, Optional[str]]:
+        """
+        Get paginated list of movies with optional filters.
+        Returns tuple of (movie_list, total_count, count_mode_used, next_cursor).
+        """
+        logger.info(
+            f"Fetching movies list (page={page}, page_size={page_size}, "
+            f"title={title}, release_year={release_year}, genre={genre}, "
+            f"sort={sort}, count_mode={count_mode}, search={search})"
+        )
+
+        cache_key = self._page_cache_key(
+            page, page_size, title, release_year, genre, sort, count_mode, search
+        )
+        cached = movie_list_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Movies list found in cache (page={page})")
+            return cached
+        snapshot = movie_list_cache.snapshot()
+
+        try:
+            movies, total_count, count_mode = await self.movie_repo.get_movies_paginated(
+                page=page,
+                page_size=page_size,
+                title=title,
+                release_year=release_year,
+                genre=genre,
+                sort=sort,
+                count_mode=count_mode,
+                search=search,
+            )
+
+            directors = await self.director_repo.get_records(movie.director_id for movie in movies)
+            movie_list = [self._to_list_item(movie, directors) for movie in movies]
+
+            next_cursor = self._page_next_cursor(
+                movies, page, page_size, total_count, count_mode, sort, search
+            )
+
+            logger.info(
+                f"Returned {len(movie_list)} movies (total: {total_count}, count_mode: {count_mode})"
+            )
+
+            result = movie_list, total_count, count_mode, next_cursor
+            movie_list_cache.set(cache_key, result, snapshot)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to fetch movies: {str(e)}", exc_info=True)
+            raise
+
+    async def get_movies_by_cursor(
+        self,
+        cursor: str,
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+        search: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get the page of movies following an opaque cursor (keyset pagination).
+        Returns tuple of (movie_list, next_cursor).
+        """
+        logger.info(
+            f"Fetching movies list (cursor={cursor}, page_size={page_size}, "
+            f"title={title}, release_year={release_year}, genre={genre}, sort={sort})"
+        )
+
+        after = self._cursor_position(cursor, sort, search)
+
+        cache_key = self._cursor_cache_key(cursor, page_size, title, release_year, genre, sort)
+        cached = movie_list_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Movies list found in cache (cursor page)")
+            return cached
+        snapshot = movie_list_cache.snapshot()
+
+        try:
+            movies = await self.movie_repo.get_movies_after(
+                after=after,
+                limit=page_size + 1,
+                title=title,
+                release_year=release_year,
+                genre=genre,
+                sort=sort,
+            )
+
+            has_more = len(movies) > page_size
+            movies = movies[:page_size]
+            directors = await self.director_repo.get_records(movie.director_id for movie in movies)
+            movie_list = [self._to_list_item(movie, directors) for movie in movies]
+            next_cursor = self._encode_cursor(sort, movies[-1]) if has_more else None
+
+            logger.info(f"Returned {len(movie_list)} movies (has_more: {has_more})")
+
+            result = movie_list, next_cursor
+            movie_list_cache.set(cache_key, result, snapshot)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to fetch movies: {str(e)}", exc_info=True)
+            raise
+
+    async def get_top_movies(
+        self,
+        limit: int = 10,
+        genre: Optional[str] = None,
+        release_year: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[datetime]]:
+        """
+        Get the best movies by Bayesian average from the precomputed ranking.
+        Returns tuple of (movie_list, refreshed_at); refreshed_at is None until the first rebuild.
+        """
+        logger.info(f"Fetching top movies (limit={limit}, genre={genre}, release_year={release_year})")
+
+        cache_key = self._top_cache_key(limit, genre, release_year)
+        cached = movie_list_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Top movies found in cache")
+            return cached
+        snapshot = movie_list_cache.snapshot()
+
+        try:
+            rows = await self.top_rated_repo.get_top(limit, genre=genre, release_year=release_year)
+            movies = await self.movie_repo.get_by_ids([row.movie_id for row in rows])
+            directors = await self.director_repo.get_records(movie.director_id for movie in movies)
+            movie_list = self._to_top_items(rows, movies, directors)
+            refreshed_at = await self.top_rated_repo.refreshed_at()
+
+            logger.info(f"Returned {len(movie_list)} top movies (refreshed_at: {refreshed_at})")
+
+            result = movie_list, refreshed_at
+            movie_list_cache.set(cache_key, result, snapshot)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to fetch top movies: {str(e)}", exc_info=True)
+            raise
+
+    async def get_movie_by_id(self, movie_id: int) -> Tuple[dict, str]:
+        """
+        Get movie details by ID.
+        Returns tuple of (detail, etag).
+        Raises NotFoundException if not found.
+        """
+        logger.info(f"Fetching movie details (movie_id={movie_id})")
+
+        cached = movie_detail_cache.get(movie_id)
+        if cached is not None:
+            logger.info(f"Movie found in cache (movie_id={movie_id})")
+            detail, version = cached
+            return detail, self._movie_etag(movie_id, version, detail["ratings_count"])
+
+        snapshot = movie_detail_cache.snapshot(movie_id)
+
+        try:
+            movie = await self.movie_repo.get_by_id(movie_id)
+            if not movie:
+                logger.warning(f"Movie not found (movie_id={movie_id})")
+                raise NotFoundException(message="Movie not found")
+
+            logger.info(f"Movie found: {movie.title} (movie_id={movie_id})")
+            detail = self._to_detail(movie)
+            version = self._version_stamp(movie.updated_at)
+            movie_detail_cache.set(movie_id, detail, version, snapshot)
+            return detail, self._movie_etag(movie_id, version, detail["ratings_count"])
+
+        except NotFoundException:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to fetch movie (movie_id={movie_id}): {str(e)}", exc_info=True)
+            raise
+
+    async def get_movie_etag(self, movie_id: int) -> str:
+        """
+        Get the ETag of a movie without building its detail: from the cached detail when
+        present, otherwise from a primary-key lookup of two columns.
+        Raises NotFoundException if not found.
+        """
+        cached = movie_detail_cache.get(movie_id)
+        if cached is not None:
+            detail, version = cached
+            return self._movie_etag(movie_id, version, detail["ratings_count"])
+
+        version = await self.movie_repo.get_version(movie_id)
+        if version is None:
+            logger.warning(f"Movie not found (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+        updated_at, ratings_count = version
+        return self._movie_etag(movie_id, self._version_stamp(updated_at), ratings_count)
+
+    async def create_movie(self, data: dict) -> dict:
+        """
+        Create a new movie.
+        Raises ValidationException if director_id or genres are invalid.
+        """
+        logger.info(f"Creating movie: {data.get('title')}")
+
+        director_id = data.get("director_id")
+        if not await self.director_repo.exists(director_id):
+            logger.warning(f"Invalid director_id: {director_id}")
+            raise ValidationException(message="Invalid director_id or genres")
+
+        genre_ids = data.get("genres", [])
+        genres = await self.genre_repo.get_by_ids(genre_ids) if genre_ids else []
+        if len(genres) != len(set(genre_ids)):
+            logger.warning(f"Invalid genre_ids: {genre_ids}")
+            raise ValidationException(message="Invalid director_id or genres")
+
+        try:
+            # One transaction: INSERT movie, INSERT genre links, COMMIT
+            async with AsyncUnitOfWork(self.db):
+                movie = await self.movie_repo.create({
+                    "title": data["title"],
+                    "director_id": director_id,
+                    "release_year": data.get("release_year"),
+                    "cast": data.get("cast"),
+                }, genres)
+
+                # Built from the flushed objects; nothing is reloaded
+                response = self._to_create_response(movie, await self.director_repo.get_record(director_id))
+
+            movie_list_cache.bump_catalog()
+
+            logger.info(f"Movie created successfully (movie_id={response['id']})")
+            return response
+
+        except Exception as e:
+            logger.error(f"Failed to create movie: {str(e)}", exc_info=True)
+            raise
+
+    async def update_movie(self, movie_id: int, data: dict) -> dict:
+        """
+        Update an existing movie.
+        Raises NotFoundException if movie not found.
+        Raises ValidationException if director_id or genres are invalid.
+        """
+        logger.info(f"Updating movie (movie_id={movie_id})")
+
+        movie = await self.movie_repo.get_by_id(movie_id)
+        if not movie:
+            logger.warning(f"Movie not found (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+
+        director_id = data.get("director_id")
+        if director_id is not None and not await self.director_repo.exists(director_id):
+            logger.warning(f"Invalid director_id: {director_id}")
+            raise ValidationException(message="Invalid director_id or genres")
+
+        genre_ids = data.get("genres")
+        genres = None
+        if genre_ids is not None:
+            genres = await self.genre_repo.get_by_ids(genre_ids) if genre_ids else []
+            if len(genres) != len(set(genre_ids)):
+                logger.warning(f"Invalid genre_ids: {genre_ids}")
+                raise ValidationException(message="Invalid director_id or genres")
+
+        try:
+            update_data = {
+                field: data[field]
+                for field in ("title", "director_id", "release_year", "cast")
+                if field in data
+            }
+
+            # One transaction: UPDATE movie, replace genre links, COMMIT
+            async with AsyncUnitOfWork(self.db):
+                movie = await self.movie_repo.update(movie, update_data, genres)
+
+                # Built from the flushed objects; updated_at came back with the UPDATE
+                response = self._to_update_response(
+                    movie, await self.director_repo.get_record(movie.director_id)
+                )
+
+            movie_detail_cache.invalidate(movie_id)
+            movie_list_cache.bump_catalog()
+
+            logger.info(f"Movie updated successfully (movie_id={movie_id})")
+            return response
+
+        except Exception as e:
+            logger.error(f"Failed to update movie (movie_id={movie_id}): {str(e)}", exc_info=True)
+            raise
+
+    async def delete_movie(self, movie_id: int) -> None:
+        """
+        Delete a movie.
+        Raises NotFoundException if movie not found.
+        """
+        logger.info(f"Deleting movie (movie_id={movie_id})")
+
+        try:
+            async with AsyncUnitOfWork(self.db):
+                deleted = await self.movie_repo.delete_by_id(movie_id)
+        except Exception as e:
+            logger.error(f"Failed to delete movie (movie_id={movie_id}): {str(e)}", exc_info=True)
+            raise
+
+        if not deleted:
+            logger.warning(f"Movie not found (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+
+        movie_detail_cache.invalidate(movie_id)
+        movie_list_cache.bump_catalog()
+        logger.info(f"Movie deleted successfully (movie_id={movie_id})")
@@ -0,0 +1,139 @@
+"""Async rating service for business logic."""
+
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import movie_detail_cache, movie_list_cache
+from app.repositories import AsyncMovieRepository, AsyncRatingRepository
+from app.services.rating_service import BaseRatingService
+from app.exceptions import NotFoundException, ValidationException
+from app.logging_config import logger
+from app.services.rating_buffer import rating_buffer
+
+
+class AsyncRatingService(BaseRatingService):
+    """Async service for rating-related business logic."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.movie_repo = AsyncMovieRepository(db)
+        self.rating_repo = AsyncRatingRepository(db)
+
+    async def create_rating(self, movie_id: int, score: int) -> dict:
+        """
+        Create a rating for a movie.
+        Raises NotFoundException if movie not found.
+        Raises ValidationException if score is invalid.
+        """
+        logger.info(f"Rating movie (movie_id={movie_id}, score={score})")
+
+        if not 1 <= score <= 10:
+            logger.warning(
+                f"Invalid rating value (movie_id={movie_id}, score={score})"
+            )
+            raise ValidationException(message="Score must be an integer between 1 and 10")
+
+        if not await self.movie_repo.exists(movie_id):
+            logger.warning(f"Movie not found for rating (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+
+        try:
+            rating, (ratings_count, ratings_sum) = await self.rating_repo.create(
+                movie_id=movie_id, score=score
+            )
+            movie_detail_cache.apply_rating_aggregates(movie_id, ratings_count, ratings_sum)
+            movie_list_cache.bump_ratings()
+
+            logger.info(
+                f"Rating saved successfully (movie_id={movie_id}, "
+                f"score={score}, rating_id={rating.id})"
+            )
+
+            return self._to_rating_response(rating)
+
+        except Exception as e:
+            logger.error(
+                f"Failed to save rating (movie_id={movie_id}, score={score}): {str(e)}",
+                exc_info=True
+            )
+            raise
+
+    async def get_rating_stats(self, movie_id: int) -> dict:
+        """
+        Get a movie's score histogram, median, percentiles and standard deviation,
+        computed from its stored histogram without reading movie_ratings.
+        Raises NotFoundException if movie not found.
+        """
+        logger.info(f"Fetching rating stats (movie_id={movie_id})")
+
+        score_counts = await self.rating_repo.get_score_counts(movie_id)
+        # An empty histogram is either an unrated movie or a missing one
+        if not score_counts and not await self.movie_repo.exists(movie_id):
+            logger.warning(f"Movie not found for rating stats (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+
+        return self._to_rating_stats(movie_id, score_counts)
+
+    async def enqueue_rating(self, movie_id: int, score: int) -> dict:
+        """
+        Accept a rating for write-behind: validate it and queue it for the next batched flush.
+        The rating becomes visible once flushed, so no id or timestamp is returned.
+        Raises NotFoundException if movie not found.
+        Raises ValidationException if score is invalid.
+        Raises ServiceUnavailableException if the buffer is full.
+        """
+        logger.info(f"Queueing rating (movie_id={movie_id}, score={score})")
+
+        if not 1 <= score <= 10:
+            logger.warning(
+                f"Invalid rating value (movie_id={movie_id}, score={score})"
+            )
+            raise ValidationException(message="Score must be an integer between 1 and 10")
+
+        if not await self.movie_repo.exists(movie_id):
+            logger.warning(f"Movie not found for rating (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+
+        rating_buffer.submit(movie_id, score)
+
+        return {
+            "movie_id": movie_id,
+            "score": score,
+            "status": "accepted",
+        }
+
+    async def create_ratings_batch(self, items: List[dict]) -> dict:
+        """
+        Create many ratings in one transaction.
+        Returns dict with created/failed counts and one result per item, in input order.
+        """
+        logger.info(f"Rating movies in batch (items={len(items)})")
+
+        existing_ids = await self.movie_repo.existing_ids(item["movie_id"] for item in items)
+        accepted, results = self._check_batch(items, existing_ids)
+
+        if accepted:
+            try:
+                rows, aggregates = await self.rating_repo.create_many(
+                    [(items[index]["movie_id"], items[index]["score"]) for index in accepted]
+                )
+            except Exception as e:
+                logger.error(f"Failed to save rating batch (items={len(items)}): {str(e)}", exc_info=True)
+                raise
+
+            for index, row in zip(accepted, rows):
+                results[index] = {
+                    "index": index,
+                    "status": "success",
+                    "data": self._to_rating_response(row),
+                }
+            self._apply_batch_to_caches(aggregates)
+
+        failed = len(items) - len(accepted)
+        logger.info(f"Rating batch saved (created={len(accepted)}, failed={failed})")
+
+        return {
+            "created": len(accepted),
+            "failed": failed,
+            "results": results,
+        }
@@ -0,0 +1,149 @@
+"""Movie export service for streaming the catalog as NDJSON or CSV."""
+
+import csv
+import io
+import json
+from typing import Callable, Iterator, List, Optional
+from sqlalchemy import Row
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.database import SessionLocal
+from app.instrumentation import QueryBudget, connection_budget
+from app.repositories import MovieRepository
+from app.logging_config import logger
+
+# Supported formats and their response media types
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+# The export SELECT, however many rows it streams; the genre dictionary reloads in its own session
+EXPORT_BUDGET = 1
+
+CSV_COLUMNS = [
+    "id",
+    "title",
+    "release_year",
+    "director_id",
+    "director_name",
+    "genres",
+    "cast",
+    "ratings_count",
+    "average_rating",
+]
+
+
+class BaseMovieExportService:
+    """Row formatting shared by the sync and async export services."""
+
+    def __init__(self, export_format: str = "ndjson", batch_size: int = settings.EXPORT_BATCH_SIZE):
+        self.export_format = export_format
+        self.batch_size = batch_size
+
+    def _budget(self) -> QueryBudget:
+        """Statement budget of the stream's own session."""
+        return QueryBudget(EXPORT_BUDGET, name=f"{type(self).__name__}.stream")
+
+    def _header(self) -> Optional[str]:
+        """Return the text written before the first row, if any."""
+        if self.export_format == "csv":
+            return self._format_csv([CSV_COLUMNS])
+        return None
+
+    def _format_batch(self, rows: List[Row]) -> str:
+        """Render a batch of export rows as one chunk of output."""
+        records = [self._to_record(row) for row in rows]
+
+        if self.export_format == "csv":
+            lines = []
+            for record in records:
+                record["genres"] = "|".join(record["genres"])
+                lines.append([record[column] for column in CSV_COLUMNS])
+            return self._format_csv(lines)
+
+        return "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        )
+
+    @staticmethod
+    def _format_csv(lines: List[list]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="\n").writerows(lines)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _to_record(row: Row) -> dict:
+        """Transform an export row to its output fields."""
+        return {
+            "id": row.id,
+            "title": row.title,
+            "release_year": row.release_year,
+            "director_id": row.director_id,
+            "director_name": row.director_name,
+            "genres": row.genres or [],
+            "cast": row.cast,
+            "ratings_count": row.ratings_count,
+            "average_rating": round(row.ratings_sum / row.ratings_count, 1) if row.ratings_count else None,
+        }
+
+
+class MovieExportService(BaseMovieExportService):
+    """
+    Streams matching movies as NDJSON or CSV.
+
+    Rows are read through a server-side cursor and written out batch_size at a
+    time, so memory use does not grow with the catalog. The stream opens its own
+    session because it is consumed after the request handler has returned, and
+    checks EXPORT_BUDGET against the statements sent on that session.
+    """
+
+    def __init__(
+        self,
+        export_format: str = "ndjson",
+        batch_size: int = settings.EXPORT_BATCH_SIZE,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        super().__init__(export_format, batch_size)
+        self.session_factory = session_factory
+
+    def stream(
+        self,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[str]:
+        """Yield the export as text chunks of up to batch_size rows."""
+        logger.info(
+            f"Exporting movies (format={self.export_format}, title={title}, "
+            f"release_year={release_year}, genre={genre}, search={search})"
+        )
+
+        header = self._header()
+        if header:
+            yield header
+
+        exported = 0
+        batch = []
+        with self.session_factory() as db, connection_budget(db.connection(), self._budget()):
+            for row in MovieRepository(db).stream_export(
+                title=title,
+                release_year=release_year,
+                genre=genre,
+                search=search,
+                batch_size=self.batch_size,
+            ):
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    exported += len(batch)
+                    yield self._format_batch(batch)
+                    batch = []
+
+        if batch:
+            exported += len(batch)
+            yield self._format_batch(batch)
+
+        logger.info(f"Exported {exported} movies (format={self.export_format})")
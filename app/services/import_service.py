@@ -0,0 +1,216 @@
+"""Bulk movie import service for streaming NDJSON catalogs."""
+
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.cache import movie_list_cache
+from app.config import settings
+from app.instrumentation import allow_statements
+from app.repositories import MovieRepository, DirectorRepository, GenreRepository
+from app.schemas import MovieImportItem
+from app.logging_config import logger
+
+# INSERT movies, INSERT genre links: what each attempted batch adds to the open budgets
+IMPORT_BATCH_STATEMENTS = 2
+
+
+class MovieImportService:
+    """
+    Imports movies from NDJSON lines in batches.
+
+    Directors and genres are resolved from maps loaded once per import, so a line
+    costs no lookups; valid lines are inserted batch_size at a time with one
+    commit per batch. A batch the database rejects is retried line by line, so
+    invalid lines and the lines the database rejects are reported by line number
+    while the import goes on. Every attempted batch, or retried line, sends
+    IMPORT_BATCH_STATEMENTS statements and extends the open query budgets by as many.
+    """
+
+    def __init__(self, db: Session, batch_size: int = settings.IMPORT_BATCH_SIZE):
+        self.db = db
+        self.movie_repo = MovieRepository(db)
+        self.batch_size = batch_size
+
+        self.processed = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+        self._pending: List[Tuple[int, dict, List[int]]] = []
+
+        self.director_ids, self.director_names = self._name_maps(DirectorRepository(db).all_names())
+        self.genre_ids, self.genre_names = self._name_maps(GenreRepository(db).all_names())
+
+    def feed(self, lines: Iterable[Tuple[int, str]]) -> None:
+        """Validate (line_number, text) pairs and insert every full batch."""
+        for line_number, line in lines:
+            if not line.strip():
+                continue
+
+            self.processed += 1
+            try:
+                data, genre_ids = self._parse_line(line)
+            except ValueError as e:
+                self._record_error(line_number, str(e))
+                continue
+
+            self._pending.append((line_number, data, genre_ids))
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def finish(self) -> dict:
+        """
+        Insert the last partial batch.
+        Returns dict with processed/imported/failed counts and the per-line errors.
+        """
+        self._flush()
+
+        logger.info(
+            f"Movie import finished (processed={self.processed}, "
+            f"imported={self.imported}, failed={self.failed})"
+        )
+
+        return {
+            "processed": self.processed,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": len(self.errors) < self.failed,
+        }
+
+    # =========================================================================
+    # Helper methods
+    # =========================================================================
+
+    @staticmethod
+    def _name_maps(rows: List[Tuple[int, str]]) -> Tuple[set, Dict[str, int]]:
+        """Build the ID set and the case-insensitive name -> ID map; the lowest ID wins a shared name."""
+        names = {}
+        for row_id, name in rows:
+            names.setdefault(name.lower(), row_id)
+        return {row_id for row_id, _ in rows}, names
+
+    def _parse_line(self, line: str) -> Tuple[dict, List[int]]:
+        """
+        Parse and validate one line into (movie_data, genre_ids).
+        Raises ValueError with a client-facing message if the line is invalid.
+        """
+        try:
+            item = MovieImportItem.model_validate_json(line)
+        except ValidationError as e:
+            error = e.errors()[0]
+            location = ".".join(str(part) for part in error["loc"]) or "line"
+            raise ValueError(f"{location}: {error['msg']}")
+
+        if item.director_id is None and not item.director:
+            raise ValueError("director_id or director is required")
+        director_id = self._resolve(item.director_id, item.director, self.director_ids, self.director_names)
+        if director_id is None:
+            raise ValueError(f"Unknown director: {item.director_id or item.director}")
+
+        genre_ids = []
+        for genre in item.genres:
+            if isinstance(genre, int):
+                genre_id = self._resolve(genre, None, self.genre_ids, self.genre_names)
+            else:
+                genre_id = self._resolve(None, genre, self.genre_ids, self.genre_names)
+            if genre_id is None:
+                raise ValueError(f"Unknown genre: {genre}")
+            if genre_id not in genre_ids:
+                genre_ids.append(genre_id)
+
+        data = {
+            "title": item.title,
+            "director_id": director_id,
+            "release_year": item.release_year,
+            "cast": item.cast,
+        }
+        return data, genre_ids
+
+    @staticmethod
+    def _resolve(
+        row_id: Optional[int], name: Optional[str], ids: set, names: Dict[str, int]
+    ) -> Optional[int]:
+        """Resolve a reference given by ID or by name; None if it does not exist."""
+        if row_id is not None:
+            return row_id if row_id in ids else None
+        if name:
+            return names.get(name.strip().lower())
+        return None
+
+    def _flush(self) -> None:
+        """Insert and commit the pending batch; if the database rejects it, retry it line by line."""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        try:
+            self._insert(batch)
+            self.imported += len(batch)
+        except Exception as e:
+            self.db.rollback()
+            logger.warning(
+                f"Import batch rejected, retrying line by line (lines {batch[0][0]}-{batch[-1][0]}): {str(e)}"
+            )
+            for row in batch:
+                self._insert_one(row)
+
+    def _insert_one(self, row: Tuple[int, dict, List[int]]) -> None:
+        """Insert and commit a single line, reporting it if the database rejects it."""
+        line_number = row[0]
+        try:
+            self._insert([row])
+            self.imported += 1
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to import line {line_number}: {str(e)}")
+            self._record_error(line_number, self._database_message(e))
+
+    def _insert(self, batch: List[Tuple[int, dict, List[int]]]) -> None:
+        allow_statements(IMPORT_BATCH_STATEMENTS)
+        self.movie_repo.create_many(
+            [data for _, data, _ in batch],
+            [genre_ids for _, _, genre_ids in batch],
+        )
+        self.db.commit()
+        # Per commit, so lists are fresh even if the client goes away before finish()
+        movie_list_cache.bump_catalog()
+
+    @staticmethod
+    def _database_message(error: Exception) -> str:
+        """Build the per-line message of a database error from the first line of the driver's message."""
+        if isinstance(error, DBAPIError):
+            detail = str(error.orig).strip().splitlines()
+            if detail:
+                return f"Rejected by the database: {detail[0]}"
+        return "Rejected by the database"
+
+    def _record_error(self, line_number: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.IMPORT_MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_number, "message": message})
+
+
+async def iter_line_batches(
+    chunks: AsyncIterable[bytes], batch_size: int
+) -> AsyncIterator[List[Tuple[int, str]]]:
+    """Split a byte stream into lists of up to batch_size (line_number, text) pairs."""
+    buffer = b""
+    batch = []
+    line_number = 0
+
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            batch.append((line_number, line.decode("utf-8", errors="replace")))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+    if buffer:
+        batch.append((line_number + 1, buffer.decode("utf-8", errors="replace")))
+    if batch:
+        yield batch
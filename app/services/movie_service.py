@@ -1,15 +1,273 @@
 """Movie service for business logic."""
 
-from typing import Optional, List, Tuple
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, Optional, List, Tuple
 from sqlalchemy.orm import Session
 
 from app.models import Movie
-from app.repositories import MovieRepository, DirectorRepository, GenreRepository
-from app.exceptions import NotFoundException, ValidationException
+from app.cache import movie_detail_cache, movie_list_cache
+from app.db.unit_of_work import UnitOfWork
+from app.repositories import MovieRepository, DirectorRepository, GenreRepository, TopRatedRepository
+from app.repositories.movie_repository import filter_key
+from app.exceptions import NotFoundException, ValidationException, BadRequestException
 from app.logging_config import logger
 
+# Range of the INTEGER columns a cursor key is compared with
+INT4_MIN, INT4_MAX = -2 ** 31, 2 ** 31 - 1
 
-class MovieService:
+
+def _is_int4(value: Any) -> bool:
+    # bool is an int subclass, but never a valid key
+    return type(value) is int and INT4_MIN <= value <= INT4_MAX
+
+
+def _is_text(value: Any) -> bool:
+    # Postgres text cannot hold NUL characters
+    return isinstance(value, str) and "\x00" not in value
+
+
+class BaseMovieService:
+    """Response building and cursor handling shared by the sync and async movie services."""
+
+    def _calculate_average_rating(self, movie: Movie) -> Optional[float]:
+        """Calculate average rating from the movie's stored aggregates."""
+        if not movie.ratings_count:
+            return None
+        return round(movie.ratings_sum / movie.ratings_count, 1)
+
+    def _page_next_cursor(
+        self,
+        movies: List[Movie],
+        page: int,
+        page_size: int,
+        total_count: Optional[int],
+        count_mode: str,
+        sort: str,
+        search: Optional[str],
+    ) -> Optional[str]:
+        """
+        Build the cursor that continues after a page-mode result, so clients can switch
+        to cursor mode from any page. Only an exact count can tell that a full page is
+        also the last one. Similarity ranking has no keyset, so search gets no cursor.
+        """
+        if search or len(movies) < page_size:
+            return None
+        if count_mode == "exact" and page * page_size >= total_count:
+            return None
+        return self._encode_cursor(sort, movies[-1])
+
+    @staticmethod
+    def _encode_cursor(sort: str, movie: Movie) -> str:
+        """Encode the position of a movie in the given sort order as an opaque cursor."""
+        payload = {"s": sort, "k": MovieRepository.sort_key_value(movie, sort), "i": movie.id}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort: str) -> Tuple[Any, int]:
+        """
+        Decode a cursor into a (sort_key, id) pair. Cursors come from clients, so the
+        key must have the sort column's type before it can reach a query.
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            sort_value, movie_id = payload["k"], payload["i"]
+            cursor_sort = payload["s"]
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            logger.warning(f"Invalid cursor: {cursor}")
+            raise BadRequestException(message="Invalid cursor")
+
+        if cursor_sort != sort:
+            logger.warning(f"Cursor sort mismatch (cursor={cursor_sort}, requested={sort})")
+            raise BadRequestException(message="Cursor does not match the requested sort")
+
+        key_valid = _is_text(sort_value) if sort == "title" else _is_int4(sort_value)
+        if not key_valid or not _is_int4(movie_id):
+            logger.warning(f"Invalid cursor position: {cursor}")
+            raise BadRequestException(message="Invalid cursor")
+
+        return sort_value, movie_id
+
+    @classmethod
+    def _cursor_position(cls, cursor: str, sort: str, search: Optional[str]) -> Tuple[Any, int]:
+        """Validate a cursor-mode request and return the decoded cursor position."""
+        if search:
+            logger.warning(f"Cursor pagination requested with search (search={search})")
+            raise BadRequestException(message="Cursor pagination is not supported with search")
+        return cls._decode_cursor(cursor, sort)
+
+    def get_movies_etag(
+        self,
+        page: int = 1,
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+        count_mode: str = "exact",
+        search: Optional[str] = None,
+    ) -> str:
+        """Get the ETag of a page-mode list result; needs no query."""
+        return movie_list_cache.etag(
+            self._page_cache_key(page, page_size, title, release_year, genre, sort, count_mode, search)
+        )
+
+    def get_movies_by_cursor_etag(
+        self,
+        cursor: str,
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+        search: Optional[str] = None,
+    ) -> str:
+        """
+        Get the ETag of a cursor-mode list result; needs no query.
+        Raises BadRequestException like get_movies_by_cursor, so a request that would
+        fail cannot be answered 304 by revalidation.
+        """
+        self._cursor_position(cursor, sort, search)
+        return movie_list_cache.etag(
+            self._cursor_cache_key(cursor, page_size, title, release_year, genre, sort)
+        )
+
+    def get_top_movies_etag(
+        self,
+        limit: int = 10,
+        genre: Optional[str] = None,
+        release_year: Optional[int] = None,
+    ) -> str:
+        """Get the ETag of a top-rated result; needs no query."""
+        return movie_list_cache.etag(self._top_cache_key(limit, genre, release_year), by_rating=True)
+
+    @staticmethod
+    def _version_stamp(updated_at: Optional[datetime]) -> int:
+        """Return a movie's updated_at as epoch microseconds, 0 if it was never set."""
+        return int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+
+    @staticmethod
+    def _movie_etag(movie_id: int, version: int, ratings_count: Optional[int]) -> str:
+        """
+        Build a movie's strong ETag. Every edit moves updated_at (the version stamp) and
+        every rating moves ratings_count, so together they version the whole detail payload.
+        """
+        return f'"m{movie_id}-{version:x}-{ratings_count or 0}"'
+
+    @staticmethod
+    def _page_cache_key(
+        page: int,
+        page_size: int,
+        title: Optional[str],
+        release_year: Optional[int],
+        genre: Optional[str],
+        sort: str,
+        count_mode: str,
+        search: Optional[str],
+    ) -> tuple:
+        """Build the list cache key of a page-mode result."""
+        return ("page", page, page_size, sort, count_mode) + filter_key(
+            title, release_year, genre, search
+        )
+
+    @staticmethod
+    def _cursor_cache_key(
+        cursor: str,
+        page_size: int,
+        title: Optional[str],
+        release_year: Optional[int],
+        genre: Optional[str],
+        sort: str,
+    ) -> tuple:
+        """Build the list cache key of a cursor-mode result."""
+        return ("cursor", cursor, page_size, sort) + filter_key(title, release_year, genre)
+
+    @staticmethod
+    def _top_cache_key(limit: int, genre: Optional[str], release_year: Optional[int]) -> tuple:
+        """Build the list cache key of a top-rated result."""
+        return ("top", limit) + filter_key(None, release_year, genre)
+
+    def _to_top_items(self, rows: list, movies: List[Movie], directors: Dict[int, dict]) -> List[dict]:
+        """Transform ranking rows and their movies to top-rated items, keeping the ranking order."""
+        scores = {row.movie_id: row.score for row in rows}
+        return [
+            {**self._to_list_item(movie, directors), "rank": rank, "score": round(scores[movie.id], 2)}
+            for rank, movie in enumerate(movies, start=1)
+        ]
+
+    def _to_list_item(self, movie: Movie, directors: Dict[int, dict]) -> dict:
+        """Transform movie to list item format, taking the director from the given records."""
+        director = directors.get(movie.director_id)
+        return {
+            "id": movie.id,
+            "title": movie.title,
+            "release_year": movie.release_year,
+            "director": {
+                "id": director["id"],
+                "name": director["name"],
+            } if director else None,
+            "genres": [g.name for g in movie.genres],
+            "average_rating": self._calculate_average_rating(movie),
+            "ratings_count": movie.ratings_count or 0,
+        }
+
+    def _to_detail(self, movie: Movie) -> dict:
+        """Transform movie to detail format."""
+        return {
+            "id": movie.id,
+            "title": movie.title,
+            "release_year": movie.release_year,
+            "director": {
+                "id": movie.director.id,
+                "name": movie.director.name,
+                "birth_year": movie.director.birth_year,
+                "description": movie.director.description,
+            } if movie.director else None,
+            "genres": [g.name for g in movie.genres],
+            "cast": movie.cast,
+            "average_rating": self._calculate_average_rating(movie),
+            "ratings_count": movie.ratings_count or 0,
+        }
+
+    def _to_create_response(self, movie: Movie, director: Optional[dict]) -> dict:
+        """Transform movie to create response format, with the given director record."""
+        return {
+            "id": movie.id,
+            "title": movie.title,
+            "release_year": movie.release_year,
+            "director": {
+                "id": director["id"],
+                "name": director["name"],
+            } if director else None,
+            "genres": [g.name for g in movie.genres],
+            "cast": movie.cast,
+            "average_rating": None,
+            "ratings_count": 0,
+        }
+
+    def _to_update_response(self, movie: Movie, director: Optional[dict]) -> dict:
+        """Transform movie to update response format, with the given director record."""
+        return {
+            "id": movie.id,
+            "title": movie.title,
+            "release_year": movie.release_year,
+            "director": {
+                "id": director["id"],
+                "name": director["name"],
+            } if director else None,
+            "genres": [g.name for g in movie.genres],
+            "cast": movie.cast,
+            "average_rating": self._calculate_average_rating(movie),
+            "ratings_count": movie.ratings_count or 0,
+            "updated_at": movie.updated_at,
+        }
+
+
+class MovieService(BaseMovieService):
     """Service for movie-related business logic."""
 
     def __init__(self, db: Session):
@@ -17,6 +275,7 @@ class MovieService:
         self.movie_repo = MovieRepository(db)
         self.director_repo = DirectorRepository(db)
         self.genre_repo = GenreRepository(db)
+        self.top_rated_repo = TopRatedRepository(db)
 
     def get_movies(
         self,
@@ -25,45 +284,173 @@ class MovieService:
         title: Optional[str] = None,
         release_year: Optional[int] = None,
         genre: Optional[str] = None,
-    ) -> Tuple[List[dict], int]:
+        sort: str = "id",
+        count_mode: str = "exact",
+        search: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[int], str, Optional[str]]:
         """
         Get paginated list of movies with optional filters.
-        Returns tuple of (movie_list, total_count).
+        When search is given, movies are ranked by title similarity.
+        Returns tuple of (movie_list, total_count, count_mode_used, next_cursor).
         """
         # Log start of operation
         logger.info(
             f"Fetching movies list (page={page}, page_size={page_size}, "
-            f"title={title}, release_year={release_year}, genre={genre})"
+            f"title={title}, release_year={release_year}, genre={genre}, "
+            f"sort={sort}, count_mode={count_mode}, search={search})"
         )
 
+        cache_key = self._page_cache_key(
+            page, page_size, title, release_year, genre, sort, count_mode, search
+        )
+        cached = movie_list_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Movies list found in cache (page={page})")
+            return cached
+        snapshot = movie_list_cache.snapshot()
+
         try:
-            movies, total_count = self.movie_repo.get_movies_paginated(
+            movies, total_count, count_mode = self.movie_repo.get_movies_paginated(
                 page=page,
                 page_size=page_size,
                 title=title,
                 release_year=release_year,
                 genre=genre,
+                sort=sort,
+                count_mode=count_mode,
+                search=search,
             )
 
             # Transform to response format
-            movie_list = [self._to_list_item(movie) for movie in movies]
+            directors = self.director_repo.get_records(movie.director_id for movie in movies)
+            movie_list = [self._to_list_item(movie, directors) for movie in movies]
+
+            next_cursor = self._page_next_cursor(
+                movies, page, page_size, total_count, count_mode, sort, search
+            )
 
             # Log success
-            logger.info(f"Returned {len(movie_list)} movies (total: {total_count})")
+            logger.info(
+                f"Returned {len(movie_list)} movies (total: {total_count}, count_mode: {count_mode})"
+            )
+
+            result = movie_list, total_count, count_mode, next_cursor
+            movie_list_cache.set(cache_key, result, snapshot)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to fetch movies: {str(e)}", exc_info=True)
+            raise
+
+    def get_movies_by_cursor(
+        self,
+        cursor: str,
+        page_size: int = 10,
+        title: Optional[str] = None,
+        release_year: Optional[int] = None,
+        genre: Optional[str] = None,
+        sort: str = "id",
+        search: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        Get the page of movies following an opaque cursor (keyset pagination).
+        Returns tuple of (movie_list, next_cursor).
+        Raises BadRequestException if the cursor is malformed or was issued for another sort,
+        or if combined with search.
+        """
+        logger.info(
+            f"Fetching movies list (cursor={cursor}, page_size={page_size}, "
+            f"title={title}, release_year={release_year}, genre={genre}, sort={sort})"
+        )
 
-            return movie_list, total_count
+        after = self._cursor_position(cursor, sort, search)
+
+        cache_key = self._cursor_cache_key(cursor, page_size, title, release_year, genre, sort)
+        cached = movie_list_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Movies list found in cache (cursor page)")
+            return cached
+        snapshot = movie_list_cache.snapshot()
+
+        try:
+            # Fetch one extra row to know whether another page exists
+            movies = self.movie_repo.get_movies_after(
+                after=after,
+                limit=page_size + 1,
+                title=title,
+                release_year=release_year,
+                genre=genre,
+                sort=sort,
+            )
+
+            has_more = len(movies) > page_size
+            movies = movies[:page_size]
+            directors = self.director_repo.get_records(movie.director_id for movie in movies)
+            movie_list = [self._to_list_item(movie, directors) for movie in movies]
+            next_cursor = self._encode_cursor(sort, movies[-1]) if has_more else None
+
+            logger.info(f"Returned {len(movie_list)} movies (has_more: {has_more})")
+
+            result = movie_list, next_cursor
+            movie_list_cache.set(cache_key, result, snapshot)
+            return result
 
         except Exception as e:
             logger.error(f"Failed to fetch movies: {str(e)}", exc_info=True)
             raise
 
-    def get_movie_by_id(self, movie_id: int) -> dict:
+    def get_top_movies(
+        self,
+        limit: int = 10,
+        genre: Optional[str] = None,
+        release_year: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[datetime]]:
+        """
+        Get the best movies by Bayesian average from the precomputed ranking.
+        Returns tuple of (movie_list, refreshed_at); refreshed_at is None until the first rebuild.
+        """
+        logger.info(f"Fetching top movies (limit={limit}, genre={genre}, release_year={release_year})")
+
+        cache_key = self._top_cache_key(limit, genre, release_year)
+        cached = movie_list_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Top movies found in cache")
+            return cached
+        snapshot = movie_list_cache.snapshot()
+
+        try:
+            rows = self.top_rated_repo.get_top(limit, genre=genre, release_year=release_year)
+            movies = self.movie_repo.get_by_ids([row.movie_id for row in rows])
+            directors = self.director_repo.get_records(movie.director_id for movie in movies)
+            movie_list = self._to_top_items(rows, movies, directors)
+            refreshed_at = self.top_rated_repo.refreshed_at()
+
+            logger.info(f"Returned {len(movie_list)} top movies (refreshed_at: {refreshed_at})")
+
+            result = movie_list, refreshed_at
+            movie_list_cache.set(cache_key, result, snapshot)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to fetch top movies: {str(e)}", exc_info=True)
+            raise
+
+    def get_movie_by_id(self, movie_id: int) -> Tuple[dict, str]:
         """
         Get movie details by ID.
+        Returns tuple of (detail, etag).
         Raises NotFoundException if not found.
         """
         logger.info(f"Fetching movie details (movie_id={movie_id})")
 
+        cached = movie_detail_cache.get(movie_id)
+        if cached is not None:
+            logger.info(f"Movie found in cache (movie_id={movie_id})")
+            detail, version = cached
+            return detail, self._movie_etag(movie_id, version, detail["ratings_count"])
+
+        snapshot = movie_detail_cache.snapshot(movie_id)
+
         try:
             movie = self.movie_repo.get_by_id(movie_id)
             if not movie:
@@ -71,7 +458,10 @@ class MovieService:
                 raise NotFoundException(message="Movie not found")
 
             logger.info(f"Movie found: {movie.title} (movie_id={movie_id})")
-            return self._to_detail(movie)
+            detail = self._to_detail(movie)
+            version = self._version_stamp(movie.updated_at)
+            movie_detail_cache.set(movie_id, detail, version, snapshot)
+            return detail, self._movie_etag(movie_id, version, detail["ratings_count"])
 
         except NotFoundException:
             raise
@@ -79,6 +469,24 @@ class MovieService:
             logger.error(f"Failed to fetch movie (movie_id={movie_id}): {str(e)}", exc_info=True)
             raise
 
+    def get_movie_etag(self, movie_id: int) -> str:
+        """
+        Get the ETag of a movie without building its detail: from the cached detail when
+        present, otherwise from a primary-key lookup of two columns.
+        Raises NotFoundException if not found.
+        """
+        cached = movie_detail_cache.get(movie_id)
+        if cached is not None:
+            detail, version = cached
+            return self._movie_etag(movie_id, version, detail["ratings_count"])
+
+        version = self.movie_repo.get_version(movie_id)
+        if version is None:
+            logger.warning(f"Movie not found (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+        updated_at, ratings_count = version
+        return self._movie_etag(movie_id, self._version_stamp(updated_at), ratings_count)
+
     def create_movie(self, data: dict) -> dict:
         """
         Create a new movie.
@@ -99,24 +507,22 @@ class MovieService:
             raise ValidationException(message="Invalid director_id or genres")
 
         try:
-            # Create movie
-            movie = self.movie_repo.create({
-                "title": data["title"],
-                "director_id": director_id,
-                "release_year": data.get("release_year"),
-                "cast": data.get("cast"),
-            })
+            # One transaction: INSERT movie, INSERT genre links, COMMIT
+            with UnitOfWork(self.db):
+                movie = self.movie_repo.create({
+                    "title": data["title"],
+                    "director_id": director_id,
+                    "release_year": data.get("release_year"),
+                    "cast": data.get("cast"),
+                }, self.genre_repo.get_by_ids(genre_ids))
 
-            # Sync genres
-            if genre_ids:
-                genres = self.genre_repo.get_by_ids(genre_ids)
-                self.movie_repo.sync_genres(movie, genres)
+                # Built from the flushed objects; nothing is reloaded
+                response = self._to_create_response(movie, self.director_repo.get_record(director_id))
 
-            # Reload movie with relations
-            movie = self.movie_repo.get_by_id(movie.id)
+            movie_list_cache.bump_catalog()
 
-            logger.info(f"Movie created successfully (movie_id={movie.id})")
-            return self._to_create_response(movie)
+            logger.info(f"Movie created successfully (movie_id={response['id']})")
+            return response
 
         except Exception as e:
             logger.error(f"Failed to create movie: {str(e)}", exc_info=True)
@@ -149,30 +555,28 @@ class MovieService:
             raise ValidationException(message="Invalid director_id or genres")
 
         try:
-            # Update movie fields
-            update_data = {}
-            if "title" in data:
-                update_data["title"] = data["title"]
-            if "director_id" in data:
-                update_data["director_id"] = data["director_id"]
-            if "release_year" in data:
-                update_data["release_year"] = data["release_year"]
-            if "cast" in data:
-                update_data["cast"] = data["cast"]
-
-            if update_data:
-                movie = self.movie_repo.update(movie, update_data)
-
-            # Sync genres if provided
-            if genre_ids is not None:
-                genres = self.genre_repo.get_by_ids(genre_ids) if genre_ids else []
-                self.movie_repo.sync_genres(movie, genres)
-
-            # Reload movie with relations
-            movie = self.movie_repo.get_by_id(movie.id)
+            update_data = {
+                field: data[field]
+                for field in ("title", "director_id", "release_year", "cast")
+                if field in data
+            }
+            genres = self.genre_repo.get_by_ids(genre_ids) if genre_ids is not None else None
+
+            # One transaction: UPDATE movie, replace genre links, COMMIT
+            with UnitOfWork(self.db):
+                movie = self.movie_repo.update(movie, update_data, genres)
+
+                # Built from the flushed objects; the stored rating aggregates were
+                # loaded with the movie and updated_at came back with the UPDATE
+                response = self._to_update_response(
+                    movie, self.director_repo.get_record(movie.director_id)
+                )
+
+            movie_detail_cache.invalidate(movie_id)
+            movie_list_cache.bump_catalog()
 
             logger.info(f"Movie updated successfully (movie_id={movie_id})")
-            return self._to_update_response(movie)
+            return response
 
         except Exception as e:
             logger.error(f"Failed to update movie (movie_id={movie_id}): {str(e)}", exc_info=True)
@@ -185,93 +589,17 @@ class MovieService:
         """
         logger.info(f"Deleting movie (movie_id={movie_id})")
 
-        # Check movie exists
-        movie = self.movie_repo.get_by_id(movie_id)
-        if not movie:
-            logger.warning(f"Movie not found (movie_id={movie_id})")
-            raise NotFoundException(message="Movie not found")
-
         try:
-            self.movie_repo.delete(movie)
-            logger.info(f"Movie deleted successfully (movie_id={movie_id})")
-
+            with UnitOfWork(self.db):
+                deleted = self.movie_repo.delete_by_id(movie_id)
         except Exception as e:
             logger.error(f"Failed to delete movie (movie_id={movie_id}): {str(e)}", exc_info=True)
             raise
 
-    # =========================================================================
-    # Helper methods
-    # =========================================================================
-
-    def _calculate_average_rating(self, movie: Movie) -> Optional[float]:
-        """Calculate average rating for a movie."""
-        if not movie.ratings:
-            return None
-        total = sum(r.score for r in movie.ratings)
-        return round(total / len(movie.ratings), 1)
-
-    def _to_list_item(self, movie: Movie) -> dict:
-        """Transform movie to list item format."""
-        return {
-            "id": movie.id,
-            "title": movie.title,
-            "release_year": movie.release_year,
-            "director": {
-                "id": movie.director.id,
-                "name": movie.director.name,
-            } if movie.director else None,
-            "genres": [g.name for g in movie.genres],
-            "average_rating": self._calculate_average_rating(movie),
-            "ratings_count": len(movie.ratings) if movie.ratings else 0,
-        }
-
-    def _to_detail(self, movie: Movie) -> dict:
-        """Transform movie to detail format."""
-        return {
-            "id": movie.id,
-            "title": movie.title,
-            "release_year": movie.release_year,
-            "director": {
-                "id": movie.director.id,
-                "name": movie.director.name,
-                "birth_year": movie.director.birth_year,
-                "description": movie.director.description,
-            } if movie.director else None,
-            "genres": [g.name for g in movie.genres],
-            "cast": movie.cast,
-            "average_rating": self._calculate_average_rating(movie),
-            "ratings_count": len(movie.ratings) if movie.ratings else 0,
-        }
-
-    def _to_create_response(self, movie: Movie) -> dict:
-        """Transform movie to create response format."""
-        return {
-            "id": movie.id,
-            "title": movie.title,
-            "release_year": movie.release_year,
-            "director": {
-                "id": movie.director.id,
-                "name": movie.director.name,
-            } if movie.director else None,
-            "genres": [g.name for g in movie.genres],
-            "cast": movie.cast,
-            "average_rating": None,
-            "ratings_count": 0,
-        }
+        if not deleted:
+            logger.warning(f"Movie not found (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
 
-    def _to_update_response(self, movie: Movie) -> dict:
-        """Transform movie to update response format."""
-        return {
-            "id": movie.id,
-            "title": movie.title,
-            "release_year": movie.release_year,
-            "director": {
-                "id": movie.director.id,
-                "name": movie.director.name,
-            } if movie.director else None,
-            "genres": [g.name for g in movie.genres],
-            "cast": movie.cast,
-            "average_rating": self._calculate_average_rating(movie),
-            "ratings_count": len(movie.ratings) if movie.ratings else 0,
-            "updated_at": movie.updated_at,
-        }
\ No newline at end of file
+        movie_detail_cache.invalidate(movie_id)
+        movie_list_cache.bump_catalog()
+        logger.info(f"Movie deleted successfully (movie_id={movie_id})")
@@ -0,0 +1,213 @@
+"""Write-behind buffer that batches accepted ratings into periodic flushes."""
+
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from app.config import settings
+from app.db.database import SessionLocal
+from app.exceptions import ServiceUnavailableException
+from app.logging_config import logger
+from app.repositories import RatingRepository
+
+
+class FlushStats:
+    """Running totals of buffer flushes: latency, batch sizes and lost items."""
+
+    def __init__(self):
+        self.flushes = 0
+        self.items = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def record(self, batch_size: int, seconds: float, failed: bool = False, dropped: int = 0) -> None:
+        """Record one flush of batch_size items."""
+        with self._lock:
+            self.flushes += 1
+            self.items += batch_size
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self.last_batch_size = batch_size
+            self.max_batch_size = max(self.max_batch_size, batch_size)
+            self.dropped += dropped
+            if failed:
+                self.failed_flushes += 1
+
+    def reject(self) -> None:
+        """Record a rating turned away because the buffer was full."""
+        with self._lock:
+            self.rejected += 1
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "flushes": self.flushes,
+                "items": self.items,
+                "avg_flush_ms": round(self.total_seconds / self.flushes * 1000, 2) if self.flushes else 0.0,
+                "max_flush_ms": round(self.max_seconds * 1000, 2),
+                "avg_batch_size": round(self.items / self.flushes, 1) if self.flushes else 0.0,
+                "last_batch_size": self.last_batch_size,
+                "max_batch_size": self.max_batch_size,
+                "failed_flushes": self.failed_flushes,
+                "dropped": self.dropped,
+                "rejected": self.rejected,
+            }
+
+
+class RatingBuffer:
+    """
+    Bounded in-process queue of accepted (movie_id, score) pairs.
+
+    A background thread flushes the queue with one multi-row insert and one
+    set-based aggregate update, whenever flush_batch_size items are waiting or
+    flush_interval seconds after the first of them arrived. When the queue is
+    full, submit raises so callers can shed load instead of queueing unboundedly.
+    A failed flush is retried up to max_retries times with doubling backoff, since
+    its ratings were already acknowledged; only then are they counted as dropped.
+    Ratings still queued when the process dies are lost; stop() flushes them on
+    a clean shutdown.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        flush_batch_size: int,
+        flush_interval: float,
+        max_retries: int = 3,
+        retry_backoff: float = 0.1,
+    ):
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._stats = FlushStats()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_size)
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, movie_id: int, score: int) -> None:
+        """
+        Queue a validated rating for the next flush.
+        Raises ServiceUnavailableException if the buffer is full.
+        """
+        try:
+            self._queue.put_nowait((movie_id, score))
+        except queue.Full:
+            self._stats.reject()
+            logger.warning(f"Rating buffer full, rejecting rating (movie_id={movie_id})")
+            raise ServiceUnavailableException(message="Too many pending ratings, retry later")
+
+    def start(self) -> None:
+        """Start the flush thread; call once per worker process, after forking."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="rating-buffer-flush", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Rating buffer started (batch_size={self.flush_batch_size}, "
+            f"interval_ms={self.flush_interval * 1000:.0f})"
+        )
+
+    def stop(self) -> None:
+        """Stop the flush thread and flush whatever is still queued."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("Rating buffer stopped")
+
+    def depth(self) -> int:
+        """Number of ratings waiting for a flush."""
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        """Return flush counters along with the current queue depth."""
+        return {**self._stats.as_dict(), "queue_depth": self.depth()}
+
+    # =========================================================================
+    # Helper methods
+    # =========================================================================
+
+    def _run(self) -> None:
+        while not self._stopping.is_set() or not self._queue.empty():
+            batch = self._next_batch()
+            if batch:
+                self._flush(batch)
+
+    def _next_batch(self) -> List[Tuple[int, int]]:
+        """Wait for the first item, then collect more until the batch is full or the interval ends."""
+        try:
+            batch = [self._queue.get(timeout=self.flush_interval)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.flush_batch_size:
+            # On shutdown take only what is already queued
+            remaining = 0 if self._stopping.is_set() else deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: List[Tuple[int, int]]) -> None:
+        """Write one batch in a single transaction, retrying it on failure, and update the caches."""
+        # Imported here: the rating services import this module for rating_buffer
+        from app.services.rating_service import BaseRatingService
+
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                with SessionLocal() as db:
+                    # Ratings of movies deleted since they were accepted are skipped by the INSERT
+                    rows, aggregates = RatingRepository(db).create_many(batch, skip_missing_movies=True)
+                break
+            except Exception as e:
+                if attempt >= self.max_retries:
+                    self._stats.record(len(batch), time.perf_counter() - started, failed=True, dropped=len(batch))
+                    logger.error(
+                        f"Failed to flush rating buffer after {attempt + 1} attempts, "
+                        f"dropping {len(batch)} ratings: {str(e)}",
+                        exc_info=True,
+                    )
+                    return
+
+                delay = self.retry_backoff * 2 ** attempt
+                attempt += 1
+                logger.warning(
+                    f"Failed to flush rating buffer (items={len(batch)}), retry {attempt}/{self.max_retries} "
+                    f"in {delay * 1000:.0f} ms: {str(e)}"
+                )
+                time.sleep(delay)
+
+        BaseRatingService._apply_batch_to_caches(aggregates)
+
+        dropped = len(batch) - len(rows)
+        seconds = time.perf_counter() - started
+        self._stats.record(len(batch), seconds, dropped=dropped)
+        if dropped:
+            logger.warning(f"Dropped {dropped} buffered ratings for deleted movies")
+        logger.info(f"Flushed rating buffer (items={len(batch)}, ms={seconds * 1000:.1f})")
+
+
+rating_buffer = RatingBuffer(
+    max_size=settings.RATINGS_BUFFER_MAX_SIZE,
+    flush_batch_size=settings.RATINGS_FLUSH_BATCH_SIZE,
+    flush_interval=settings.RATINGS_FLUSH_INTERVAL_MS / 1000,
+    max_retries=settings.RATINGS_FLUSH_RETRIES,
+    retry_backoff=settings.RATINGS_FLUSH_RETRY_BACKOFF_MS / 1000,
+)
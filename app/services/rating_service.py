@@ -1,13 +1,126 @@
 """Rating service for business logic."""
 
+import math
+from typing import Dict, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
 
+from app.cache import movie_detail_cache, movie_list_cache
 from app.repositories import MovieRepository, RatingRepository
 from app.exceptions import NotFoundException, ValidationException
 from app.logging_config import logger
+from app.services.rating_buffer import rating_buffer
 
 
-class RatingService:
+# Valid rating scores, lowest first
+SCORES = range(1, 11)
+
+# Percentiles reported by the rating stats endpoint
+STATS_PERCENTILES = (25, 50, 75, 90)
+
+
+class BaseRatingService:
+    """Validation and response building shared by the sync and async rating services."""
+
+    def _check_batch(self, items: List[dict], existing_ids: Set[int]) -> Tuple[List[int], List[Optional[dict]]]:
+        """
+        Validate batch items one by one.
+        Returns tuple of (accepted_indexes, results) where results holds the error
+        entry of each rejected item and None for the accepted ones.
+        """
+        accepted = []
+        results = [None] * len(items)
+
+        for index, item in enumerate(items):
+            if not 1 <= item["score"] <= 10:
+                results[index] = self._batch_error(index, 422, "Score must be an integer between 1 and 10")
+            elif item["movie_id"] not in existing_ids:
+                results[index] = self._batch_error(index, 404, "Movie not found")
+            else:
+                accepted.append(index)
+
+        return accepted, results
+
+    @staticmethod
+    def _batch_error(index: int, code: int, message: str) -> dict:
+        """Build the result entry of a rejected batch item."""
+        return {
+            "index": index,
+            "status": "failure",
+            "error": {
+                "code": code,
+                "message": message,
+            },
+        }
+
+    @staticmethod
+    def _to_rating_response(rating) -> dict:
+        """Transform a rating (model or returned row) to response format."""
+        return {
+            "rating_id": rating.id,
+            "movie_id": rating.movie_id,
+            "score": rating.score,
+            "created_at": rating.rated_at,
+        }
+
+    @staticmethod
+    def _to_rating_stats(movie_id: int, score_counts: Dict[int, int]) -> dict:
+        """
+        Build distribution statistics from a score histogram. Work is bounded by the
+        ten scores, however many ratings there are. Percentiles interpolate linearly
+        between neighbouring ratings, so the median of an even count can fall between scores.
+        """
+        histogram = [{"score": score, "count": score_counts.get(score, 0)} for score in SCORES]
+        total = sum(bar["count"] for bar in histogram)
+        if not total:
+            return {
+                "movie_id": movie_id,
+                "ratings_count": 0,
+                "histogram": histogram,
+                "average_rating": None,
+                "median": None,
+                "percentiles": {f"p{p}": None for p in STATS_PERCENTILES},
+                "std_dev": None,
+            }
+
+        mean = sum(bar["score"] * bar["count"] for bar in histogram) / total
+        variance = sum(bar["count"] * (bar["score"] - mean) ** 2 for bar in histogram) / total
+
+        def nth_score(position: int) -> int:
+            """Return the score of the rating at a 0-based position in ascending order."""
+            seen = 0
+            for bar in histogram:
+                seen += bar["count"]
+                if position < seen:
+                    return bar["score"]
+            return histogram[-1]["score"]
+
+        def percentile(p: float) -> float:
+            position = (total - 1) * p / 100
+            lower = math.floor(position)
+            low, high = nth_score(lower), nth_score(min(lower + 1, total - 1))
+            return round(low + (high - low) * (position - lower), 2)
+
+        percentiles = {f"p{p}": percentile(p) for p in STATS_PERCENTILES}
+        return {
+            "movie_id": movie_id,
+            "ratings_count": total,
+            "histogram": histogram,
+            "average_rating": round(mean, 1),
+            "median": percentile(50),
+            "percentiles": percentiles,
+            "std_dev": round(math.sqrt(variance), 2),
+        }
+
+    @staticmethod
+    def _apply_batch_to_caches(aggregates: dict) -> None:
+        """Patch cached movie details with new aggregates and mark cached lists as lagging."""
+        for movie_id, (ratings_count, ratings_sum) in aggregates.items():
+            movie_detail_cache.apply_rating_aggregates(movie_id, ratings_count, ratings_sum)
+        if aggregates:
+            movie_list_cache.bump_ratings()
+
+
+class RatingService(BaseRatingService):
     """Service for rating-related business logic."""
 
     def __init__(self, db: Session):
@@ -38,7 +151,11 @@ class RatingService:
 
         try:
             # Create rating
-            rating = self.rating_repo.create(movie_id=movie_id, score=score)
+            rating, (ratings_count, ratings_sum) = self.rating_repo.create(
+                movie_id=movie_id, score=score
+            )
+            movie_detail_cache.apply_rating_aggregates(movie_id, ratings_count, ratings_sum)
+            movie_list_cache.bump_ratings()
 
             # Log success
             logger.info(
@@ -46,16 +163,93 @@ class RatingService:
                 f"score={score}, rating_id={rating.id})"
             )
 
-            return {
-                "rating_id": rating.id,
-                "movie_id": rating.movie_id,
-                "score": rating.score,
-                "created_at": rating.rated_at,
-            }
+            return self._to_rating_response(rating)
 
         except Exception as e:
             logger.error(
                 f"Failed to save rating (movie_id={movie_id}, score={score}): {str(e)}",
                 exc_info=True
             )
-            raise
\ No newline at end of file
+            raise
+
+    def get_rating_stats(self, movie_id: int) -> dict:
+        """
+        Get a movie's score histogram, median, percentiles and standard deviation,
+        computed from its stored histogram without reading movie_ratings.
+        Raises NotFoundException if movie not found.
+        """
+        logger.info(f"Fetching rating stats (movie_id={movie_id})")
+
+        score_counts = self.rating_repo.get_score_counts(movie_id)
+        # An empty histogram is either an unrated movie or a missing one
+        if not score_counts and not self.movie_repo.exists(movie_id):
+            logger.warning(f"Movie not found for rating stats (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+
+        return self._to_rating_stats(movie_id, score_counts)
+
+    def enqueue_rating(self, movie_id: int, score: int) -> dict:
+        """
+        Accept a rating for write-behind: validate it and queue it for the next batched flush.
+        The rating becomes visible once flushed, so no id or timestamp is returned.
+        Raises NotFoundException if movie not found.
+        Raises ValidationException if score is invalid.
+        Raises ServiceUnavailableException if the buffer is full.
+        """
+        logger.info(f"Queueing rating (movie_id={movie_id}, score={score})")
+
+        if not 1 <= score <= 10:
+            logger.warning(
+                f"Invalid rating value (movie_id={movie_id}, score={score})"
+            )
+            raise ValidationException(message="Score must be an integer between 1 and 10")
+
+        if not self.movie_repo.exists(movie_id):
+            logger.warning(f"Movie not found for rating (movie_id={movie_id})")
+            raise NotFoundException(message="Movie not found")
+
+        rating_buffer.submit(movie_id, score)
+
+        return {
+            "movie_id": movie_id,
+            "score": score,
+            "status": "accepted",
+        }
+
+    def create_ratings_batch(self, items: List[dict]) -> dict:
+        """
+        Create many ratings in one transaction.
+        Scores and movie existence are checked per item; invalid items are reported
+        and skipped while the valid ones are inserted together.
+        Returns dict with created/failed counts and one result per item, in input order.
+        """
+        logger.info(f"Rating movies in batch (items={len(items)})")
+
+        existing_ids = self.movie_repo.existing_ids(item["movie_id"] for item in items)
+        accepted, results = self._check_batch(items, existing_ids)
+
+        if accepted:
+            try:
+                rows, aggregates = self.rating_repo.create_many(
+                    [(items[index]["movie_id"], items[index]["score"]) for index in accepted]
+                )
+            except Exception as e:
+                logger.error(f"Failed to save rating batch (items={len(items)}): {str(e)}", exc_info=True)
+                raise
+
+            for index, row in zip(accepted, rows):
+                results[index] = {
+                    "index": index,
+                    "status": "success",
+                    "data": self._to_rating_response(row),
+                }
+            self._apply_batch_to_caches(aggregates)
+
+        failed = len(items) - len(accepted)
+        logger.info(f"Rating batch saved (created={len(accepted)}, failed={failed})")
+
+        return {
+            "created": len(accepted),
+            "failed": failed,
+            "results": results,
+        }
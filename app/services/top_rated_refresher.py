@@ -0,0 +1,109 @@
+"""Background refresher that keeps the precomputed top-rated ranking current."""
+
+import threading
+import time
+from typing import Optional
+
+from app.cache import movie_list_cache
+from app.config import settings
+from app.db.database import SessionLocal
+from app.logging_config import logger
+from app.repositories import TopRatedRepository
+
+
+class TopRatedRefresher:
+    """
+    Rebuilds the top-rated ranking every interval seconds in a background thread.
+
+    Every worker runs one. A rebuild takes a transaction-level advisory lock and is
+    skipped while the ranking is younger than half the interval, so the workers
+    together rebuild it about once per interval. After a rebuild the worker bumps
+    the list cache's ratings generation, so its cached /movies/top pages and ETags
+    move on; other workers' pages expire with LIST_CACHE_TTL. Served rankings
+    therefore lag rating writes by at most interval seconds plus the duration of
+    one rebuild plus LIST_CACHE_TTL.
+    """
+
+    def __init__(self, interval: float, prior_weight: float, min_ratings: int):
+        self.interval = interval
+        self.prior_weight = prior_weight
+        self.min_ratings = min_ratings
+        self.refreshes = 0
+        self.skipped = 0
+        self.failed = 0
+        self.last_refresh_ms: Optional[float] = None
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the refresh thread; the first rebuild runs right away."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="top-rated-refresh", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Top-rated refresher started (interval={self.interval}s, "
+            f"prior_weight={self.prior_weight}, min_ratings={self.min_ratings})"
+        )
+
+    def stop(self) -> None:
+        """Stop the refresh thread, waiting for a running rebuild to finish."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+        logger.info("Top-rated refresher stopped")
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Rebuild the ranking unless another worker is rebuilding it or, without force,
+        it is younger than half the interval. Returns True if it was rebuilt.
+        """
+        started = time.perf_counter()
+        max_age = 0 if force else self.interval / 2
+
+        try:
+            with SessionLocal() as db:
+                rebuilt = TopRatedRepository(db).refresh(self.prior_weight, self.min_ratings, max_age)
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Failed to refresh top-rated ranking: {str(e)}", exc_info=True)
+            return False
+
+        if not rebuilt:
+            self.skipped += 1
+            return False
+
+        movie_list_cache.bump_ratings()
+        self.refreshes += 1
+        self.last_refresh_ms = round((time.perf_counter() - started) * 1000, 2)
+        logger.info(f"Refreshed top-rated ranking (ms={self.last_refresh_ms})")
+        return True
+
+    def stats(self) -> dict:
+        """Return rebuild counters and the duration of the last rebuild."""
+        return {
+            "interval_seconds": self.interval,
+            "refreshes": self.refreshes,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "last_refresh_ms": self.last_refresh_ms,
+        }
+
+    # =========================================================================
+    # Helper methods
+    # =========================================================================
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.refresh()
+            self._stopping.wait(self.interval)
+
+
+top_rated_refresher = TopRatedRefresher(
+    interval=settings.TOP_RATED_REFRESH_INTERVAL,
+    prior_weight=settings.TOP_RATED_PRIOR_WEIGHT,
+    min_ratings=settings.TOP_RATED_MIN_RATINGS,
+)
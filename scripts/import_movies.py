@@ -0,0 +1,55 @@
+"""
+Bulk import movies from an NDJSON file (one movie per line).
+
+Usage:
+    python -m scripts.import_movies movies.ndjson [--batch-size N]
+    cat movies.ndjson | python -m scripts.import_movies -
+"""
+
+import argparse
+import sys
+from itertools import islice
+
+from app.config import settings
+from app.db.database import SessionLocal
+from app.services import MovieImportService
+
+
+def import_file(stream, batch_size: int) -> dict:
+    """Feed the stream to the import service in batch_size line chunks."""
+    with SessionLocal() as db:
+        service = MovieImportService(db, batch_size=batch_size)
+        lines = enumerate(stream, start=1)
+        while chunk := list(islice(lines, batch_size)):
+            service.feed(chunk)
+            print(f"   ... {service.processed} lines read, {service.imported} imported", file=sys.stderr)
+        return service.finish()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import movies from an NDJSON file.")
+    parser.add_argument("path", help="NDJSON file to import, or - for stdin")
+    parser.add_argument("--batch-size", type=int, default=settings.IMPORT_BATCH_SIZE, help="Movies per INSERT batch")
+    args = parser.parse_args()
+
+    if args.path == "-":
+        result = import_file(sys.stdin, args.batch_size)
+    else:
+        with open(args.path, encoding="utf-8") as stream:
+            result = import_file(stream, args.batch_size)
+
+    print("=" * 50)
+    print(f"   Processed: {result['processed']}")
+    print(f"   Imported:  {result['imported']}")
+    print(f"   Failed:    {result['failed']}")
+    for error in result["errors"]:
+        print(f"   ❌ line {error['line']}: {error['message']}")
+    if result["errors_truncated"]:
+        print("   ... more errors not shown")
+    print("=" * 50)
+
+    return 0 if result["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Checks that GET /movies pages cost the same statements at every page size, and times them.
+
+Loads the first page of the catalog through MovieService at page sizes 10, 50 and
+100, counting the SQL statements of each load and timing repeated loads. The page
+IDs are selected first and relations are then batch-loaded, so the count must not
+grow with the page size. The list cache is bypassed, and the director cache and the
+genre dictionary are warmed first, so only the page queries count.
+
+Usage:
+    python -m scripts.list_query_check [--rounds 20]
+"""
+
+import argparse
+import sys
+import time
+
+from app.cache import movie_list_cache
+from app.db.database import SessionLocal, engine
+from app.instrumentation import QueryBudget, watch_statements
+from app.services import MovieService
+
+PAGE_SIZES = (10, 50, 100)
+
+# COUNT, page IDs, movies by ID, genres IN (COMMIT is not counted)
+BUDGET = 4
+
+
+def verify_list_queries(rounds: int) -> bool:
+    passed = True
+    watch_statements(engine)
+    # Every load must reach the database
+    movie_list_cache.enabled = False
+
+    try:
+        with SessionLocal() as db:
+            service = MovieService(db)
+
+            print("=" * 50)
+            print("List Query Verification")
+            print("=" * 50)
+
+            for page_size in PAGE_SIZES:
+                # Warm the director cache for this page
+                service.get_movies(page=1, page_size=page_size, count_mode="exact")
+                db.rollback()
+
+                with QueryBudget(BUDGET, name=f"page_size={page_size}", strict=False) as budget:
+                    movies, _, _, _ = service.get_movies(page=1, page_size=page_size, count_mode="exact")
+                db.rollback()
+
+                timings = []
+                for _ in range(rounds):
+                    started = time.perf_counter()
+                    service.get_movies(page=1, page_size=page_size, count_mode="exact")
+                    timings.append((time.perf_counter() - started) * 1000)
+                    db.rollback()
+
+                passed &= report(budget, len(movies), sorted(timings))
+
+            print("=" * 50)
+
+    except Exception as e:
+        print(f"❌ Database connection or query failed: {e}")
+        return False
+
+    return passed
+
+
+def report(budget: QueryBudget, items: int, timings: list) -> bool:
+    """Print the statement count of a page load against the budget, with its latency."""
+    p50 = timings[len(timings) // 2]
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    latency = f"p50 {p50:.1f} ms, p95 {p95:.1f} ms over {len(timings)} loads"
+
+    if not budget.violations():
+        print(f"   ✅ {budget.name}: {items} items, {budget.count} statements (budget {budget.limit}), {latency}")
+        return True
+
+    print(f"   ❌ {budget.name}: {items} items, {budget.count} statements (budget {budget.limit}), {latency}")
+    for statement in budget.statements:
+        print(f"      {' '.join(statement.split())[:100]}")
+    return False
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify statement counts and latency of movie list pages.")
+    parser.add_argument("--rounds", type=int, default=20, help="Timed loads per page size")
+    args = parser.parse_args()
+    sys.exit(0 if verify_list_queries(max(1, args.rounds)) else 1)
@@ -0,0 +1,90 @@
+"""
+Checks that movie create, update and delete stay within their statement budgets.
+
+Creates a throwaway movie through MovieService, counting the SQL statements each
+operation sends, then deletes it. Caches are warmed first so only the writes count.
+
+Usage:
+    python -m scripts.query_count_check
+"""
+
+import sys
+
+from sqlalchemy import text
+
+from app.cache import genre_dictionary
+from app.db.database import SessionLocal, engine
+from app.instrumentation import QueryBudget, watch_statements
+from app.repositories import DirectorRepository
+from app.services import MovieService
+
+# Maximum statements per operation (COMMIT is not counted)
+BUDGETS = {
+    # INSERT movie RETURNING, INSERT genre links
+    "create": 2,
+    # SELECT movie, UPDATE movie RETURNING, DELETE + INSERT genre links
+    "update": 4,
+    # DELETE movie RETURNING
+    "delete": 1,
+}
+
+
+def verify_query_counts() -> bool:
+    passed = True
+    watch_statements(engine)
+
+    try:
+        with SessionLocal() as db:
+            director_id = db.execute(text("SELECT id FROM directors ORDER BY id LIMIT 1")).scalar_one()
+            genre_ids = [genre.id for genre in genre_dictionary.all_genres()[:3]]
+            DirectorRepository(db).get_record(director_id)
+            db.rollback()
+
+            service = MovieService(db)
+
+            print("=" * 50)
+            print("Query Count Verification")
+            print("=" * 50)
+
+            with QueryBudget(BUDGETS["create"], name="create", repeat_limit=0, strict=False) as budget:
+                movie = service.create_movie({
+                    "title": "Query Count Check",
+                    "director_id": director_id,
+                    "genres": genre_ids[:2],
+                })
+            passed &= report(budget)
+
+            with QueryBudget(BUDGETS["update"], name="update", repeat_limit=0, strict=False) as budget:
+                service.update_movie(movie["id"], {
+                    "title": "Query Count Check (updated)",
+                    "genres": genre_ids[1:],
+                })
+            passed &= report(budget)
+
+            with QueryBudget(BUDGETS["delete"], name="delete", repeat_limit=0, strict=False) as budget:
+                service.delete_movie(movie["id"])
+            passed &= report(budget)
+
+            print("=" * 50)
+
+    except Exception as e:
+        print(f"❌ Database connection or query failed: {e}")
+        return False
+
+    return passed
+
+
+def report(budget: QueryBudget) -> bool:
+    """Print the statement count of an operation against its budget."""
+    if not budget.violations():
+        print(f"   ✅ {budget.name}: {budget.count} statements (budget {budget.limit})")
+        return True
+
+    print(f"   ❌ {budget.name}: {budget.count} statements (budget {budget.limit})")
+    for statement in budget.statements:
+        print(f"      {' '.join(statement.split())[:100]}")
+    return False
+
+
+if __name__ == "__main__":
+    sys.exit(0 if verify_query_counts() else 1)
@@ -0,0 +1,23 @@
+"""
+Rebuild the top-rated ranking once, e.g. from cron when TOP_RATED_REFRESH_ENABLED is off.
+
+Usage:
+    python -m scripts.refresh_top_rated
+"""
+
+import sys
+
+from app.services.top_rated_refresher import top_rated_refresher
+
+
+def main() -> int:
+    if top_rated_refresher.refresh(force=True):
+        print(f"✅ Top-rated ranking rebuilt in {top_rated_refresher.last_refresh_ms} ms")
+        return 0
+
+    print("❌ Ranking not rebuilt (another worker holds the refresh lock, or the rebuild failed)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
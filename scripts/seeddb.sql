@@ -187,4 +187,22 @@ SELECT
 FROM movies m,
 LATERAL generate_series(1, (1 + floor(random() * 40))::INT) AS s(i);
 
+------------------------------- 11. Recompute denormalized rating aggregates -----------------------------
+UPDATE movies AS m
+SET ratings_count = agg.ratings_count,
+    ratings_sum = agg.ratings_sum
+FROM (
+    SELECT movie_id, COUNT(*) AS ratings_count, SUM(score) AS ratings_sum
+    FROM movie_ratings
+    GROUP BY movie_id
+) AS agg
+WHERE agg.movie_id = m.id;
+
+------------------------------- 12. Recompute per-movie score histograms -----------------------------
+-- Rows for the deleted movies went with them (ON DELETE CASCADE)
+INSERT INTO movie_score_counts (movie_id, score, count)
+SELECT movie_id, score, COUNT(*)
+FROM movie_ratings
+GROUP BY movie_id, score;
+
 COMMIT;
\ No newline at end of file